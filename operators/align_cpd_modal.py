@@ -31,6 +31,24 @@ class SUPERTOOLS_OT_cpd_align_modal(Operator):
         subtype='TIME'
     )
 
+    voxel_size: bpy.props.FloatProperty(
+        name="Voxel Size",
+        description="When a mesh has more than Max Points vertices, merge them on a grid of this size before sampling (0 = random sampling only)",
+        default=0.0,
+        min=0.0,
+        soft_max=1.0,
+        subtype='DISTANCE',
+    )
+
+    tolerance: bpy.props.FloatProperty(
+        name="Tolerance",
+        description="Stop once the relative change of sigma² per step falls below this for every source (0 = run until ESC)",
+        default=1e-5,
+        min=0.0,
+        max=0.1,
+        precision=6,
+    )
+
     w: bpy.props.FloatProperty(
         name="Outlier Weight",
         description="CPD uniform outlier weight (0 = none)",
@@ -40,6 +58,12 @@ class SUPERTOOLS_OT_cpd_align_modal(Operator):
         subtype='FACTOR',
     )
 
+    use_gpu: bpy.props.BoolProperty(
+        name="Use GPU",
+        description="Run the CPD E-step on the GPU when CuPy is installed and the point sets are large",
+        default=True,
+    )
+
     def invoke(self, context, event):
         sel = [o for o in context.selected_objects if o.type == 'MESH']
         if len(sel) < 2:
@@ -70,7 +94,10 @@ class SUPERTOOLS_OT_cpd_align_modal(Operator):
                 return {'CANCELLED'}
 
         # Sample target once (fixed across iterations)
-        X = sample_object_vertices_world(self.target, max_points=self.max_points, vgroup_name=self.vg_name)
+        X = sample_object_vertices_world(
+            self.target, max_points=self.max_points, vgroup_name=self.vg_name,
+            voxel_size=self.voxel_size,
+        )
         if X.shape[0] == 0:
             self.report({'ERROR'}, "Target has no usable vertices for CPD (check vertex group selection)")
             return {'CANCELLED'}
@@ -78,6 +105,7 @@ class SUPERTOOLS_OT_cpd_align_modal(Operator):
 
         # Per-source state (sigma2)
         self._sigma2 = {obj.name: None for obj in self.sources}
+        self._converged = set()
         self.iteration = 0
         self.allow_scale = bool(getattr(context.scene, "superalign_icp_allow_scale", False))
 
@@ -102,9 +130,15 @@ class SUPERTOOLS_OT_cpd_align_modal(Operator):
             total_pts = 0
             total_outliers = 0
             for obj in self.sources:
+                if obj.name in self._converged:
+                    continue
                 # Sample moving source from (optional) vertex group
-                Y = sample_object_vertices_world(obj, max_points=self.max_points, vgroup_name=self.vg_name)
+                Y = sample_object_vertices_world(
+                    obj, max_points=self.max_points, vgroup_name=self.vg_name,
+                    voxel_size=self.voxel_size,
+                )
                 if Y.shape[0] == 0:
+                    self._converged.add(obj.name)  # nothing to align
                     continue
                 sig = self._sigma2.get(obj.name, None)
                 R, s, t, sigma2_new, Np, outliers = cpd_rigid_step(
@@ -113,6 +147,7 @@ class SUPERTOOLS_OT_cpd_align_modal(Operator):
                     sigma2=sig,
                     w=float(self.w),
                     allow_scale=bool(getattr(context.scene, "superalign_icp_allow_scale", self.allow_scale)),
+                    use_gpu=bool(self.use_gpu),
                 )
                 # Apply similarity or rigid based on s
                 if s != 1.0:
@@ -122,6 +157,9 @@ class SUPERTOOLS_OT_cpd_align_modal(Operator):
                     from ..utils.align_icp import apply_rigid_transform_to_object
                     apply_rigid_transform_to_object(obj, R, t)
                 self._sigma2[obj.name] = sigma2_new
+                # Converged once sigma2 stops shrinking (reuses the value the step already computed)
+                if sig is not None and self.tolerance > 0.0 and abs(sig - sigma2_new) < self.tolerance * sig:
+                    self._converged.add(obj.name)
                 total_pts += int(Np)
                 total_outliers += int(outliers)
 
@@ -129,6 +167,8 @@ class SUPERTOOLS_OT_cpd_align_modal(Operator):
             if self._area:
                 self._area.header_text_set(f"CPD: iter={self.iteration} | pts={total_pts} | outliers={total_outliers}")
                 self._area.tag_redraw()
+            if len(self._converged) == len(self.sources):
+                return self._finish(context)
             return {'RUNNING_MODAL'}
 
         return {'PASS_THROUGH'}
@@ -141,7 +181,8 @@ class SUPERTOOLS_OT_cpd_align_modal(Operator):
         if self._area:
             self._area.header_text_set(None)
             self._area.tag_redraw()
-        msg = f"CPD stopped after {self.iteration} iteration(s)."
+        state = "converged" if len(self._converged) == len(self.sources) else "stopped"
+        msg = f"CPD {state} after {self.iteration} iteration(s)."
         self.report({'INFO'}, msg)
         return {'CANCELLED' if cancelled else 'FINISHED'}
 
@@ -5,13 +5,13 @@ from mathutils import Matrix
 
 from ..utils.align_icp import (
     sample_object_vertices_world,
-    build_kdtree,
+    build_target_index,
     nearest_neighbors,
     kabsch_rigid_transform,
-    apply_rigid_transform_to_object,
     procrustes_similarity_transform,
-    apply_similarity_transform_to_object,
+    compose_rigid_np,
 )
+from ..utils.align_accel import AndersonAccelerator, matrix_to_params, params_to_matrix
 
 
 class SUPERTOOLS_OT_icp_align_modal(Operator):
@@ -37,6 +37,24 @@ class SUPERTOOLS_OT_icp_align_modal(Operator):
         subtype='TIME'
     )
 
+    voxel_size: bpy.props.FloatProperty(
+        name="Voxel Size",
+        description="When a mesh has more than Max Points vertices, merge them on a grid of this size before sampling (0 = random sampling only)",
+        default=0.0,
+        min=0.0,
+        soft_max=1.0,
+        subtype='DISTANCE',
+    )
+
+    tolerance: bpy.props.FloatProperty(
+        name="Tolerance",
+        description="Stop once the relative change of the mean squared match distance per step falls below this for every source (0 = run until ESC)",
+        default=1e-5,
+        min=0.0,
+        max=0.1,
+        precision=6,
+    )
+
     def invoke(self, context, event):
         sel = [o for o in context.selected_objects if o.type == 'MESH']
         if len(sel) < 2:
@@ -57,13 +75,17 @@ class SUPERTOOLS_OT_icp_align_modal(Operator):
             self.report({'WARNING'}, f"Vertex group '{vg_name}' not found on target; using all vertices")
             vg_name = None
 
-        # Pre-sample target points and build KDTree (optionally restricted by vertex group)
+        # Pre-sample target points and build the KD-tree index once for the whole run
+        # (optionally restricted by vertex group); the target never moves during ICP
         self.vg_name = vg_name  # persist validated group name for consistent use in modal steps
-        tgt_pts = sample_object_vertices_world(self.target, max_points=self.max_points, vgroup_name=self.vg_name)
+        tgt_pts = sample_object_vertices_world(
+            self.target, max_points=self.max_points, vgroup_name=self.vg_name,
+            voxel_size=self.voxel_size,
+        )
         if tgt_pts.shape[0] == 0:
             self.report({'ERROR'}, "Target has no usable vertices for ICP (check vertex group selection)")
             return {'CANCELLED'}
-        self.kd = build_kdtree(tgt_pts)
+        self.target_index = build_target_index(tgt_pts)
         self.iteration = 0
         # Cache allow-scale flag from scene at start (read from scene to allow live toggle if desired)
         self.allow_scale = bool(getattr(context.scene, "superalign_icp_allow_scale", False))
@@ -78,6 +100,15 @@ class SUPERTOOLS_OT_icp_align_modal(Operator):
                 self.report({'ERROR'}, f"No source objects have vertex group '{vg_name}'")
                 return {'CANCELLED'}
 
+        # Anderson acceleration on each source's world-space delta from its start pose
+        self._prev_mean_d2 = {}
+        self._converged = set()
+        self._accel = {obj.name: AndersonAccelerator(m=5) for obj in self.sources}
+        self._start = {}
+        for obj in self.sources:
+            start = np.array(obj.matrix_world, dtype=np.float64)
+            self._start[obj.name] = (start, np.linalg.pinv(start))
+
         wm = context.window_manager
         self._timer = wm.event_timer_add(self.update_rate, window=context.window)
         wm.modal_handler_add(self)
@@ -98,28 +129,51 @@ class SUPERTOOLS_OT_icp_align_modal(Operator):
             total_pts = 0
             total_outliers = 0
             for obj in self.sources:
-                src_pts = sample_object_vertices_world(obj, max_points=self.max_points, vgroup_name=self.vg_name)
+                if obj.name in self._converged:
+                    continue
+                src_pts = sample_object_vertices_world(
+                    obj, max_points=self.max_points, vgroup_name=self.vg_name,
+                    voxel_size=self.voxel_size,
+                )
                 if src_pts.shape[0] == 0:
+                    self._converged.add(obj.name)  # nothing to align
                     continue
-                matches, dists = nearest_neighbors(src_pts, self.kd)
-                # Reject outliers (top 10% distances)
-                if matches.shape[0] >= 10:
-                    thr = np.quantile(dists, 0.9)
-                    mask = dists <= thr
-                    A = src_pts[mask]
-                    B = matches[mask]
-                    total_pts += int(A.shape[0])
-                    total_outliers += int((~mask).sum())
+                matches, dists = nearest_neighbors(src_pts, self.target_index)
+                # Converged once the mean squared match distance stops changing
+                mean_d2 = float(np.dot(dists, dists)) / dists.shape[0]
+                prev = self._prev_mean_d2.get(obj.name)
+                self._prev_mean_d2[obj.name] = mean_d2
+                if prev is not None and self.tolerance > 0.0 and abs(prev - mean_d2) < self.tolerance * max(prev, 1e-9):
+                    self._converged.add(obj.name)
+                    continue
+                # Trimmed least squares: keep the best (1 - trim) matches, O(N) via argpartition
+                trim = float(getattr(context.scene, "superalign_icp_trim_ratio", 0.1))
+                k = int((1.0 - trim) * dists.shape[0])
+                if matches.shape[0] >= 10 and 3 <= k < dists.shape[0]:
+                    keep = np.argpartition(dists, k - 1)[:k]
+                    A = src_pts[keep]
+                    B = matches[keep]
+                    total_pts += k
+                    total_outliers += int(dists.shape[0] - k)
                 else:
                     A = src_pts
                     B = matches
                     total_pts += int(A.shape[0])
-                if bool(getattr(context.scene, "superalign_icp_allow_scale", self.allow_scale)):
+                allow_scale = bool(getattr(context.scene, "superalign_icp_allow_scale", self.allow_scale))
+                if allow_scale:
                     R, s, t = procrustes_similarity_transform(A, B)
-                    apply_similarity_transform_to_object(obj, R, s, t)
+                    T = compose_rigid_np(R, t, s)
                 else:
                     R, t = kabsch_rigid_transform(A, B)
-                    apply_rigid_transform_to_object(obj, R, t)
+                    T = compose_rigid_np(R, t)
+                # Mix the plain ICP step with recent iterates (Anderson acceleration), composing
+                # in NumPy so matrix_world is written once per tick
+                start, start_inv = self._start[obj.name]
+                delta = np.array(obj.matrix_world, dtype=np.float64) @ start_inv
+                x = matrix_to_params(delta)
+                g = matrix_to_params(T @ delta)
+                D = params_to_matrix(self._accel[obj.name].step(x, g), allow_scale)
+                obj.matrix_world = Matrix((D @ start).tolist())
 
             self.iteration += 1
             # Update header status line
@@ -127,6 +181,8 @@ class SUPERTOOLS_OT_icp_align_modal(Operator):
             if area:
                 area.header_text_set(f"ICP: iter={self.iteration} | pts={total_pts} | outliers={total_outliers}")
                 area.tag_redraw()
+            if len(self._converged) == len(self.sources):
+                return self._finish(context)
             return {'RUNNING_MODAL'}
 
         return {'PASS_THROUGH'}
@@ -136,7 +192,8 @@ class SUPERTOOLS_OT_icp_align_modal(Operator):
         if hasattr(self, '_timer') and self._timer is not None:
             wm.event_timer_remove(self._timer)
             self._timer = None
-        msg = f"ICP stopped after {self.iteration} iteration(s)."
+        state = "converged" if len(self._converged) == len(self.sources) else "stopped"
+        msg = f"ICP {state} after {self.iteration} iteration(s)."
         level = {'INFO'} if not cancelled else {'INFO'}
         self.report(level, msg)
         # Clear header status line
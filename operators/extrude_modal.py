@@ -1072,7 +1072,7 @@ class MESH_OT_super_extrude_modal(bpy.types.Operator):
                 selected_faces,
                 obj.matrix_world,
             )
-            original_border_edges = bmesh_utils.get_border_edges(self.original_faces)
+            original_border_edges = bmesh_utils.get_border_edges(self.original_faces, self.bm)
             border_verts = {vert for edge in original_border_edges for vert in edge.verts}
             if border_verts:
                 pivot_point_world = mathutils.Vector((0.0, 0.0, 0.0))
@@ -1106,6 +1106,7 @@ class MESH_OT_super_extrude_modal(bpy.types.Operator):
             self.top_faces = bmesh_utils.identify_top_faces(
                 extruded_faces,
                 original_border_edges,
+                self.bm,
             )
 
             self.top_edges = self._get_top_boundary_edges()
@@ -42,14 +42,15 @@ def _find_closest_custom_profile_point(mouse_pos, screen_points, threshold=15.0)
         return -1
     
     closest_idx = -1
-    closest_dist = float('inf')
+    closest_dist_sq = float('inf')
+    threshold_sq = threshold * threshold
     
     for i, pt in enumerate(screen_points):
         dx = mouse_pos[0] - pt[0]
         dy = mouse_pos[1] - pt[1]
-        dist = math.sqrt(dx * dx + dy * dy)
-        if dist <= threshold and dist < closest_dist:
-            closest_dist = dist
+        dist_sq = dx * dx + dy * dy
+        if dist_sq <= threshold_sq and dist_sq < closest_dist_sq:
+            closest_dist_sq = dist_sq
             closest_idx = i
     
     return closest_idx
@@ -61,7 +62,8 @@ def _find_closest_custom_profile_edge(mouse_pos, screen_points, threshold=10.0):
         return -1, None
     
     closest_edge = -1
-    closest_dist = float('inf')
+    closest_dist_sq = float('inf')
+    threshold_sq = threshold * threshold
     closest_point = None
     
     n = len(screen_points)
@@ -84,10 +86,10 @@ def _find_closest_custom_profile_edge(mouse_pos, screen_points, threshold=10.0):
         
         dx = mouse_pos[0] - cx
         dy = mouse_pos[1] - cy
-        dist = math.sqrt(dx * dx + dy * dy)
+        dist_sq = dx * dx + dy * dy
         
-        if dist <= threshold and dist < closest_dist:
-            closest_dist = dist
+        if dist_sq <= threshold_sq and dist_sq < closest_dist_sq:
+            closest_dist_sq = dist_sq
             closest_edge = i
             closest_point = (cx, cy)
     
@@ -284,7 +286,7 @@ def _extract_right_side_with_crossings(screen_points, center, angle):
                 should_add = True
                 if result:
                     last_pt = result[-1]
-                    dist = math.sqrt((crossing[0] - last_pt[0])**2 + (crossing[1] - last_pt[1])**2)
+                    dist = math.hypot(crossing[0] - last_pt[0], crossing[1] - last_pt[1])
                     if dist < 10:
                         should_add = False
                 if should_add:
@@ -295,7 +297,7 @@ def _extract_right_side_with_crossings(screen_points, center, angle):
         cleaned = [result[0]]
         for pt in result[1:]:
             last = cleaned[-1]
-            dist = math.sqrt((pt[0] - last[0])**2 + (pt[1] - last[1])**2)
+            dist = math.hypot(pt[0] - last[0], pt[1] - last[1])
             if dist >= 5:
                 cleaned.append(pt)
         result = cleaned
@@ -367,7 +369,7 @@ def _find_mirror_edge(screen_points, edge_idx, center, angle):
         ep1 = screen_points[i]
         ep2 = screen_points[(i + 1) % len(screen_points)]
         edge_mid = ((ep1[0] + ep2[0]) / 2, (ep1[1] + ep2[1]) / 2)
-        dist = math.sqrt((edge_mid[0] - mirrored_mid[0])**2 + (edge_mid[1] - mirrored_mid[1])**2)
+        dist = math.hypot(edge_mid[0] - mirrored_mid[0], edge_mid[1] - mirrored_mid[1])
         if dist < best_dist:
             best_dist = dist
             best_edge = i
@@ -387,7 +389,7 @@ def _normalize_screen_points_to_profile(screen_points):
     
     max_dist = 0.0
     for p in centered_points:
-        dist = math.sqrt(p[0]**2 + p[1]**2)
+        dist = math.hypot(p[0], p[1])
         if dist > max_dist:
             max_dist = dist
     
@@ -1883,6 +1885,7 @@ def switch_target_flex(operator, context, event):
             for point_data in curve_data["curve_points"]:
                 point = Vector((point_data["x"], point_data["y"], point_data["z"]))
                 state.points_3d.append(point)
+        state.invalidate_curve_xyz()
 
         # Load radii
         state.point_radii_3d = curve_data.get("radii", [])
@@ -1926,6 +1929,7 @@ def switch_target_flex(operator, context, event):
             matrix_world_inv = flex_obj.matrix_world.inverted_safe()
             for i, point in enumerate(state.points_3d):
                 state.points_3d[i] = matrix_world_inv @ point
+            state.invalidate_curve_xyz()
 
         state.object_matrix_world = flex_obj.matrix_world.copy()
         
@@ -76,13 +76,13 @@ def handle_left_mouse(operator, context, event):
                     if screen_radius > 0.0:
                         dx = mouse_pos[0] - point_2d[0]
                         dy = mouse_pos[1] - point_2d[1]
-                        d = math.sqrt(dx*dx + dy*dy)
-                        if d <= screen_radius:
-                            hit_type = 'point' if d <= 0.5 * screen_radius else 'radius'
+                        d_sq = dx*dx + dy*dy
+                        if d_sq <= screen_radius * screen_radius:
+                            hit_type = 'point' if d_sq <= 0.25 * screen_radius * screen_radius else 'radius'
                             closest_i = i
             else:
                 # Scan all points
-                closest_d = float('inf')
+                closest_d_sq = float('inf')
                 for i, point_3d in enumerate(state.points_3d):
                     point_2d = conversion.get_2d_from_3d(context, point_3d)
                     if point_2d is None:
@@ -96,10 +96,11 @@ def handle_left_mouse(operator, context, event):
                         continue
                     dx = mouse_pos[0] - point_2d[0]
                     dy = mouse_pos[1] - point_2d[1]
-                    d = math.sqrt(dx*dx + dy*dy)
-                    if d <= screen_radius and d < closest_d:
-                        closest_d = d
-                        hit_type = 'point' if d <= 0.5 * screen_radius else 'radius'
+                    d_sq = dx*dx + dy*dy
+                    sr_sq = screen_radius * screen_radius
+                    if d_sq <= sr_sq and d_sq < closest_d_sq:
+                        closest_d_sq = d_sq
+                        hit_type = 'point' if d_sq <= 0.25 * sr_sq else 'radius'
                         closest_i = i
 
             if closest_i != -1:
@@ -185,9 +186,10 @@ def handle_left_mouse(operator, context, event):
         if state.hover_on_curve and state.hover_curve_point_3d is not None and state.hover_curve_segment >= 0:
             state.save_history_state()
             new_point_3d = state.hover_curve_point_3d.copy()
-            closest_segment, min_dist = math_utils.find_closest_segment_to_point(state.points_3d, new_point_3d)
+            closest_segment, min_dist = math_utils.find_closest_segment_to_point(state.get_curve_xyz(), new_point_3d)
             
             state.points_3d.insert(closest_segment + 1, new_point_3d)
+            state.invalidate_curve_xyz()
             
             if closest_segment + 1 < len(state.point_radii_3d):
                 prev_r = state.point_radii_3d[closest_segment]
@@ -361,6 +363,7 @@ def handle_right_mouse(operator, context, event):
         delete_index = state.hover_point_index
         
         state.points_3d.pop(delete_index)
+        state.invalidate_curve_xyz()
         if delete_index < len(state.point_radii_3d):
             state.point_radii_3d.pop(delete_index)
         if delete_index < len(state.point_tensions):
@@ -506,7 +509,7 @@ def handle_mouse_move(operator, context, event):
             pw = state.object_matrix_world @ orig if state.object_matrix_world else orig
             pw_new = pw + offset_world
             if state.object_matrix_world:
-                new_points.append(state.object_matrix_world.inverted() @ pw_new)
+                new_points.append(state.get_object_matrix_world_inv() @ pw_new)
             else:
                 new_points.append(pw_new)
 
@@ -608,6 +611,7 @@ def handle_mouse_move(operator, context, event):
         new_point_3d = _get_dragged_point(operator, context, mouse_pos)
         if new_point_3d is not None:
             state.points_3d[state.active_point_index] = new_point_3d
+            state.invalidate_curve_xyz()
             if len(state.points_3d) >= 2 and len(state.point_radii_3d) >= 2:
                 mesh_utils.update_preview_mesh(context, state.points_3d, state.point_radii_3d, 
                                               resolution=operator.resolution, segments=operator.segments)
@@ -620,7 +624,7 @@ def handle_mouse_move(operator, context, event):
         point_2d = conversion.get_2d_from_3d(context, point_3d)
         
         if point_2d is not None:
-            distance_2d = math.sqrt((mouse_pos[0] - point_2d[0])**2 + (mouse_pos[1] - point_2d[1])**2)
+            distance_2d = math.hypot(mouse_pos[0] - point_2d[0], mouse_pos[1] - point_2d[1])
             distance_3d = conversion.get_world_distance(context, distance_2d, point_3d)
             clamped = max(state.MIN_RADIUS, min(distance_3d, state.MAX_RADIUS))
             state.point_radii_3d[state.adjusting_radius_index] = clamped
@@ -664,7 +668,7 @@ def handle_mouse_move(operator, context, event):
         point_2d = conversion.get_2d_from_3d(context, point_3d)
         
         if point_2d is not None:
-            distance_2d = math.sqrt((mouse_pos[0] - point_2d[0])**2 + (mouse_pos[1] - point_2d[1])**2)
+            distance_2d = math.hypot(mouse_pos[0] - point_2d[0], mouse_pos[1] - point_2d[1])
             # Resolution-independent threshold: ~7% of region height (300px at 4K ~2160px height)
             region_height = context.region.height if context.region else 2160
             min_drag_pixels = region_height * 0.14
@@ -705,7 +709,7 @@ def _get_dragged_point(operator, context, mouse_pos):
     if state.snapping_mode == state.SNAPPING_OFF and state.drag_start_world_point is not None:
         world_point_on_plane = view3d_utils.region_2d_to_location_3d(region, rv3d, mouse_pos, state.drag_start_world_point)
         if state.object_matrix_world:
-            new_point_3d = state.object_matrix_world.inverted() @ world_point_on_plane
+            new_point_3d = state.get_object_matrix_world_inv() @ world_point_on_plane
         else:
             new_point_3d = world_point_on_plane
         return new_point_3d
@@ -747,7 +751,7 @@ def _get_dragged_point(operator, context, mouse_pos):
                 world_point = world_ray_origin + world_ray_direction * t
             
             if state.object_matrix_world:
-                new_point_3d = state.object_matrix_world.inverted() @ world_point
+                new_point_3d = state.get_object_matrix_world_inv() @ world_point
             else:
                 new_point_3d = world_point
             return new_point_3d
@@ -760,7 +764,7 @@ def _get_dragged_point(operator, context, mouse_pos):
     ray_direction_for_intersect = world_ray_direction
     
     if state.object_matrix_world:
-        mat_inv = state.object_matrix_world.inverted()
+        mat_inv = state.get_object_matrix_world_inv()
         ray_origin_for_intersect = mat_inv @ world_ray_origin
         ray_direction_for_intersect = mat_inv.to_3x3() @ world_ray_direction
     
@@ -772,7 +776,7 @@ def _get_dragged_point(operator, context, mouse_pos):
                 world_intersection = world_ray_origin + t * world_ray_direction
                 
                 if state.object_matrix_world:
-                    new_point_3d = state.object_matrix_world.inverted() @ world_intersection
+                    new_point_3d = state.get_object_matrix_world_inv() @ world_intersection
                 else:
                     new_point_3d = world_intersection
                 return new_point_3d
@@ -811,17 +815,18 @@ def _update_hover_states(context, mouse_pos):
             
             dx = mouse_pos[0] - center_2d[0]
             dy = mouse_pos[1] - center_2d[1]
-            dist = math.sqrt(dx*dx + dy*dy)
+            dist_sq = dx*dx + dy*dy
+            sr_sq = screen_radius * screen_radius
             
-            if dist <= screen_radius:
-                if dist <= 0.5 * screen_radius:
+            if dist_sq <= sr_sq:
+                if dist_sq <= 0.25 * sr_sq:
                     state.hover_point_index = active_idx
                     state.hover_radius_index = -1
                 else:
                     state.hover_radius_index = active_idx
                     state.hover_point_index = -1
             
-            inside_active_envelope = (dist <= envelope_radius)
+            inside_active_envelope = (dist_sq <= envelope_radius * envelope_radius)
             
             # Check tension hover
             if not state.bspline_mode:
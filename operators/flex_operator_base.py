@@ -212,7 +212,7 @@ class FlexOperatorBase(bpy.types.Operator):
                 t = max(t, 0.001)
                 world_point = world_ray_origin + world_ray_direction * t
                 if state.object_matrix_world:
-                    new_point_3d = state.object_matrix_world.inverted() @ world_point
+                    new_point_3d = state.get_object_matrix_world_inv() @ world_point
                 else:
                     new_point_3d = world_point
                 # Re-anchor plane if camera moved
@@ -271,7 +271,7 @@ class FlexOperatorBase(bpy.types.Operator):
                         world_intersection_point = world_ray_origin + t * world_ray_direction
                         
                         if state.object_matrix_world:
-                            new_point_3d = state.object_matrix_world.inverted() @ world_intersection_point
+                            new_point_3d = state.get_object_matrix_world_inv() @ world_intersection_point
                         else:
                             new_point_3d = world_intersection_point
                         
@@ -324,15 +324,15 @@ class FlexOperatorBase(bpy.types.Operator):
             # Secondary fallback: nearest point depth
             if not used_connecting_end and len(state.points_3d) > 0:
                 nearest_point_world = None
-                min_distance_2d = float('inf')
+                min_distance_2d_sq = float('inf')
                 mouse_vec_2d = Vector((mouse_pos[0], mouse_pos[1]))
                 for point_3d in state.points_3d:
                     pw = state.object_matrix_world @ point_3d if state.object_matrix_world else point_3d
                     p2d = conversion.get_2d_from_3d(context, pw)
                     if p2d:
-                        d2d = (mouse_vec_2d - Vector(p2d)).length
-                        if d2d < min_distance_2d:
-                            min_distance_2d = d2d
+                        d2d_sq = (mouse_vec_2d - Vector(p2d)).length_squared
+                        if d2d_sq < min_distance_2d_sq:
+                            min_distance_2d_sq = d2d_sq
                             nearest_point_world = pw
                 if nearest_point_world is not None:
                     camera_location = rv3d.view_matrix.inverted().translation
@@ -345,6 +345,7 @@ class FlexOperatorBase(bpy.types.Operator):
     def _add_first_point(self, new_point_3d):
         """Add the first point to start a new curve."""
         state.points_3d.append(new_point_3d)
+        state.invalidate_curve_xyz()
         state.point_radii_3d.append(state.DEFAULT_RADIUS)
         state.point_tensions.append(0.5)
         if hasattr(state, 'helix_point_magnitudes'):
@@ -369,6 +370,7 @@ class FlexOperatorBase(bpy.types.Operator):
         
         if len(state.points_3d) == 0:
             state.points_3d.append(new_point)
+            state.invalidate_curve_xyz()
             state.point_radii_3d.append(state.DEFAULT_RADIUS)
             state.point_tensions.append(0.5)
             if hasattr(state, 'profile_point_twists'):
@@ -388,12 +390,13 @@ class FlexOperatorBase(bpy.types.Operator):
         # Default to append if projection fails
         add_to_start = False
         if start_2d is not None and end_2d is not None:
-            dist_to_start = math.sqrt((mouse_pos[0] - start_2d[0])**2 + (mouse_pos[1] - start_2d[1])**2)
-            dist_to_end = math.sqrt((mouse_pos[0] - end_2d[0])**2 + (mouse_pos[1] - end_2d[1])**2)
+            dist_to_start = math.hypot(mouse_pos[0] - start_2d[0], mouse_pos[1] - start_2d[1])
+            dist_to_end = math.hypot(mouse_pos[0] - end_2d[0], mouse_pos[1] - end_2d[1])
             add_to_start = dist_to_start < dist_to_end
         
         if add_to_start:
             state.points_3d.insert(0, new_point)
+            state.invalidate_curve_xyz()
             state.point_radii_3d.insert(0, state.point_radii_3d[0] if state.point_radii_3d else state.DEFAULT_RADIUS)
             state.point_tensions.insert(0, 0.5)
             if hasattr(state, 'helix_point_magnitudes'):
@@ -425,6 +428,7 @@ class FlexOperatorBase(bpy.types.Operator):
             state.creating_point_index = 0
         else:
             state.points_3d.append(new_point)
+            state.invalidate_curve_xyz()
             state.point_radii_3d.append(state.point_radii_3d[-1] if state.point_radii_3d else state.DEFAULT_RADIUS)
             state.point_tensions.append(0.5)
             if hasattr(state, 'helix_point_magnitudes'):
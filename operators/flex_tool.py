@@ -262,6 +262,7 @@ class MESH_OT_flex_create(FlexOperatorBase):
                     for point_data in curve_data["curve_points"]:
                         point = Vector((point_data["x"], point_data["y"], point_data["z"]))
                         state.points_3d.append(point)
+                    state.invalidate_curve_xyz()
 
                 if "radii" in curve_data:
                     state.point_radii_3d = curve_data["radii"]
@@ -319,6 +320,7 @@ class MESH_OT_flex_create(FlexOperatorBase):
                     matrix_world_inv = muscle_obj.matrix_world.inverted_safe()
                     for i, point in enumerate(state.points_3d):
                         state.points_3d[i] = matrix_world_inv @ point
+                    state.invalidate_curve_xyz()
 
                 state.object_matrix_world = muscle_obj.matrix_world.copy()
             except Exception as e:
@@ -766,11 +768,4 @@ classes = (
 )
 
 
-def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-
-
-def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+register, unregister = bpy.utils.register_classes_factory(classes)
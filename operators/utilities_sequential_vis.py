@@ -1,5 +1,5 @@
 import bpy
-from bpy.types import Operator
+from bpy.types import Operator, PropertyGroup
 
 
 def get_channelbag_for_object(obj):
@@ -40,6 +40,24 @@ def get_fcurves_for_object(obj):
         return None
 
 
+def ensure_visibility_fcurve(obj):
+    """Return the hide_viewport fcurve for an object, creating animation data, action and fcurve as needed."""
+    ad = obj.animation_data or obj.animation_data_create()
+    if ad.action is None:
+        ad.action = bpy.data.actions.new(name=f"{obj.name}_VisAction")
+    action = ad.action
+
+    # Blender 4.4+ (slotted actions): creates the slot/channelbag for this object if missing
+    try:
+        return action.fcurve_ensure_for_datablock(obj, "hide_viewport")
+    except AttributeError:
+        pass
+
+    # Fallback to legacy API (Blender 4.3 and earlier)
+    fcurves = action.fcurves
+    return fcurves.find("hide_viewport") or fcurves.new("hide_viewport")
+
+
 def remove_visibility_fcurves(obj):
     """Remove visibility fcurves from an object, handling both Blender 4.x and 5.0+ APIs."""
     # First, try to delete all keyframes on hide_viewport using keyframe_delete
@@ -55,12 +73,40 @@ def remove_visibility_fcurves(obj):
     if fcurves is None:
         return
     
-    to_remove = [fc for fc in fcurves if fc.data_path == "hide_viewport"]
-    for fc in to_remove:
-        try:
-            fcurves.remove(fc)
-        except (RuntimeError, TypeError):
-            pass
+    try:
+        fc = fcurves.find("hide_viewport")
+    except (AttributeError, TypeError):
+        # Collection without find(): fall back to a Python scan
+        fc = next((f for f in fcurves if f.data_path == "hide_viewport"), None)
+    if fc is None:
+        return
+    try:
+        fcurves.remove(fc)
+    except (RuntimeError, TypeError):
+        pass
+
+
+def sequential_visibility_keys(index, count, start_frame, duration):
+    """Return the (frame, hide) keys for the object at `index` in a sequence of `count`.
+
+    The object is visible for [f, f+duration-1] where f = start_frame + index*duration,
+    hidden from start_frame until f (except the first object), and hidden again at
+    f+duration unless it is the last object.
+    """
+    f = start_frame + index * duration
+    keys = []
+    if index > 0:
+        keys.append((start_frame, True))
+    keys.append((f, False))
+    if duration > 1:
+        keys.append((f + duration - 1, False))
+    if index < count - 1:
+        keys.append((f + duration, True))
+    return keys
+
+
+class SUPERTOOLS_PG_seqvis_entry(PropertyGroup):
+    obj: bpy.props.PointerProperty(type=bpy.types.Object)
 
 
 class SUPERTOOLS_OT_mesh_flipbook(Operator):
@@ -73,25 +119,22 @@ class SUPERTOOLS_OT_mesh_flipbook(Operator):
         # Get duration from scene property
         duration = getattr(context.scene, 'supertools_seqvis_duration', 5)
         
-        # Get stored object names from previous run
-        stored_names = ""
-        if hasattr(context.scene, 'supertools_seqvis_objects'):
-            stored_names = context.scene.supertools_seqvis_objects or ""
-        stored_list = [n.strip() for n in stored_names.split(";") if n.strip()]
-        
+        # Objects stored from the previous run (RNA pointers, so renames are tracked)
+        stored = getattr(context.scene, 'supertools_seqvis_objects', None)
+
         # If no selection, check if we have stored objects to reset
         if not context.selected_objects:
-            if stored_list:
+            if stored is not None and len(stored) > 0:
                 # Reset stored objects
                 reset_count = 0
-                for name in stored_list:
-                    obj = bpy.data.objects.get(name)
+                for entry in stored:
+                    obj = entry.obj
                     if obj:
                         remove_visibility_fcurves(obj)
                         obj.hide_viewport = False
                         reset_count += 1
                 # Clear the stored list
-                context.scene.supertools_seqvis_objects = ""
+                stored.clear()
                 self.report({'INFO'}, f"Reset {reset_count} objects to visible and removed keyframes.")
                 return {'FINISHED'}
             else:
@@ -102,39 +145,34 @@ class SUPERTOOLS_OT_mesh_flipbook(Operator):
         if context.selected_objects:
             start_frame = context.scene.frame_start
             objs = list(context.selected_objects)
-
-            # Baseline: hide all selected at start_frame
-            for o in objs:
-                o.hide_viewport = True
-                o.keyframe_insert(data_path="hide_viewport", frame=start_frame)
-
-            # For each object, make it visible for [f, f+duration-1], then hide at f+duration (except last)
-            for i, obj in enumerate(objs):
-                f = start_frame + i * duration
-
-                # Visible ON at f
-                obj.hide_viewport = False
-                obj.keyframe_insert(data_path="hide_viewport", frame=f)
-
-                # Stay visible through f+duration-1
-                obj.keyframe_insert(data_path="hide_viewport", frame=f + duration - 1)
-
-                # Turn OFF (hide) at f+duration if not last
-                if i < len(objs) - 1:
-                    obj.hide_viewport = True
-                    obj.keyframe_insert(data_path="hide_viewport", frame=f + duration)
-
-            # Force CONSTANT interpolation to avoid blending/overlap between boolean keys
-            for obj in objs:
-                fcurves = get_fcurves_for_object(obj)
-                if fcurves:
-                    for fc in fcurves:
-                        if fc.data_path == "hide_viewport":
-                            for kp in fc.keyframe_points:
-                                kp.interpolation = 'CONSTANT'
-
-            # Store the object names for later reset
-            context.scene.supertools_seqvis_objects = ";".join(obj.name for obj in objs)
+            count = len(objs)
+
+            # Create animation data, actions and fcurves once, up front
+            vis_fcurves = [ensure_visibility_fcurve(obj) for obj in objs]
+
+            # Each object gets its own complete key list, written in one bulk call per fcurve
+            for i, fc in enumerate(vis_fcurves):
+                keys = sequential_visibility_keys(i, count, start_frame, duration)
+                co = []
+                for frame, hide in keys:
+                    co.extend((float(frame), float(hide)))
+
+                points = fc.keyframe_points
+                points.clear()
+                points.add(len(keys))
+                points.foreach_set("co", co)
+                # CONSTANT interpolation (enum value 0) avoids blending between boolean keys
+                points.foreach_set("interpolation", [0] * len(keys))
+                fc.update()
+
+            # Keys were written straight to the fcurves; re-evaluate so visibility reflects them now
+            context.scene.frame_set(context.scene.frame_current)
+
+            # Store the objects for later reset
+            if stored is not None:
+                stored.clear()
+                for obj in objs:
+                    stored.add().obj = obj
             
             self.report({'INFO'}, f"Sequential visibility keyframes added (duration={duration} frames each). Run again with no selection to reset.")
             return {'FINISHED'}
@@ -151,10 +189,11 @@ def register():
         min=1,
         max=250,
     )
-    bpy.types.Scene.supertools_seqvis_objects = bpy.props.StringProperty(
+    bpy.utils.register_class(SUPERTOOLS_PG_seqvis_entry)
+    bpy.types.Scene.supertools_seqvis_objects = bpy.props.CollectionProperty(
         name="Sequenced Objects",
-        description="Semicolon-separated list of object names with sequential visibility keyframes",
-        default="",
+        description="Objects with sequential visibility keyframes",
+        type=SUPERTOOLS_PG_seqvis_entry,
     )
     bpy.utils.register_class(SUPERTOOLS_OT_mesh_flipbook)
 
@@ -165,3 +204,4 @@ def unregister():
         del bpy.types.Scene.supertools_seqvis_objects
     if hasattr(bpy.types.Scene, 'supertools_seqvis_duration'):
         del bpy.types.Scene.supertools_seqvis_duration
+    bpy.utils.unregister_class(SUPERTOOLS_PG_seqvis_entry)
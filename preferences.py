@@ -1,21 +1,56 @@
 import bpy
+import contextlib
+import functools
 import os
 import re
-import shutil
-import zipfile
-import tempfile
 import importlib
-import json
-import base64
-from urllib import request, error
+import queue
+import threading
+import time
 
 import rna_keymap_ui
 
+try:
+    from . import keymaps
+except Exception:
+    keymaps = None
+
+# Updater-only modules (ast, hashlib, zipfile, tempfile, shutil, json, gzip, http.client, urllib) are
+# imported inside the functions that use them to keep addon enable fast.
+
 
 REPO_RAW_INIT_URL = "https://raw.githubusercontent.com/haystax78/super_tools/main/super_tools/__init__.py"
 REPO_ZIP_URL = "https://codeload.github.com/haystax78/super_tools/zip/refs/heads/main"
+REPO_CONTENTS_API_URL = "https://api.github.com/repos/haystax78/super_tools/contents/super_tools/__init__.py?ref=main"
+REPO_TAGS_API_URL = "https://api.github.com/repos/haystax78/super_tools/tags?per_page=1"
+
+_VERSION_RE = re.compile(r"version\"\s*:\s*\((\d+)\s*,\s*(\d+)\s*,\s*(\d+)\)")
+_TAG_RE = re.compile(r"v(\d+)\.(\d+)\.(\d+)$")
+
+# Update archive is buffered in memory up to this size, read in 1 MiB chunks
+_ZIP_SPOOL_MAX_SIZE = 32 * 1024 * 1024
+_ZIP_CHUNK_SIZE = 1 << 20
+
+# Per-request timeout for version checks (worst case is one timeout per source)
+_HTTP_TIMEOUT = 5
+# bl_info sits at the top of __init__.py, so only the head of the file is read
+_INIT_READ_LIMIT = 4096
+
+# Remote version is reused for this many seconds before GitHub is asked again
+_REMOTE_CACHE_TTL = 600.0
+_REMOTE_CACHE = {"ts": 0.0, "value": None}
+# Keep-alive HTTPS connections for version checks, keyed by host
+_HTTPS_CONNECTIONS = {}
+# Per-URL validators for conditional GETs: url -> {"etag", "last_modified", "value"}
+_HTTP_VALIDATORS = {}
+
+# Results of background update checks, drained on the main thread: (auto, remote_version)
+_CHECK_RESULTS = queue.Queue()
+_CHECK_IN_FLIGHT = False
 
 
+# bl_info only changes when the package is reloaded after an update (see perform_update)
+@functools.lru_cache(maxsize=1)
 def _get_local_version_tuple():
     try:
         # __package__ equals top-level package name 'super_tools'
@@ -28,127 +63,382 @@ def _get_local_version_tuple():
     return (0, 0, 0)
 
 
+def _parse_bl_info(text):
+    """Return the bl_info dict literal from module source, or None if it can't be parsed."""
+    import ast
+    try:
+        tree = ast.parse(text)
+    except (SyntaxError, ValueError):
+        return None
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        if any(isinstance(t, ast.Name) and t.id == 'bl_info' for t in node.targets):
+            try:
+                value = ast.literal_eval(node.value)
+            except ValueError:
+                return None
+            return value if isinstance(value, dict) else None
+    return None
+
+
 def _parse_version_from_text(text):
-    # Expect a line like: "version": (0, 0, 2),
-    m = re.search(r"version\"\s*:\s*\((\d+)\s*,\s*(\d+)\s*,\s*(\d+)\)", text)
+    bl_info = _parse_bl_info(text)
+    if bl_info is not None:
+        try:
+            return tuple(int(v) for v in bl_info['version'])
+        except (KeyError, TypeError, ValueError):
+            pass
+
+    # Fallback (e.g. truncated source): expect a line like: "version": (0, 0, 2),
+    m = _VERSION_RE.search(text)
     if not m:
         return None
     return tuple(map(int, m.groups()))
 
 
-def _http_get(url, timeout=10):
-    req = request.Request(url, headers={
-        'User-Agent': 'super_tools_updater/1.0 (+https://github.com/haystax78/super_tools)'
-    })
-    return request.urlopen(req, timeout=timeout)
-
+def _https_connection(host, timeout):
+    import http.client
+    conn = _HTTPS_CONNECTIONS.get(host)
+    if conn is None:
+        conn = http.client.HTTPSConnection(host, timeout=timeout)
+        _HTTPS_CONNECTIONS[host] = conn
+    else:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+    return conn
+
+
+def _drop_https_connection(host):
+    conn = _HTTPS_CONNECTIONS.pop(host, None)
+    if conn is not None:
+        conn.close()
+
+
+def _close_https_connections():
+    for host in list(_HTTPS_CONNECTIONS):
+        _drop_https_connection(host)
+
+
+def _uses_https_proxy(host):
+    """True when HTTPS_PROXY / the system settings route `host` through a proxy."""
+    from urllib import request
+    return bool(request.getproxies().get('https')) and not request.proxy_bypass(host)
+
+
+@contextlib.contextmanager
+def _http_get(url, timeout=10, headers=None):
+    """GET `url` over a keep-alive HTTPS connection and yield the response.
+
+    Non-2xx answers raise urllib.error.HTTPError and http.client protocol errors are
+    re-raised as urllib.error.URLError, like urlopen; redirects are not followed.
+    Behind an HTTPS proxy the request goes through urlopen instead, which honours
+    the proxy settings (no connection reuse there).
+    """
+    import http.client
+    from urllib import error, parse, request
+
+    parts = parse.urlsplit(url)
+    host = parts.netloc
+    path = parts.path + ('?' + parts.query if parts.query else '')
+    hdrs = {
+        'User-Agent': 'super_tools_updater/1.0 (+https://github.com/haystax78/super_tools)',
+        # Callers must check Content-Encoding (see _conditional_get_version)
+        'Accept-Encoding': 'gzip',
+    }
+    if headers:
+        hdrs.update(headers)
+
+    if _uses_https_proxy(host):
+        try:
+            with request.urlopen(request.Request(url, headers=hdrs), timeout=timeout) as resp:
+                yield resp
+        except http.client.HTTPException as e:
+            raise error.URLError(e) from e
+        return
 
-def _get_remote_version_tuple():
-    # 1) Try raw file URL
+    reused = host in _HTTPS_CONNECTIONS
     try:
-        with _http_get(REPO_RAW_INIT_URL, timeout=10) as resp:
-            data = resp.read().decode('utf-8', errors='ignore')
-            vt = _parse_version_from_text(data)
-            if vt:
-                return vt
-    except Exception:
-        pass
+        try:
+            conn = _https_connection(host, timeout)
+            conn.request('GET', path, headers=hdrs)
+            resp = conn.getresponse()
+        except (http.client.HTTPException, OSError):
+            _drop_https_connection(host)
+            if not reused:
+                raise
+            # The server may have closed an idle keep-alive connection; retry once on a fresh one
+            conn = _https_connection(host, timeout)
+            conn.request('GET', path, headers=hdrs)
+            resp = conn.getresponse()
+    except http.client.HTTPException as e:
+        # Protocol failures (BadStatusLine, LineTooLong, ...) are transport errors, as with urlopen
+        _drop_https_connection(host)
+        raise error.URLError(e) from e
 
-    # 2) Try GitHub contents API
     try:
-        contents_api = "https://api.github.com/repos/haystax78/super_tools/contents/super_tools/__init__.py?ref=main"
-        with _http_get(contents_api, timeout=10) as resp:
-            js = json.loads(resp.read().decode('utf-8', errors='ignore'))
-            if isinstance(js, dict) and 'content' in js:
-                raw = base64.b64decode(js['content']).decode('utf-8', errors='ignore')
-                vt = _parse_version_from_text(raw)
-                if vt:
-                    return vt
-    except Exception:
-        pass
+        if not 200 <= resp.status < 300:
+            resp.read()
+            raise error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        yield resp
+    except http.client.HTTPException as e:
+        # Also while the caller reads the body (IncompleteRead)
+        raise error.URLError(e) from e
+    finally:
+        if not resp.isclosed():
+            # Body not fully read: leftover bytes would corrupt the next response
+            _drop_https_connection(host)
+        resp.close()
+
+
+def _parse_version_from_tags(text):
+    # Expect the newest tag first, named like v0.0.3
+    import json
+    arr = json.loads(text)
+    if isinstance(arr, list) and arr:
+        name = arr[0].get('name', '')
+        m = _TAG_RE.match(name)
+        if m:
+            return tuple(map(int, m.groups()))
+    return None
 
-    # 3) Fallback to tags (expects names like v0.0.3)
+
+def _conditional_get_version(url, parse, timeout=10, headers=None, max_bytes=-1):
+    """Fetch `url` and return parse(body), revalidating with ETag/Last-Modified.
+
+    A 304 Not Modified answer returns the value parsed from the last 200 response
+    for the same URL without transferring or parsing the body again.
+    """
+    from urllib import error
+
+    cached = _HTTP_VALIDATORS.get(url)
+    hdrs = dict(headers or {})
+    if cached:
+        if cached.get("etag"):
+            hdrs['If-None-Match'] = cached["etag"]
+        if cached.get("last_modified"):
+            hdrs['If-Modified-Since'] = cached["last_modified"]
     try:
-        tags_api = "https://api.github.com/repos/haystax78/super_tools/tags"
-        with _http_get(tags_api, timeout=10) as resp:
-            arr = json.loads(resp.read().decode('utf-8', errors='ignore'))
-            if isinstance(arr, list) and arr:
-                name = arr[0].get('name', '')
-                m = re.match(r"v(\d+)\.(\d+)\.(\d+)$", name)
-                if m:
-                    return tuple(map(int, m.groups()))
-    except Exception:
-        pass
+        with _http_get(url, timeout=timeout, headers=hdrs) as resp:
+            body = resp
+            if resp.headers.get('Content-Encoding') == 'gzip':
+                import gzip
+                body = gzip.GzipFile(fileobj=resp)
+            value = parse(body.read(max_bytes).decode('utf-8', errors='ignore'))
+            if value:
+                _HTTP_VALIDATORS[url] = {
+                    "etag": resp.headers.get('ETag'),
+                    "last_modified": resp.headers.get('Last-Modified'),
+                    "value": value,
+                }
+            return value
+    except error.HTTPError as e:
+        if e.code == 304 and cached:
+            return cached["value"]
+        raise
+
+
+def _get_remote_version_tuple():
+    now = time.monotonic()
+    if _REMOTE_CACHE["value"] and now - _REMOTE_CACHE["ts"] < _REMOTE_CACHE_TTL:
+        return _REMOTE_CACHE["value"]
+
+    # The raw URL and the contents API serve the same __init__.py; parse each distinct body once
+    seen = {}
+
+    def _parse_init_once(text):
+        import hashlib
+        h = hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+        if h not in seen:
+            seen[h] = _parse_version_from_text(text)
+        return seen[h]
+
+    sources = (
+        # 1) Raw file URL
+        (REPO_RAW_INIT_URL, _parse_init_once, None, _INIT_READ_LIMIT),
+        # 2) GitHub contents API, asking for the raw file instead of base64-in-JSON
+        (REPO_CONTENTS_API_URL, _parse_init_once, {'Accept': 'application/vnd.github.v3.raw'}, _INIT_READ_LIMIT),
+        # 3) Fallback to tags (expects names like v0.0.3)
+        (REPO_TAGS_API_URL, _parse_version_from_tags, None, -1),
+    )
+    for url, parse, headers, max_bytes in sources:
+        try:
+            vt = _conditional_get_version(url, parse, timeout=_HTTP_TIMEOUT, headers=headers, max_bytes=max_bytes)
+        except OSError:
+            # URLError/HTTPError, timeouts and connection resets: the next source may still answer
+            continue
+        except Exception:
+            # Got a response but could not parse it
+            return None
+        if not vt:
+            # The source answered but carries no usable version; the others mirror it
+            return None
+        _REMOTE_CACHE["ts"] = now
+        _REMOTE_CACHE["value"] = vt
+        return vt
 
     return None
 
 
+def _zip_addon_members(zf):
+    """Yield (ZipInfo, relative_path) for the addon files inside a GitHub branch archive.
+
+    Archives look like 'super_tools-main/super_tools/...'; if there is no inner
+    'super_tools' folder the repository root itself holds the addon files.
+    """
+    infos = [i for i in zf.infolist() if not i.is_dir()]
+    roots = {i.filename.split('/', 1)[0] for i in infos}
+    inner_root = next((r for r in sorted(roots) if r.startswith('super_tools-')), None)
+    if not inner_root:
+        raise RuntimeError("Could not locate repository folder in archive")
+
+    prefix = inner_root + '/super_tools/'
+    if not any(i.filename.startswith(prefix) for i in infos):
+        # Fallback: repo root directly contains files
+        prefix = inner_root + '/'
+
+    for info in infos:
+        if not info.filename.startswith(prefix):
+            continue
+        rel = info.filename[len(prefix):]
+        parts = rel.split('/')
+        if not rel or '..' in parts or os.path.isabs(rel):
+            continue
+        yield info, os.path.join(*parts)
+
+
 def _download_and_extract_zip(dest_dir):
     # dest_dir should be the current addon directory (this file's parent)
-    tmpdir = tempfile.mkdtemp(prefix="super_tools_upd_")
-    zippath = os.path.join(tmpdir, "repo.zip")
+    import shutil
+    import zipfile
+    import tempfile
+    from urllib import request
+
     try:
-        # Download ZIP
-        with request.urlopen(REPO_ZIP_URL, timeout=30) as resp, open(zippath, 'wb') as f:
-            shutil.copyfileobj(resp, f)
-
-        # Extract ZIP
-        with zipfile.ZipFile(zippath, 'r') as zf:
-            zf.extractall(tmpdir)
-
-        # Find extracted inner folder: typically 'super_tools-main/super_tools'
-        inner_root = None
-        for name in os.listdir(tmpdir):
-            if name.startswith('super_tools-') and os.path.isdir(os.path.join(tmpdir, name)):
-                inner_root = os.path.join(tmpdir, name)
-                break
-        if not inner_root:
-            raise RuntimeError("Could not locate extracted repository folder")
-
-        src_addon_dir = os.path.join(inner_root, 'super_tools')
-        if not os.path.isdir(src_addon_dir):
-            # Fallback: repo root directly contains files
-            src_addon_dir = inner_root
-
-        # Copy files over existing addon dir (non-destructive: will overwrite existing files but not remove stale ones)
-        for root, dirs, files in os.walk(src_addon_dir):
-            rel = os.path.relpath(root, src_addon_dir)
-            target_root = os.path.join(dest_dir, rel) if rel != '.' else dest_dir
-            os.makedirs(target_root, exist_ok=True)
-            for d in dirs:
-                os.makedirs(os.path.join(target_root, d), exist_ok=True)
-            for fname in files:
-                shutil.copy2(os.path.join(root, fname), os.path.join(target_root, fname))
+        # Download ZIP into memory (spills to disk only for unusually large archives)
+        with tempfile.SpooledTemporaryFile(max_size=_ZIP_SPOOL_MAX_SIZE) as buf:
+            with request.urlopen(REPO_ZIP_URL, timeout=30) as resp:
+                while True:
+                    chunk = resp.read(_ZIP_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    buf.write(chunk)
+            buf.seek(0)
+
+            # Extract addon files straight over the existing addon dir
+            # (non-destructive: will overwrite existing files but not remove stale ones)
+            with zipfile.ZipFile(buf, 'r') as zf:
+                members = list(_zip_addon_members(zf))
+                # One makedirs per unique directory, parents first
+                dirs = {os.path.dirname(rel) for _, rel in members}
+                for d in sorted(dirs, key=len):
+                    os.makedirs(os.path.join(dest_dir, d), exist_ok=True)
+                for info, rel in members:
+                    with zf.open(info) as src, open(os.path.join(dest_dir, rel), 'wb') as dst:
+                        shutil.copyfileobj(src, dst, _ZIP_CHUNK_SIZE)
         return True, "Update applied."
     except Exception as e:
         return False, f"Update failed: {e}"
-    finally:
-        shutil.rmtree(tmpdir, ignore_errors=True)
 
 
-def _auto_update_timer():
-    """Timer callback to auto-check (and optionally auto-install) updates on startup."""
+def _load_saved_validators(prefs):
+    """Seed the raw-file ETag saved in prefs, so a session's first check can end in a 304."""
+    if REPO_RAW_INIT_URL in _HTTP_VALIDATORS:
+        return
+    etag = getattr(prefs, 'update_etag', "")
+    version = tuple(getattr(prefs, 'update_etag_version', (0, 0, 0)))
+    if etag and version != (0, 0, 0):
+        _HTTP_VALIDATORS[REPO_RAW_INIT_URL] = {"etag": etag, "last_modified": None, "value": version}
+
+
+def _save_validators(prefs):
+    cached = _HTTP_VALIDATORS.get(REPO_RAW_INIT_URL)
+    if cached and cached.get("etag") and prefs.update_etag != cached["etag"]:
+        prefs.update_etag = cached["etag"]
+        prefs.update_etag_version = cached["value"]
+
+
+def _start_remote_check(prefs, auto):
+    """Fetch the remote version on a worker thread and apply it from a main-thread timer.
+
+    Returns False if a check is already running.
+    """
+    global _CHECK_IN_FLIGHT
+    if _CHECK_IN_FLIGHT:
+        return False
+    _CHECK_IN_FLIGHT = True
+    # Prefs are only touched on the main thread
+    _load_saved_validators(prefs)
+
+    def _worker():
+        try:
+            remote_v = _get_remote_version_tuple()
+        except Exception:
+            remote_v = None
+        _CHECK_RESULTS.put((auto, remote_v))
+
+    threading.Thread(target=_worker, name="super_tools_update_check", daemon=True).start()
+    bpy.app.timers.register(_drain_check_results, first_interval=0.5)
+    return True
+
+
+def _tag_preferences_redraw():
+    try:
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'PREFERENCES':
+                    area.tag_redraw()
+    except Exception:
+        pass
+
+
+def _drain_check_results():
+    """Timer callback: poll for a finished remote check and write the result to prefs."""
+    global _CHECK_IN_FLIGHT
     try:
+        auto, remote_v = _CHECK_RESULTS.get_nowait()
+    except queue.Empty:
+        return 0.5
+    _CHECK_IN_FLIGHT = False
+
+    try:
+        # Re-lookup: the addon may have been disabled while the thread was running
         addon = bpy.context.preferences.addons.get(__package__)
         if not addon:
             return None
         prefs = addon.preferences
-        if not getattr(prefs, 'auto_check', False):
-            return None
+        _save_validators(prefs)
         local_v = _get_local_version_tuple()
-        remote_v = _get_remote_version_tuple()
+        prefix = "Auto-check: " if auto else ""
         if not remote_v:
-            prefs.update_status = "Auto-check: unable to fetch remote version."
-            return None
-        if remote_v > local_v:
+            prefs.update_status = prefix + "Unable to fetch remote version."
+        elif remote_v > local_v:
             prefs.update_available = True
-            prefs.update_status = f"Auto-check: update available {local_v} -> {remote_v}"
-            if getattr(prefs, 'auto_update', False):
+            prefs.update_status = f"{prefix}Update available: {local_v} -> {remote_v}"
+            if auto and getattr(prefs, 'auto_update', False):
                 ok, msg = _download_and_extract_zip(os.path.dirname(__file__))
                 prefs.update_status = (msg or "") + " (auto)"
         else:
             prefs.update_available = False
-            prefs.update_status = f"Auto-check: up to date ({local_v})"
+            prefs.update_status = f"{prefix}Up to date (local {local_v}, remote {remote_v})"
+        _tag_preferences_redraw()
+    except Exception:
+        # Avoid throwing in timer
+        pass
+    return None
+
+
+def _auto_update_timer():
+    """Timer callback to auto-check (and optionally auto-install) updates on startup."""
+    try:
+        addon = bpy.context.preferences.addons.get(__package__)
+        if not addon:
+            return None
+        prefs = addon.preferences
+        if not getattr(prefs, 'auto_check', False):
+            return None
+        _start_remote_check(prefs, auto=True)
     except Exception:
         # Avoid throwing in timer
         pass
@@ -162,20 +452,11 @@ class SUPERTOOLS_OT_check_update(bpy.types.Operator):
 
     def execute(self, context):
         prefs = context.preferences.addons.get(__package__).preferences
-        local_v = _get_local_version_tuple()
-        remote_v = _get_remote_version_tuple()
-        if not remote_v:
-            prefs.update_status = "Unable to fetch remote version."
-            self.report({'WARNING'}, prefs.update_status)
+        if not _start_remote_check(prefs, auto=False):
+            self.report({'INFO'}, "Update check already in progress.")
             return {'CANCELLED'}
-        if remote_v > local_v:
-            prefs.update_available = True
-            prefs.update_status = f"Update available: {local_v} -> {remote_v}"
-            self.report({'INFO'}, prefs.update_status)
-        else:
-            prefs.update_available = False
-            prefs.update_status = f"Up to date (local {local_v}, remote {remote_v})"
-            self.report({'INFO'}, prefs.update_status)
+        prefs.update_status = "Checking for updates..."
+        self.report({'INFO'}, prefs.update_status)
         return {'FINISHED'}
 
 
@@ -196,6 +477,7 @@ class SUPERTOOLS_OT_perform_update(bpy.types.Operator):
                 importlib.reload(mod)
             except Exception:
                 pass
+            _get_local_version_tuple.cache_clear()
             self.report({'INFO'}, msg + " You may need to restart Blender.")
             return {'FINISHED'}
         else:
@@ -226,9 +508,7 @@ class SUPERTOOLS_OT_add_super_duplicate_shortcut(bpy.types.Operator):
     duplicate: bpy.props.BoolProperty(default=True)
 
     def execute(self, context):
-        try:
-            from . import keymaps
-        except Exception:
+        if not keymaps:
             return {'CANCELLED'}
 
         wm = context.window_manager
@@ -258,7 +538,6 @@ class SuperToolsPreferences(bpy.types.AddonPreferences):
 
     def _refresh_super_keymaps(self, context):
         try:
-            from . import keymaps
             keymaps.migrate_super_duplicate_hotkeys_from_prefs()
         except Exception:
             pass
@@ -275,6 +554,9 @@ class SuperToolsPreferences(bpy.types.AddonPreferences):
     )
     update_available: bpy.props.BoolProperty(default=False)
     update_status: bpy.props.StringProperty(name="Status", default="")
+    # Conditional-GET validator for the remote __init__.py, kept across sessions
+    update_etag: bpy.props.StringProperty(default="", options={'HIDDEN'})
+    update_etag_version: bpy.props.IntVectorProperty(size=3, default=(0, 0, 0), options={'HIDDEN'})
     
     # Flex Tool Settings
     flex_default_resolution: bpy.props.IntProperty(
@@ -505,23 +787,20 @@ class SuperToolsPreferences(bpy.types.AddonPreferences):
         if not kc:
             col.label(text="No user keyconfig available")
         else:
-            try:
-                from . import keymaps
-            except Exception:
-                keymaps = None
-
-            def _draw_sd_kmi(label, duplicate_value):
+            # Resolve both keymap items once per redraw
+            if keymaps:
+                km_dup, kmi_dup = keymaps.find_super_duplicate_kmi(kc, duplicate_value=True, keymap_name='Sculpt')
+                km_trn, kmi_trn = keymaps.find_super_duplicate_kmi(kc, duplicate_value=False, keymap_name='Sculpt')
+            else:
+                km_dup = kmi_dup = km_trn = kmi_trn = None
+
+            def _draw_sd_kmi(label, duplicate_value, km, kmi):
                 sub = col.column(align=True)
                 sub.label(text=label)
                 if not keymaps:
                     sub.label(text="Keymap unavailable")
                     return
 
-                km, kmi = keymaps.find_super_duplicate_kmi(
-                    kc,
-                    duplicate_value=duplicate_value,
-                    keymap_name='Sculpt',
-                )
                 if not km:
                     sub.label(text="Sculpt keymap not found")
                     return
@@ -545,9 +824,9 @@ class SuperToolsPreferences(bpy.types.AddonPreferences):
                     0,
                 )
 
-            _draw_sd_kmi("Super Duplicate:", True)
+            _draw_sd_kmi("Super Duplicate:", True, km_dup, kmi_dup)
             col.separator()
-            _draw_sd_kmi("Super Transform:", False)
+            _draw_sd_kmi("Super Transform:", False, km_trn, kmi_trn)
         
         col.separator()
         col.label(text="Modal Keys:")
@@ -568,9 +847,11 @@ classes = (
 )
 
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
+
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    _register_classes()
     # Register timer to run shortly after startup
     try:
         bpy.app.timers.register(_auto_update_timer, first_interval=3.0)
@@ -579,5 +860,12 @@ def register():
 
 
 def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    for timer in (_auto_update_timer, _drain_check_results):
+        try:
+            if bpy.app.timers.is_registered(timer):
+                bpy.app.timers.unregister(timer)
+        except Exception:
+            pass
+    # Pooled keep-alive sockets would otherwise outlive an addon reload
+    _close_https_connections()
+    _unregister_classes()
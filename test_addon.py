@@ -31,11 +31,67 @@ def test_addon_registration():
         return False
 
 
+def test_flex_hover_follows_in_place_edit():
+    """Test that Flex hover picking follows control points edited in place"""
+    from types import SimpleNamespace
+    from mathutils import Matrix, Quaternion, Vector
+    
+    try:
+        bpy.ops.preferences.addon_enable(module="super_tools")
+        from super_tools.utils.flex_state import state
+        from super_tools.utils import flex_math
+    except Exception as e:
+        print(f"ERROR: {e}")
+        return False
+    
+    # Identity projection on a 200x200 region: (x, y, z) lands at ((x + 1) * 100, (y + 1) * 100)
+    context = SimpleNamespace(
+        region=SimpleNamespace(width=200, height=200),
+        region_data=SimpleNamespace(perspective_matrix=Matrix.Identity(4), view_rotation=Quaternion()),
+    )
+    saved = (state.points_3d, state.point_radii_3d, state.object_matrix_world, state.screen_cache)
+    try:
+        state.points_3d = [Vector((0.0, 0.0, 0.0))]
+        state.point_radii_3d = [0.1]
+        state.object_matrix_world = None
+        state.screen_cache = None
+        checks = [flex_math.find_closest_point(context, (100, 100), state.points_3d) == 0]
+        
+        # Move the only point the way the drag handler does: in place, invalidating the cached
+        # point array but without update_preview_mesh (it returns early below 2 points anyway)
+        state.points_3d[0] = Vector((0.5, 0.5, 0.0))
+        state.invalidate_curve_xyz()
+        checks.append(flex_math.find_closest_point(context, (150, 150), state.points_3d) == 0)
+        checks.append(flex_math.find_closest_point(context, (100, 100), state.points_3d) == -1)
+        checks.append(flex_math.find_closest_point_with_screen_radius(
+            context, (150, 150), state.points_3d, state.point_radii_3d) == 0)
+        
+        # Mutating the Vector itself, then invalidating, must be picked up too
+        state.points_3d[0].x = -0.5
+        state.invalidate_curve_xyz()
+        checks.append(flex_math.find_closest_point(context, (50, 150), state.points_3d) == 0)
+        checks.append(flex_math.find_closest_point_with_screen_radius(
+            context, (50, 150), state.points_3d, state.point_radii_3d) == 0)
+        
+        if all(checks):
+            print("Flex hover follows in-place point edits")
+            return True
+        print(f"ERROR: stale Flex hover results {checks}")
+        return False
+    except Exception as e:
+        print(f"ERROR: {e}")
+        return False
+    finally:
+        state.points_3d, state.point_radii_3d, state.object_matrix_world, state.screen_cache = saved
+        bpy.ops.preferences.addon_disable(module="super_tools")
+
+
 def run_tests():
     """Run all tests"""
     print("Running Super Extrude addon tests...")
     
     success = test_addon_registration()
+    success = test_flex_hover_follows_in_place_edit() and success
     
     if success:
         print("All tests passed!")
@@ -1,6 +1,7 @@
 import bpy
 from bpy.types import Panel
 
+from ..preferences import _get_local_version_tuple
 from ..utils.align_locators import SCENE_PROP_SIZE
 
 
@@ -24,16 +25,10 @@ class SUPERTOOLS_PT_main_panel(Panel):
 
 # Append version to the main panel title so it appears inline and left-aligned
 def _supertools_version_suffix():
-    try:
-        import importlib
-        pkg = importlib.import_module('super_tools')
-        bl = getattr(pkg, 'bl_info', None)
-        if isinstance(bl, dict):
-            ver = bl.get('version')
-            if isinstance(ver, (tuple, list)) and len(ver) >= 3:
-                return f" v{ver[0]}.{ver[1]}.{ver[2]}"
-    except Exception:
-        return ""
+    # Shares the cached bl_info lookup used by the updater
+    ver = _get_local_version_tuple()
+    if ver != (0, 0, 0):
+        return f" v{ver[0]}.{ver[1]}.{ver[2]}"
     return ""
 
 
@@ -52,6 +47,15 @@ def is_flex_mesh(obj):
     return "flex_curve_data" in obj
 
 
+def draw_flex_button(layout, context):
+    """Flex button with dynamic label, shared by the Modeling and Sculpt panels."""
+    active_obj = context.active_object
+    if active_obj and active_obj.select_get() and is_flex_mesh(active_obj):
+        layout.operator("mesh.flex_create", text="ReFlex Mesh", icon="MESH_CAPSULE")
+    else:
+        layout.operator("mesh.flex_create", text="Create Flex Mesh", icon="MESH_CAPSULE")
+
+
 class SUPERTOOLS_PT_modeling_panel(Panel):
     bl_label = "Modeling"
     bl_idname = "SUPERTOOLS_PT_modeling_panel"
@@ -66,12 +70,7 @@ class SUPERTOOLS_PT_modeling_panel(Panel):
         layout = self.layout
         col = layout.column(align=True)
         
-        # Flex button with dynamic label
-        active_obj = context.active_object
-        if active_obj and active_obj.select_get() and is_flex_mesh(active_obj):
-            col.operator("mesh.flex_create", text="ReFlex Mesh", icon="MESH_CAPSULE")
-        else:
-            col.operator("mesh.flex_create", text="Create Flex Mesh", icon="MESH_CAPSULE")
+        draw_flex_button(col, context)
         
         col.operator("mesh.super_extrude_modal", text="Super Extrude")
         col.operator("mesh.super_orient_modal", text="Super Orient")
@@ -91,12 +90,7 @@ class SUPERTOOLS_PT_sculpt_panel(Panel):
         layout = self.layout
         col = layout.column(align=True)
         
-        # Flex button with dynamic label
-        active_obj = context.active_object
-        if active_obj and active_obj.select_get() and is_flex_mesh(active_obj):
-            col.operator("mesh.flex_create", text="ReFlex Mesh", icon="MESH_CAPSULE")
-        else:
-            col.operator("mesh.flex_create", text="Create Flex Mesh", icon="MESH_CAPSULE")
+        draw_flex_button(col, context)
         
         col.separator()
         op = col.operator("sculpt.super_duplicate", text="Super Duplicate")
@@ -115,12 +109,17 @@ class SUPERTOOLS_PT_align_panel(Panel):
     bl_options = {'DEFAULT_CLOSED'}
     bl_order = 2
 
+    # Scene property availability, probed once in register()
+    _has_size = False
+    _has_allow_scale = False
+    _has_trim_ratio = False
+
     def draw(self, context):
         layout = self.layout
         col = layout.column(align=True)
         col.label(text="Alignment Points")
         # Size slider (absolute diameter in world units)
-        if hasattr(context.scene, SCENE_PROP_SIZE):
+        if self._has_size:
             col.prop(context.scene, SCENE_PROP_SIZE, text="Locator Size (m)", slider=True)
         col.operator("super_tools.plot_points", text="Plot A/B/C Points")
         col.operator("super_tools.delete_points_selected", text="Delete Points (Selected)")
@@ -137,8 +136,10 @@ class SUPERTOOLS_PT_align_panel(Panel):
                 text="ICP Target Group",
             )
         # ICP option: allow uniform scale during alignment
-        if hasattr(context.scene, "superalign_icp_allow_scale"):
+        if self._has_allow_scale:
             col.prop(context.scene, "superalign_icp_allow_scale", text="Allow Scale")
+        if self._has_trim_ratio:
+            col.prop(context.scene, "superalign_icp_trim_ratio", text="ICP Trim Ratio", slider=True)
         col.operator("super_tools.icp_align_modal", text="ICP Align (ESC to stop)")
         col.operator("super_tools.cpd_align_modal", text="CPD Align (ESC to stop)")
 
@@ -161,17 +162,21 @@ class SUPERTOOLS_PT_utilities_panel(Panel):
         col.operator("super_tools.mesh_flipbook", text="Toggle Sequential Vis")
 
 
+classes = (
+    SUPERTOOLS_PT_main_panel,
+    SUPERTOOLS_PT_modeling_panel,
+    SUPERTOOLS_PT_sculpt_panel,
+    SUPERTOOLS_PT_align_panel,
+    SUPERTOOLS_PT_utilities_panel,
+)
+
+
+_register_classes, unregister = bpy.utils.register_classes_factory(classes)
+
+
 def register():
-    bpy.utils.register_class(SUPERTOOLS_PT_main_panel)
-    bpy.utils.register_class(SUPERTOOLS_PT_modeling_panel)
-    bpy.utils.register_class(SUPERTOOLS_PT_sculpt_panel)
-    bpy.utils.register_class(SUPERTOOLS_PT_align_panel)
-    bpy.utils.register_class(SUPERTOOLS_PT_utilities_panel)
-
-
-def unregister():
-    bpy.utils.unregister_class(SUPERTOOLS_PT_utilities_panel)
-    bpy.utils.unregister_class(SUPERTOOLS_PT_align_panel)
-    bpy.utils.unregister_class(SUPERTOOLS_PT_sculpt_panel)
-    bpy.utils.unregister_class(SUPERTOOLS_PT_modeling_panel)
-    bpy.utils.unregister_class(SUPERTOOLS_PT_main_panel)
+    # Scene properties are registered by utils.align_locators / utils.align_props before this module
+    SUPERTOOLS_PT_align_panel._has_size = hasattr(bpy.types.Scene, SCENE_PROP_SIZE)
+    SUPERTOOLS_PT_align_panel._has_allow_scale = hasattr(bpy.types.Scene, "superalign_icp_allow_scale")
+    SUPERTOOLS_PT_align_panel._has_trim_ratio = hasattr(bpy.types.Scene, "superalign_icp_trim_ratio")
+    _register_classes()
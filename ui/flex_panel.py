@@ -1,12 +1,15 @@
 """
 UI Panel for the Flex tool in Super Tools addon.
 """
+import functools
+
 import bpy
 from ..utils.flex_state import FlexState
 
 
 def get_prefs():
     """Get addon preferences."""
+    # Looked up on every call: RNA structs other than IDs must not be kept across redraws
     try:
         addon_prefs = bpy.context.preferences.addons.get("super_tools")
         if addon_prefs:
@@ -16,6 +19,19 @@ def get_prefs():
     return None
 
 
+@functools.lru_cache(maxsize=8)
+def _switch_combo(key, ctrl, alt, shift):
+    """Hotkey label such as 'Alt+Q' for the switch-mesh shortcut."""
+    combo = ""
+    if ctrl:
+        combo += "Ctrl+"
+    if alt:
+        combo += "Alt+"
+    if shift:
+        combo += "Shift+"
+    return combo + key
+
+
 class VIEW3D_PT_flex_panel(bpy.types.Panel):
     """Creates a Panel in the 3D View for Flex settings"""
     bl_label = "Flex Settings"
@@ -75,15 +91,7 @@ class VIEW3D_PT_flex_shortcuts(bpy.types.Panel):
         switch_ctrl = getattr(prefs, 'flex_key_switch_mesh_ctrl', False) if prefs else False
         switch_alt = getattr(prefs, 'flex_key_switch_mesh_alt', True) if prefs else True
         switch_shift = getattr(prefs, 'flex_key_switch_mesh_shift', False) if prefs else False
-        
-        switch_combo = ""
-        if switch_ctrl:
-            switch_combo += "Ctrl+"
-        if switch_alt:
-            switch_combo += "Alt+"
-        if switch_shift:
-            switch_combo += "Shift+"
-        switch_combo += key_switch
+        switch_combo = _switch_combo(key_switch, switch_ctrl, switch_alt, switch_shift)
         
         col.label(text="LMB: Add/drag point")
         col.label(text="RMB: Delete point / Scale radius")
@@ -110,11 +118,12 @@ classes = (
 )
 
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
+
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    _register_classes()
 
 
 def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    _unregister_classes()
@@ -0,0 +1,68 @@
+import numpy as np
+
+# Optional Numba kernels for the CPD E-step. Numba is not bundled with Blender;
+# when it is missing align_cpd uses its NumPy path instead.
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def estep(X, Y, inv_2sigma2, c):
+        """
+        Fused CPD E-step returning only the M-step sufficient statistics.
+        X: (N,3) fixed, Y: (M,3) moving, both float64 C-contiguous.
+        Returns (P1 (M,), Pt1 (N,), PX (M,3)) with P1 = P^T 1, Pt1 = P 1, PX = P^T X,
+        without ever storing the (N,M) posterior P.
+        """
+        N = X.shape[0]
+        M = Y.shape[0]
+
+        # Pass 1 (parallel over rows): normalizer of each row of P
+        den = np.empty(N)
+        Pt1 = np.empty(N)
+        for n in prange(N):
+            x0 = X[n, 0]
+            x1 = X[n, 1]
+            x2 = X[n, 2]
+            s = 0.0
+            for m in range(M):
+                d0 = x0 - Y[m, 0]
+                d1 = x1 - Y[m, 1]
+                d2 = x2 - Y[m, 2]
+                s += np.exp(-(d0 * d0 + d1 * d1 + d2 * d2) * inv_2sigma2)
+            d = max(s + c, 1e-12)
+            den[n] = d
+            Pt1[n] = s / d
+
+        # Pass 2 (parallel over columns): column sums and P^T X, no shared accumulators
+        P1 = np.empty(M)
+        PX = np.empty((M, 3))
+        for m in prange(M):
+            y0 = Y[m, 0]
+            y1 = Y[m, 1]
+            y2 = Y[m, 2]
+            acc = 0.0
+            a0 = 0.0
+            a1 = 0.0
+            a2 = 0.0
+            for n in range(N):
+                d0 = X[n, 0] - y0
+                d1 = X[n, 1] - y1
+                d2 = X[n, 2] - y2
+                p = np.exp(-(d0 * d0 + d1 * d1 + d2 * d2) * inv_2sigma2) / den[n]
+                acc += p
+                a0 += p * X[n, 0]
+                a1 += p * X[n, 1]
+                a2 += p * X[n, 2]
+            P1[m] = acc
+            PX[m, 0] = a0
+            PX[m, 1] = a1
+            PX[m, 2] = a2
+
+        return P1, Pt1, PX
+else:
+    estep = None
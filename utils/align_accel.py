@@ -0,0 +1,75 @@
+import numpy as np
+from collections import deque
+
+# Anderson acceleration for the alignment fixed-point loops.
+# A rigid/similarity transform is carried as a 12-vector (the top 3x4 block of a
+# 4x4 matrix). Mixed iterates are projected back onto s*R + t afterwards.
+
+
+class AndersonAccelerator:
+    """
+    Type-II Anderson acceleration of a fixed-point iteration x -> g(x).
+    Call step(x_k, g_k) once per iteration with the current parameters and the
+    parameters produced by one plain step; it returns the next iterate.
+    Falls back to the plain step whenever the residual grows.
+    """
+
+    def __init__(self, m: int = 5, reg: float = 1e-10):
+        self.m = max(1, int(m))
+        self.reg = float(reg)
+        self.reset()
+
+    def reset(self) -> None:
+        self._G = deque(maxlen=self.m + 1)
+        self._F = deque(maxlen=self.m + 1)
+        self._last_res = None
+
+    def step(self, x, g) -> np.ndarray:
+        x = np.asarray(x, dtype=np.float64).ravel()
+        g = np.asarray(g, dtype=np.float64).ravel()
+        f = g - x
+        res = float(np.linalg.norm(f))
+        # Safeguard: the previous mixed iterate increased the residual; restart from plain Picard
+        if self._last_res is not None and res > self._last_res:
+            self._G.clear()
+            self._F.clear()
+        self._last_res = res
+        self._G.append(g)
+        self._F.append(f)
+        if len(self._F) < 2:
+            return g
+
+        dF = np.diff(np.stack(self._F, axis=1), axis=1)   # (n, k)
+        dG = np.diff(np.stack(self._G, axis=1), axis=1)   # (n, k)
+        # gamma = argmin ||f - dF gamma||, with a small ridge term for stability
+        H = dF.T @ dF
+        H[np.diag_indices_from(H)] += self.reg * max(float(np.trace(H)), 1.0)
+        try:
+            gamma = np.linalg.solve(H, dF.T @ f)
+        except np.linalg.LinAlgError:
+            self._G.clear()
+            self._F.clear()
+            return g
+        return g - dG @ gamma
+
+
+def matrix_to_params(M) -> np.ndarray:
+    """Flatten the top 3x4 block of a 4x4 transform into a 12-vector."""
+    return np.array(M, dtype=np.float64)[:3, :4].ravel()
+
+
+def params_to_matrix(p, allow_scale: bool = False) -> np.ndarray:
+    """
+    Rebuild a 4x4 transform from a 12-vector, projecting the 3x3 block onto the
+    nearest rotation (times the mean singular value when allow_scale is True).
+    """
+    B = np.asarray(p, dtype=np.float64).reshape(3, 4)
+    U, S, Vt = np.linalg.svd(B[:, :3])
+    C = np.eye(3)
+    if np.linalg.det(U @ Vt) < 0:
+        C[-1, -1] = -1
+    s = float(np.mean(S)) if allow_scale else 1.0
+    M = np.eye(4)
+    M[:3, :3] = s * (U @ C @ Vt)
+    M[:3, 3] = B[:, 3]
+    return M
@@ -2,9 +2,26 @@ import numpy as np
 from mathutils import Matrix, Vector
 from typing import Tuple
 
+from . import _cpd_kernels
+
+# Optional GPU path. CuPy is not bundled with Blender; without it the CPU paths are used.
+try:
+    import cupy as cp
+    HAS_CUPY = True
+except Exception:
+    cp = None
+    HAS_CUPY = False
+
 # Rigid/Similarity CPD step adapted for NumPy. We move Y towards X.
 # X: (N,3) fixed target points. Y: (M,3) moving source points.
 
+# Rows of X processed per E-step block in the NumPy path; bounds the temporaries
+# to _ESTEP_BLOCK x M instead of N x M and keeps each block in L2/L3.
+_ESTEP_BLOCK = 512
+
+# Smallest N*M worth the host/device round trip on the GPU path.
+_GPU_MIN_PAIRS = 1_000_000
+
 
 def _init_sigma2(Y: np.ndarray, X: np.ndarray) -> float:
     if X.size == 0 or Y.size == 0:
@@ -18,12 +35,35 @@ def _init_sigma2(Y: np.ndarray, X: np.ndarray) -> float:
     return max(sigma2, 1e-6)
 
 
+def _estep_gpu(X: np.ndarray, Y: np.ndarray, sigma2: float, c: float):
+    """CPD E-step on the GPU with CuPy (float32). Returns NumPy (P1, Pt1, PX)."""
+    origin = X.mean(axis=0)
+    Xg = cp.asarray(X - origin, dtype=cp.float32)
+    Yg = cp.asarray(Y - origin, dtype=cp.float32)
+    x2 = cp.einsum('ij,ij->i', Xg, Xg)[:, None]
+    y2 = cp.einsum('ij,ij->i', Yg, Yg)[None, :]
+    K = Xg @ Yg.T
+    K *= -2.0
+    K += x2
+    K += y2
+    K *= -0.5 / sigma2
+    cp.exp(K, out=K)
+    den = cp.maximum(K.sum(axis=1, keepdims=True, dtype=cp.float64) + c, 1e-12)
+    K /= den.astype(cp.float32)
+    # Reductions accumulate in float64; P1 is scaled by the origin offset below
+    P1 = cp.asnumpy(K.sum(axis=0, dtype=cp.float64))
+    Pt1 = cp.asnumpy(K.sum(axis=1, dtype=cp.float64))
+    PXc = cp.asnumpy(K.T @ Xg).astype(np.float64)
+    return P1, Pt1, PXc + P1[:, None] * origin
+
+
 def cpd_rigid_step(
     Y: np.ndarray,  # (M,3) moving
     X: np.ndarray,  # (N,3) fixed
     sigma2: float | None = None,
     w: float = 0.0,
     allow_scale: bool = False,
+    use_gpu: bool = False,
 ) -> Tuple[Matrix, float, Vector, float, float, int]:
     """
     Perform one CPD rigid/similarity EM step that transforms Y towards X.
@@ -34,36 +74,70 @@ def cpd_rigid_step(
     - sigma2_new: updated variance
     - Np: effective inlier count (float)
     - outlier_count: estimated number of outlier correspondences
+    With use_gpu, the E-step runs on CuPy when it is installed and N*M is large enough.
     """
     if X.ndim != 2 or Y.ndim != 2:
         raise ValueError("X and Y must be 2D arrays")
     if X.shape[1] != 3 or Y.shape[1] != 3:
         raise ValueError("X and Y must have shape (*, 3)")
 
+    # C-contiguous float64 so the GEMMs and kernels take their fast paths
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    Y = np.ascontiguousarray(Y, dtype=np.float64)
+
     N, D = X.shape
     M, _ = Y.shape
 
     if sigma2 is None or sigma2 <= 0:
         sigma2 = _init_sigma2(Y, X)
 
-    # E-step: posterior P (N x M). Normalize each row (per X_n) with outlier term.
+    # E-step: posterior P (N x M), reduced to P1, Pt1 and P^T X as it is computed.
+    # Each row (per X_n) is normalized with the outlier term.
     # c = (2*pi*sigma2)^{D/2} * w/(1-w) * M/N
     c = (2.0 * np.pi * sigma2) ** (D / 2.0) * (w / max(1.0 - w, 1e-9)) * (M / max(N, 1))
 
-    # Pairwise squared distances D2[n, m] = ||X_n - Y_m||^2
-    x2 = np.sum(X**2, axis=1, keepdims=True)      # (N,1)
-    y2 = np.sum(Y**2, axis=1, keepdims=True).T    # (1,M)
-    D2 = x2 + y2 - 2.0 * (X @ Y.T)               # (N,M)
-
-    K = np.exp(-D2 / (2.0 * sigma2))             # (N,M)
-    den = K.sum(axis=1, keepdims=True) + c       # (N,1)
-    den = np.maximum(den, 1e-12)
-    P = K / den                                   # (N,M)
-    P = np.nan_to_num(P, nan=0.0, posinf=0.0, neginf=0.0)
+    if use_gpu and HAS_CUPY and N * M > _GPU_MIN_PAIRS:
+        P1, Pt1, PX = _estep_gpu(X, Y, float(sigma2), float(c))
+    elif _cpd_kernels.HAS_NUMBA:
+        # Fused kernel: sufficient statistics only, P is never materialized
+        P1, Pt1, PX = _cpd_kernels.estep(
+            X,
+            Y,
+            1.0 / (2.0 * sigma2),
+            float(c),
+        )
+    else:
+        # Stream over row blocks of X so the (N,M) posterior is never allocated. Each block's
+        # distances, kernel and posterior share one (B,M) buffer that stays cache resident.
+        # The N*M work runs in float32 on coordinates re-centred at X's mean (limits the
+        # cancellation in x2 + y2 - 2xy); the per-block sums are accumulated in float64.
+        origin = X.mean(axis=0)
+        Xf = (X - origin).astype(np.float32)
+        Yf = (Y - origin).astype(np.float32)
+        y2 = np.einsum('ij,ij->i', Yf, Yf)[None, :]  # (1,M)
+        neg_inv_2s2 = np.float32(-0.5 / sigma2)
+        P1 = np.zeros(M)                              # (M,)
+        Pt1 = np.empty(N)                             # (N,)
+        PXc = np.zeros((M, D))                        # (M,3), P^T (X - origin)
+        for n0 in range(0, N, _ESTEP_BLOCK):
+            Xb = Xf[n0:n0 + _ESTEP_BLOCK]             # (B,3)
+            # Squared distances D2[n, m] = ||X_n - Y_m||^2 for this block
+            buf = Xb @ Yf.T                           # (B,M)
+            buf *= np.float32(-2.0)
+            buf += np.einsum('ij,ij->i', Xb, Xb)[:, None]
+            buf += y2
+            buf *= neg_inv_2s2
+            np.exp(buf, out=buf)                      # K
+            den = buf.sum(axis=1, keepdims=True, dtype=np.float64)
+            den += c
+            np.maximum(den, 1e-12, out=den)
+            buf /= den.astype(np.float32)             # P block
+            np.nan_to_num(buf, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+            P1 += buf.sum(axis=0, dtype=np.float64)
+            Pt1[n0:n0 + _ESTEP_BLOCK] = buf.sum(axis=1, dtype=np.float64)
+            PXc += buf.T @ Xb
+        PX = PXc + P1[:, None] * origin               # P^T X
 
-    # Column/row sums
-    P1 = P.sum(axis=0)          # (M,)
-    Pt1 = P.sum(axis=1)         # (N,)
     Np = float(P1.sum())        # scalar
     if Np < 3.0:
         # Not enough effective correspondences; gently increase sigma2 and do no-op transform
@@ -78,8 +152,11 @@ def cpd_rigid_step(
     Xc = X - mu_x
     Yc = Y - mu_y
 
-    # Compute cross-covariance A = Xc^T P Yc
-    A = Xc.T @ (P @ Yc)
+    # trace(Yc^T diag(P1) Yc) = sum_m P1_m * ||Yc_m||^2, shared by the scale and variance updates
+    trY = float(P1 @ np.einsum('ij,ij->i', Yc, Yc))
+
+    # Cross-covariance A = Xc^T P Yc = X^T P Y - Np mu_x mu_y^T, with X^T P Y = PX^T Y
+    A = PX.T @ Y - Np * np.outer(mu_x, mu_y)
 
     # SVD for rotation
     try:
@@ -96,9 +173,7 @@ def cpd_rigid_step(
     # Scale
     if allow_scale:
         num = np.sum(Svals * C.diagonal())
-        # trace(Yc^T diag(P1) Yc) = sum_m P1_m * ||Yc_m||^2
-        den_scale = float(np.sum(P1[:, None] * (Yc ** 2)))
-        den_scale = den_scale if den_scale > 1e-16 else 1.0
+        den_scale = trY if trY > 1e-16 else 1.0
         s = num / den_scale
     else:
         s = 1.0
@@ -107,8 +182,7 @@ def cpd_rigid_step(
     t_np = mu_x - s * (R_np @ mu_y)
 
     # Update sigma^2
-    trX = float(np.sum(Pt1[:, None] * (Xc ** 2)))
-    trY = float(np.sum(P1[:, None] * (Yc ** 2)))
+    trX = float(Pt1 @ np.einsum('ij,ij->i', Xc, Xc))
     sigma2_new = (trX + s * s * trY - 2.0 * s * np.sum(Svals * C.diagonal())) / (Np * D + 1e-9)
     # Clamp sigma2 to reasonable range to avoid collapse/explosion
     sigma2_new = float(np.clip(sigma2_new, 1e-8, 1e6))
@@ -117,6 +191,6 @@ def cpd_rigid_step(
     # Rough outlier estimate: fraction controlled by w over total correspondences
     outliers = int(round(w * N)) if N > 0 else 0
 
-    R = Matrix((Vector(R_np[0]), Vector(R_np[1]), Vector(R_np[2])))
+    R = Matrix(R_np.tolist())
     t = Vector(t_np.tolist())
     return R, float(s), t, float(sigma2_new), float(Np), int(outliers)
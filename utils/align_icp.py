@@ -1,19 +1,64 @@
 import bpy
 import numpy as np
+from dataclasses import dataclass
 from mathutils import Matrix, Vector
 from mathutils.kdtree import KDTree
 from typing import Tuple
 
+try:
+    from scipy.spatial import cKDTree
+    HAS_SCIPY = True
+except Exception:
+    cKDTree = None
+    HAS_SCIPY = False
+
+
+def _mesh_coords_world(obj: bpy.types.Object) -> np.ndarray:
+    """Return (V,3) world-space coordinates of all mesh vertices via one foreach_get."""
+    mesh = obj.data
+    n = len(mesh.vertices)
+    buf = np.empty(n * 3, dtype=np.float64)
+    mesh.vertices.foreach_get("co", buf)
+    local = buf.reshape(n, 3)
+    M = np.array(obj.matrix_world, dtype=np.float64)
+    return local @ M[:3, :3].T + M[:3, 3]
+
+
+def voxel_downsample(points: np.ndarray, voxel: float) -> np.ndarray:
+    """
+    Replace all points falling in the same cube of edge `voxel` by their centroid.
+    Keeps spatial coverage, unlike random subsampling. Returns (K,3), K <= N.
+    """
+    if voxel <= 0.0 or points.shape[0] == 0:
+        return points
+    keys = np.floor(points / voxel).astype(np.int64)
+    keys -= keys.min(axis=0)
+    span = keys.max(axis=0) + 1
+    if float(span[0]) * float(span[1]) * float(span[2]) < 2.0 ** 62:
+        # Exact linear voxel id
+        flat = (keys[:, 0] * span[1] + keys[:, 1]) * span[2] + keys[:, 2]
+        _, inv = np.unique(flat, return_inverse=True)
+    else:
+        _, inv = np.unique(keys, axis=0, return_inverse=True)
+    inv = inv.ravel()
+    counts = np.bincount(inv).astype(np.float64)
+    out = np.empty((counts.shape[0], 3), dtype=np.float64)
+    for k in range(3):
+        out[:, k] = np.bincount(inv, weights=points[:, k]) / counts
+    return out
+
 
 def sample_object_vertices_world(
     obj: bpy.types.Object,
     max_points: int = 5000,
     seed: int = 0,
     vgroup_name: str | None = None,
+    voxel_size: float = 0.0,
 ) -> np.ndarray:
     """
     Return Nx3 numpy array of world-space vertex positions from a mesh object.
-    If vertex count exceeds max_points, randomly sample without replacement.
+    If vertex count exceeds max_points, the points are first merged on a voxel grid
+    (when voxel_size > 0), then randomly sampled without replacement if still too many.
     """
     if obj is None or obj.type != 'MESH' or obj.data is None:
         return np.zeros((0, 3), dtype=np.float64)
@@ -22,25 +67,36 @@ def sample_object_vertices_world(
     # Optionally restrict to vertices that have weight in a named vertex group
     if vgroup_name and obj.vertex_groups and vgroup_name in obj.vertex_groups:
         gidx = obj.vertex_groups[vgroup_name].index
-        sel = []
-        for v in mesh.vertices:
-            has = any((g.group == gidx and g.weight > 0.0) for g in v.groups)
-            if has:
-                co = obj.matrix_world @ v.co
-                sel.append((co.x, co.y, co.z))
-        coords_ws = np.array(sel, dtype=np.float64)
+        # Group weights have no bulk accessor, so membership is one Python pass;
+        # coordinates still come from a single foreach_get
+        mask = np.fromiter(
+            (any((g.group == gidx and g.weight > 0.0) for g in v.groups) for v in mesh.vertices),
+            dtype=bool,
+            count=len(mesh.vertices),
+        )
+        coords_ws = _mesh_coords_world(obj)[mask]
     else:
-        coords_ws = np.array([tuple(obj.matrix_world @ v.co) for v in mesh.vertices], dtype=np.float64)
+        coords_ws = _mesh_coords_world(obj)
     n = coords_ws.shape[0]
     if n <= max_points:
         return coords_ws
+    if voxel_size > 0.0:
+        coords_ws = voxel_downsample(coords_ws, voxel_size)
+        n = coords_ws.shape[0]
+        if n <= max_points:
+            return coords_ws
     rng = np.random.default_rng(seed)
     idx = rng.choice(n, size=max_points, replace=False)
     return coords_ws[idx]
 
 
-def build_kdtree(points: np.ndarray) -> KDTree:
-    """Build a KDTree from Nx3 numpy array of points."""
+def build_kdtree(points: np.ndarray):
+    """Build a KDTree from Nx3 numpy array of points.
+
+    Uses SciPy's cKDTree (batched C queries) when available, else mathutils KDTree.
+    """
+    if HAS_SCIPY:
+        return cKDTree(np.asarray(points, dtype=np.float64), balanced_tree=True, compact_nodes=True)
     tree = KDTree(points.shape[0])
     for i, (x, y, z) in enumerate(points):
         tree.insert((x, y, z), i)
@@ -48,11 +104,40 @@ def build_kdtree(points: np.ndarray) -> KDTree:
     return tree
 
 
-def nearest_neighbors(src_pts: np.ndarray, kd: KDTree) -> Tuple[np.ndarray, np.ndarray]:
+@dataclass
+class TargetIndex:
+    """
+    Nearest-neighbour index over a fixed set of target points, built once per
+    registration run. Any change to the target points invalidates it; rebuild
+    with build_target_index.
+    """
+
+    points: np.ndarray
+    tree: object
+
+
+def build_target_index(points: np.ndarray) -> TargetIndex:
+    """Build a TargetIndex (points + KD-tree) for repeated nearest_neighbors queries."""
+    points = np.asarray(points, dtype=np.float64)
+    return TargetIndex(points=points, tree=build_kdtree(points))
+
+
+def nearest_neighbors(src_pts: np.ndarray, kd) -> Tuple[np.ndarray, np.ndarray]:
     """
-    For each source point, query nearest neighbor in kd.
+    For each source point, query nearest neighbor in kd (a TargetIndex or a tree
+    from build_kdtree).
     Returns (matches, distances) where matches is Nx3 numpy array.
     """
+    if isinstance(kd, TargetIndex):
+        kd = kd.tree
+    if not isinstance(kd, KDTree):
+        # cKDTree: one batched query for all points
+        try:
+            dists, idx = kd.query(src_pts, k=1, workers=-1)
+        except TypeError:
+            # SciPy < 1.6 has no 'workers' argument
+            dists, idx = kd.query(src_pts, k=1)
+        return kd.data[idx], np.asarray(dists, dtype=np.float64)
     matches = np.empty_like(src_pts)
     dists = np.empty((src_pts.shape[0],), dtype=np.float64)
     for i, (x, y, z) in enumerate(src_pts):
@@ -62,6 +147,40 @@ def nearest_neighbors(src_pts: np.ndarray, kd: KDTree) -> Tuple[np.ndarray, np.n
     return matches, dists
 
 
+def horn_rotation(H: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    Closed-form rotation R maximizing trace(R @ H) for H = sum_i a_i b_i^T (Horn 1987),
+    i.e. the R that best rotates centered points a_i onto b_i.
+    Returns (R as 3x3 ndarray, trace(R @ H)). Falls back to SVD if the 4x4 eigen-solve fails.
+    """
+    (Sxx, Sxy, Sxz), (Syx, Syy, Syz), (Szx, Szy, Szz) = H.tolist()
+    N = np.array((
+        (Sxx + Syy + Szz, Syz - Szy, Szx - Sxz, Sxy - Syx),
+        (Syz - Szy, Sxx - Syy - Szz, Sxy + Syx, Szx + Sxz),
+        (Szx - Sxz, Sxy + Syx, -Sxx + Syy - Szz, Syz + Szy),
+        (Sxy - Syx, Szx + Sxz, Syz + Szy, -Sxx - Syy + Szz),
+    ))
+    try:
+        w, v = np.linalg.eigh(N)
+        if not np.isfinite(w[-1]):
+            raise np.linalg.LinAlgError("non-finite eigenvalue")
+        # Top eigenvector is the optimal unit quaternion (w, x, y, z)
+        q0, qx, qy, qz = v[:, -1].tolist()
+        R = np.array((
+            (1.0 - 2.0 * (qy * qy + qz * qz), 2.0 * (qx * qy - q0 * qz), 2.0 * (qx * qz + q0 * qy)),
+            (2.0 * (qx * qy + q0 * qz), 1.0 - 2.0 * (qx * qx + qz * qz), 2.0 * (qy * qz - q0 * qx)),
+            (2.0 * (qx * qz - q0 * qy), 2.0 * (qy * qz + q0 * qx), 1.0 - 2.0 * (qx * qx + qy * qy)),
+        ))
+        return R, float(w[-1])
+    except np.linalg.LinAlgError:
+        U, S, Vt = np.linalg.svd(H)
+        R = Vt.T @ U.T
+        if np.linalg.det(R) < 0:
+            Vt[-1, :] *= -1
+            R = Vt.T @ U.T
+        return R, float(np.trace(R @ H))
+
+
 def kabsch_rigid_transform(A: np.ndarray, B: np.ndarray) -> Tuple[Matrix, Vector]:
     """
     Compute rigid transform R, t that best aligns A to B (both Nx3).
@@ -76,25 +195,28 @@ def kabsch_rigid_transform(A: np.ndarray, B: np.ndarray) -> Tuple[Matrix, Vector
     BB = B - centroid_B
     # Covariance
     H = AA.T @ BB
-    U, S, Vt = np.linalg.svd(H)
-    R = Vt.T @ U.T
-    # Reflection fix
-    if np.linalg.det(R) < 0:
-        Vt[-1, :] *= -1
-        R = Vt.T @ U.T
+    R, _ = horn_rotation(H)
     t = centroid_B - R @ centroid_A
-    Rm = Matrix((Vector(R[0]), Vector(R[1]), Vector(R[2])))
+    Rm = Matrix(R.tolist())
     tv = Vector(t.tolist())
     return Rm, tv
 
 
+def compose_rigid_np(R, t, s: float = 1.0) -> np.ndarray:
+    """
+    Build the 4x4 NumPy matrix T @ R @ S for rotation R, translation t and uniform scale s.
+    Lets callers accumulate transforms in NumPy and write matrix_world once.
+    """
+    M = np.eye(4)
+    M[:3, :3] = np.array(R, dtype=np.float64) * s
+    M[:3, 3] = np.array(t, dtype=np.float64)
+    return M
+
+
 def apply_rigid_transform_to_object(obj: bpy.types.Object, R: Matrix, t: Vector) -> None:
     """Apply world-space rigid transform to object's matrix_world in-place."""
-    # Compose 4x4: T @ R
-    R4 = R.to_4x4()
-    T4 = Matrix.Translation(t)
-    M = T4 @ R4
-    obj.matrix_world = M @ obj.matrix_world
+    new = compose_rigid_np(R, t) @ np.array(obj.matrix_world, dtype=np.float64)
+    obj.matrix_world = Matrix(new.tolist())
 
 
 def procrustes_similarity_transform(A: np.ndarray, B: np.ndarray) -> Tuple[Matrix, float, Vector]:
@@ -109,22 +231,16 @@ def procrustes_similarity_transform(A: np.ndarray, B: np.ndarray) -> Tuple[Matri
     AA = A - centroid_A
     BB = B - centroid_B
     H = AA.T @ BB
-    U, S, Vt = np.linalg.svd(H)
-    R_np = Vt.T @ U.T
-    if np.linalg.det(R_np) < 0:
-        Vt[-1, :] *= -1
-        R_np = Vt.T @ U.T
+    R_np, tr = horn_rotation(H)
+    # trace(R H) equals the sign-corrected singular value sum of H
     denom = float((AA ** 2).sum())
-    s = 1.0 if denom < 1e-16 else (S.sum() / denom)
-    R = Matrix((Vector(R_np[0]), Vector(R_np[1]), Vector(R_np[2])))
+    s = 1.0 if denom < 1e-16 else (tr / denom)
+    R = Matrix(R_np.tolist())
     t = Vector((centroid_B - s * (R_np @ centroid_A)).tolist())
     return R, float(s), t
 
 
 def apply_similarity_transform_to_object(obj: bpy.types.Object, R: Matrix, s: float, t: Vector) -> None:
     """Apply world-space similarity transform (uniform scale s, rotation R, translation t)."""
-    R4 = R.to_4x4()
-    S4 = Matrix.Diagonal((s, s, s, 1.0))
-    T4 = Matrix.Translation(t)
-    M = T4 @ R4 @ S4
-    obj.matrix_world = M @ obj.matrix_world
+    new = compose_rigid_np(R, t, s) @ np.array(obj.matrix_world, dtype=np.float64)
+    obj.matrix_world = Matrix(new.tolist())
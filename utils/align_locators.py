@@ -1,5 +1,6 @@
 import bpy
 import bmesh
+import numpy as np
 from mathutils import Vector
 from typing import Optional
 
@@ -55,14 +56,28 @@ def get_global_diameter(context: Optional[bpy.types.Context] = None) -> float:
     return max(0.001, float(getattr(scn, SCENE_PROP_SIZE, 0.1)))
 
 
+# name_full -> (matrix_world key, radius); cleared in unregister_scene_properties
+_bbox_cache: dict[str, tuple[tuple, float]] = {}
+
+
 def _world_bbox_max_radius(obj: bpy.types.Object) -> float:
     if obj is None or not obj.bound_box:
         return 0.0
-    pts = [obj.matrix_world @ Vector(c) for c in obj.bound_box]
-    min_v = Vector((min(p.x for p in pts), min(p.y for p in pts), min(p.z for p in pts)))
-    max_v = Vector((max(p.x for p in pts), max(p.y for p in pts), max(p.z for p in pts)))
-    size = max_v - min_v
-    return 0.5 * max(size.x, size.y, size.z)
+    key = tuple(v for row in obj.matrix_world for v in row)
+    cached = _bbox_cache.get(obj.name_full)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    radius = _compute_world_bbox_max_radius(obj)
+    _bbox_cache[obj.name_full] = (key, radius)
+    return radius
+
+
+def _compute_world_bbox_max_radius(obj: bpy.types.Object) -> float:
+    # All 8 corners in one homogeneous matmul
+    corners = np.ones((8, 4), dtype=np.float64)
+    corners[:, :3] = [tuple(c) for c in obj.bound_box]
+    ws = corners @ np.array(obj.matrix_world, dtype=np.float64).T
+    return 0.5 * float(np.ptp(ws[:, :3], axis=0).max())
 
 
 def rescale_all_locators(context: Optional[bpy.types.Context] = None) -> None:
@@ -80,6 +95,9 @@ def rescale_all_locators(context: Optional[bpy.types.Context] = None) -> None:
             current_radius = _world_bbox_max_radius(loc)
             if current_radius <= 1e-9:
                 continue
+            # Already at the requested size; skip the RNA write
+            if abs(current_radius - desired_radius) < 1e-3 * desired_radius:
+                continue
             ratio = desired_radius / current_radius
             try:
                 loc.scale = (loc.scale.x * ratio, loc.scale.y * ratio, loc.scale.z * ratio)
@@ -114,6 +132,7 @@ def register_scene_properties():
 def unregister_scene_properties():
     if hasattr(bpy.types.Scene, SCENE_PROP_SIZE):
         delattr(bpy.types.Scene, SCENE_PROP_SIZE)
+    _bbox_cache.clear()
 
 
 def link_to_parent_collections(obj: bpy.types.Object, parent: Optional[bpy.types.Object]) -> None:
@@ -154,8 +173,9 @@ def create_locator(parent: bpy.types.Object, label: str, location: Vector) -> bp
             col_attr = mesh.color_attributes[VCOL_NAME]
         else:
             col_attr = mesh.color_attributes.new(name=VCOL_NAME, type='FLOAT_COLOR', domain='CORNER')
-        for i in range(len(col_attr.data)):
-            col_attr.data[i].color = rgba
+        # One bulk write for all corners
+        buf = np.tile(np.asarray(rgba, dtype=np.float32), len(col_attr.data))
+        col_attr.data.foreach_set("color", buf)
     except Exception:
         pass
 
@@ -1,7 +1,7 @@
 import bpy
 
 def register_scene_properties():
-    from bpy.props import StringProperty, BoolProperty
+    from bpy.props import StringProperty, BoolProperty, FloatProperty
     if not hasattr(bpy.types.Scene, "superalign_icp_target_group"):
         setattr(
             bpy.types.Scene,
@@ -23,12 +23,28 @@ def register_scene_properties():
             ),
         )
 
+    if not hasattr(bpy.types.Scene, "superalign_icp_trim_ratio"):
+        setattr(
+            bpy.types.Scene,
+            "superalign_icp_trim_ratio",
+            FloatProperty(
+                name="Trim Ratio",
+                description="Fraction of worst (longest) ICP matches discarded before each fit",
+                default=0.1,
+                min=0.0,
+                max=0.9,
+                subtype='FACTOR',
+            ),
+        )
+
 
 def unregister_scene_properties():
     if hasattr(bpy.types.Scene, "superalign_icp_target_group"):
         delattr(bpy.types.Scene, "superalign_icp_target_group")
     if hasattr(bpy.types.Scene, "superalign_icp_allow_scale"):
         delattr(bpy.types.Scene, "superalign_icp_allow_scale")
+    if hasattr(bpy.types.Scene, "superalign_icp_trim_ratio"):
+        delattr(bpy.types.Scene, "superalign_icp_trim_ratio")
 
 
 def register():
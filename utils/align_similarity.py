@@ -2,6 +2,43 @@ from mathutils import Vector, Matrix
 from typing import Tuple
 import numpy as np
 
+from .align_icp import horn_rotation
+
+
+def _triangle_rotation(X: np.ndarray, Y: np.ndarray):
+    """
+    Closed-form least-squares rotation for two edge vectors (columns of the 3x2 X, Y):
+    map the source triangle plane onto the target plane, then pick the in-plane angle
+    that best aligns both edges. Returns (R, trace(R X Y^T)) or None if either
+    triangle is (near-)degenerate.
+    """
+    xb, xc = X[:, 0], X[:, 1]
+    yb, yc = Y[:, 0], Y[:, 1]
+    ns = np.cross(xb, xc)
+    nt = np.cross(yb, yc)
+    ls, lt = float(np.linalg.norm(ns)), float(np.linalg.norm(nt))
+    lxb, lyb = float(np.linalg.norm(xb)), float(np.linalg.norm(yb))
+    if ls <= 1e-12 * lxb * float(np.linalg.norm(xc)) or lt <= 1e-12 * lyb * float(np.linalg.norm(yc)):
+        return None
+    # Orthonormal frames (edge B, in-plane perpendicular, normal)
+    u1 = xb / lxb
+    u3 = ns / ls
+    U = np.column_stack((u1, np.cross(u3, u1), u3))
+    v1 = yb / lyb
+    v3 = nt / lt
+    V = np.column_stack((v1, np.cross(v3, v1), v3))
+    # In-plane coordinates; optimal 2D angle maximizes sum y . rot(theta) x
+    x2 = U[:, :2].T @ X
+    y2 = V[:, :2].T @ Y
+    cdot = float(np.sum(x2 * y2))
+    ccross = float(np.sum(x2[0] * y2[1] - x2[1] * y2[0]))
+    tr = float(np.hypot(cdot, ccross))
+    if tr <= 1e-300:
+        return None
+    c, s = cdot / tr, ccross / tr
+    Rz = np.array(((c, -s, 0.0), (s, c, 0.0), (0.0, 0.0, 1.0)))
+    return V @ Rz @ U.T, tr
+
 
 def compute_similarity_transform_from_points(
     S_A: Vector, S_B: Vector, S_C: Vector,
@@ -29,23 +66,19 @@ def compute_similarity_transform_from_points(
     if not np.isfinite(X).all() or not np.isfinite(Y).all():
         raise ValueError("Non-finite values in point data")
 
-    # Covariance
-    H = X @ Y.T  # 3x3
-
-    # SVD and rotation
-    U, Svals, Vt = np.linalg.svd(H)
-    V = Vt.T
-    R_np = V @ U.T
-    if np.linalg.det(R_np) < 0:
-        V[:, -1] *= -1
-        R_np = V @ U.T
+    # Rotation: closed form for the two-edge case, Horn's method for degenerate triangles
+    solved = _triangle_rotation(X, Y)
+    if solved is not None:
+        R_np, tr = solved
+    else:
+        R_np, tr = horn_rotation(X @ Y.T)
 
-    # Uniform scale: s = trace(S) / ||X||^2
+    # Uniform scale: s = trace(R H) / ||X||^2
     denom = float((X ** 2).sum())
-    s = 1.0 if denom < 1e-16 else (Svals.sum() / denom)
+    s = 1.0 if denom < 1e-16 else (tr / denom)
 
     # Convert rotation to mathutils.Matrix
-    R = Matrix([list(R_np[0]), list(R_np[1]), list(R_np[2])])
+    R = Matrix(R_np.tolist())
 
     # Translation so that A maps exactly
     t = T_A - (R @ S_A) * s
@@ -1,29 +1,98 @@
 import bmesh
+import numpy as np
+from collections import Counter
 
 
-def get_border_edges(faces):
-    """Get edges that form the border of a face selection"""
+def get_border_edges(faces, bm=None):
+    """Get edges that form the border of a face selection.
+
+    When the owning BMesh is passed, edge indices are refreshed and counted with
+    np.bincount instead of a per-edge dict. When a Mesh is passed instead, faces
+    are polygon indices and get_border_edges_mesh does the work.
+    """
+    if bm is not None and hasattr(bm, "polygons"):
+        # A real Mesh was passed: faces are polygon indices, read via foreach_get
+        mesh = bm
+        return [mesh.edges[i] for i in get_border_edges_mesh(mesh, faces).tolist()]
+
     if not faces:
         return []
+
+    if bm is not None:
+        bm.edges.index_update()
+        bm.edges.ensure_lookup_table()
+        n = sum(len(face.edges) for face in faces)
+        idx = np.fromiter((edge.index for face in faces for edge in face.edges), dtype=np.int32, count=n)
+        # Border edges are those with only one adjacent selected face
+        counts = np.bincount(idx)
+        edges = bm.edges
+        return [edges[i] for i in np.flatnonzero(counts == 1).tolist()]
     
-    # Count how many selected faces are adjacent to each edge
-    edge_face_count = {}
-    for face in faces:
-        for edge in face.edges:
-            if edge in edge_face_count:
-                edge_face_count[edge] += 1
-            else:
-                edge_face_count[edge] = 1
+    # Count how many selected faces are adjacent to each edge (Counter counts in C)
+    edge_face_count = Counter(edge for face in faces for edge in face.edges)
     
     # Border edges are those with only one adjacent selected face
     border_edges = [edge for edge, count in edge_face_count.items() if count == 1]
     return border_edges
 
 
-def identify_top_faces(extruded_faces, border_edges):
-    """Identify top faces that don't share edges with the original border"""
+def get_border_edges_mesh(mesh, face_indices):
+    """Get border edge indices of a polygon selection on a Mesh (not a BMesh).
+
+    Polygon loop ranges and loop edge indices are read with foreach_get in one
+    call each, so the cost does not depend on Python iteration over faces.
+    """
+    face_indices = np.asarray(face_indices, dtype=np.int64).ravel()
+    if face_indices.size == 0:
+        return np.empty(0, dtype=np.int64)
+
+    n_polys = len(mesh.polygons)
+    loop_start = np.empty(n_polys, dtype=np.int32)
+    loop_total = np.empty(n_polys, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+    mesh.polygons.foreach_get("loop_total", loop_total)
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+
+    # Flat loop indices of the selected polygons: repeat each start, add 0..total-1
+    starts = loop_start[face_indices].astype(np.int64)
+    totals = loop_total[face_indices].astype(np.int64)
+    offsets = np.arange(int(totals.sum()), dtype=np.int64) - np.repeat(np.cumsum(totals) - totals, totals)
+    selected_edges = loop_edges[np.repeat(starts, totals) + offsets]
+
+    # Border edges are those with only one adjacent selected face
+    counts = np.bincount(selected_edges, minlength=len(mesh.edges))
+    return np.flatnonzero(counts == 1)
+
+
+def identify_top_faces(extruded_faces, border_edges, bm=None):
+    """Identify top faces that don't share edges with the original border
+
+    When the owning BMesh is passed, membership is tested on sorted edge indices
+    with one np.searchsorted over all faces' edges.
+    """
     if not extruded_faces or not border_edges:
         return extruded_faces if extruded_faces else []
+
+    if bm is not None:
+        # Indices are dirty right after extrusion
+        bm.edges.index_update()
+        border_ids = np.fromiter((e.index for e in border_edges if e.is_valid), dtype=np.int32)
+        border_ids.sort()
+        if border_ids.size == 0:
+            return list(extruded_faces)
+        sizes = np.fromiter((len(face.edges) for face in extruded_faces), dtype=np.int64, count=len(extruded_faces))
+        fe = np.fromiter(
+            (edge.index for face in extruded_faces for edge in face.edges),
+            dtype=np.int32,
+            count=int(sizes.sum()),
+        )
+        pos = np.minimum(np.searchsorted(border_ids, fe), border_ids.size - 1)
+        hit = border_ids[pos] == fe
+        # Per-face "shares any border edge" over the flat edge list
+        starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        shares = np.logical_or.reduceat(hit, starts)
+        return [face for face, shared in zip(extruded_faces, shares.tolist()) if not shared]
     
     top_faces = []
     border_edges_set = set(border_edges)  # Convert to set for faster lookup
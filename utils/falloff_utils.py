@@ -9,6 +9,182 @@ import numpy as np
 import math
 
 
+# Optional Numba kernels for the array curves; the NumPy versions are used when it is missing
+try:
+    from numba import guvectorize
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+
+
+# float32 constants for the NumPy path, so array math never widens to float64
+_ZERO = np.float32(0.0)
+_ONE = np.float32(1.0)
+_TWO = np.float32(2.0)
+_THREE = np.float32(3.0)
+_FOUR = np.float32(4.0)
+_HALF = np.float32(0.5)
+
+
+if HAS_NUMBA:
+    # Per-type array kernels: normalize, clamp and evaluate each curve in one fused
+    # loop over the distances, with no temporaries
+    _GU_SIG = [
+        'void(float32[:], float64, float32[:])',
+        'void(float64[:], float64, float32[:])',
+    ]
+
+    @guvectorize(_GU_SIG, '(n),()->(n)', nopython=True, fastmath=True, cache=True)
+    def _smooth_gu(d, inv_r, out):
+        for i in range(d.shape[0]):
+            ti = min(max(d[i] * inv_r, 0.0), 1.0)
+            out[i] = 1.0 - ti * ti * (3.0 - 2.0 * ti)
+
+    @guvectorize(_GU_SIG, '(n),()->(n)', nopython=True, fastmath=True, cache=True)
+    def _sphere_gu(d, inv_r, out):
+        for i in range(d.shape[0]):
+            ti = min(max(d[i] * inv_r, 0.0), 1.0)
+            out[i] = math.sqrt(1.0 - ti * ti)
+
+    @guvectorize(_GU_SIG, '(n),()->(n)', nopython=True, fastmath=True, cache=True)
+    def _root_gu(d, inv_r, out):
+        for i in range(d.shape[0]):
+            ti = min(max(d[i] * inv_r, 0.0), 1.0)
+            out[i] = math.sqrt(1.0 - ti)
+
+    @guvectorize(_GU_SIG, '(n),()->(n)', nopython=True, fastmath=True, cache=True)
+    def _inv_sq_gu(d, inv_r, out):
+        for i in range(d.shape[0]):
+            ti = min(max(d[i] * inv_r, 0.0), 1.0)
+            out[i] = ((5.0 / (1.0 + 4.0 * ti * ti)) - 1.0) * 0.25
+
+    @guvectorize(_GU_SIG, '(n),()->(n)', nopython=True, fastmath=True, cache=True)
+    def _sharp_gu(d, inv_r, out):
+        for i in range(d.shape[0]):
+            u = 1.0 - min(max(d[i] * inv_r, 0.0), 1.0)
+            out[i] = u * u * u
+
+    @guvectorize(_GU_SIG, '(n),()->(n)', nopython=True, fastmath=True, cache=True)
+    def _linear_gu(d, inv_r, out):
+        for i in range(d.shape[0]):
+            out[i] = 1.0 - min(max(d[i] * inv_r, 0.0), 1.0)
+
+    _VECTOR_KERNELS = {
+        'SMOOTH': _smooth_gu,
+        'SPHERE': _sphere_gu,
+        'ROOT': _root_gu,
+        'INVERSE_SQUARE': _inv_sq_gu,
+        'SHARP': _sharp_gu,
+        'LINEAR': _linear_gu,
+    }
+else:
+    _VECTOR_KERNELS = {}
+
+
+def _hash_unit_array(seeds):
+    """Map uint32 seeds to deterministic uniform float32 values in [0,1) (integer mix hash)."""
+    h = seeds.astype(np.uint32) * np.uint32(2654435761)
+    h ^= h >> np.uint32(16)
+    h *= np.uint32(2246822519)
+    h ^= h >> np.uint32(13)
+    h *= np.uint32(3266489917)
+    h ^= h >> np.uint32(16)
+    # Low 24 bits are exact in float32, so the result stays below 1.0
+    return (h & np.uint32(0xFFFFFF)).astype(np.float32) * np.float32(1.0 / 16777216.0)
+
+
+def _hash_unit(seed):
+    """Scalar twin of _hash_unit_array: same uint32 mix, no global random state touched."""
+    h = ((seed & 0xFFFFFFFF) * 2654435761) & 0xFFFFFFFF
+    h ^= h >> 16
+    h = (h * 2246822519) & 0xFFFFFFFF
+    h ^= h >> 13
+    h = (h * 3266489917) & 0xFFFFFFFF
+    h ^= h >> 16
+    return (h & 0xFFFFFF) * (1.0 / 16777216.0)
+
+
+# NumPy curves for the array path. Each takes a private float32 buffer t in [0,1]
+# and may overwrite it; the result is returned as float32.
+
+def _smooth_np(t):
+    """Smooth hermite: 1 - smoothstep(t)."""
+    tmp = np.multiply(t, _TWO, dtype=np.float32)
+    np.subtract(_THREE, tmp, out=tmp)
+    tmp *= t
+    tmp *= t
+    np.subtract(_ONE, tmp, out=tmp)
+    return tmp
+
+
+def _sphere_np(t):
+    """Spherical: sqrt(1 - t^2)."""
+    np.multiply(t, t, out=t)
+    np.subtract(_ONE, t, out=t)
+    np.clip(t, _ZERO, _ONE, out=t)
+    return np.sqrt(t, out=t)
+
+
+def _root_np(t):
+    """Root: sqrt(1 - t)."""
+    np.subtract(_ONE, t, out=t)
+    np.clip(t, _ZERO, _ONE, out=t)
+    return np.sqrt(t, out=t)
+
+
+def _inverse_square_np(t):
+    """Normalized inverse square, w(0)=1 and w(1)=0: ((1 + a) * base - 1) / a with a = 4, folded."""
+    np.multiply(t, t, out=t)
+    t *= _FOUR
+    t += _ONE
+    np.divide(np.float32(1.25), t, out=t)
+    t -= np.float32(0.25)
+    return t
+
+
+def _sharp_np(t):
+    """Sharp: cubic (1 - t)^3 for cliff-like drop-off (multiplies, not np.power)."""
+    np.subtract(_ONE, t, out=t)
+    u = np.multiply(t, t)
+    u *= t
+    return u
+
+
+def _linear_np(t):
+    """Linear: 1 - t."""
+    np.subtract(_ONE, t, out=t)
+    return np.clip(t, _ZERO, _ONE, out=t)
+
+
+def _constant_np(t):
+    """Constant: 1 inside radius, 0 at/after radius."""
+    return (t < _ONE).astype(np.float32)
+
+
+def _random_np(t):
+    """Linear base curve with up to 50% hashed random variation subtracted (matching Blender)."""
+    # Use distance values as seeds for consistent per-vertex randomness
+    seeds = (t * np.float32(10000)).astype(np.uint32)
+    random_factors = _hash_unit_array(seeds)
+    linear_weights = _linear_np(t)
+    random_factors *= linear_weights
+    random_factors *= _HALF
+    np.subtract(linear_weights, random_factors, out=random_factors)
+    return np.maximum(random_factors, _ZERO, out=random_factors)
+
+
+_NUMPY_CURVES = {
+    'SMOOTH': _smooth_np,
+    'SPHERE': _sphere_np,
+    'ROOT': _root_np,
+    'INVERSE_SQUARE': _inverse_square_np,
+    'SHARP': _sharp_np,
+    'LINEAR': _linear_np,
+    'CONSTANT': _constant_np,
+    'RANDOM': _random_np,
+}
+
+
 def calculate_falloff_weight_scalar(normalized_distance, falloff_type):
     """
     Calculate falloff weight for a single normalized distance value.
@@ -20,6 +196,8 @@ def calculate_falloff_weight_scalar(normalized_distance, falloff_type):
     Returns:
         float: Weight value from 0.0 to 1.0
     """
+    # Plain Python on purpose: this runs once per vertex from Python loops, where a
+    # compiled kernel's call overhead outweighs the few float ops it would save
     t = max(0.0, min(1.0, normalized_distance))  # Clamp to [0,1]
     
     if falloff_type == 'SMOOTH':
@@ -27,10 +205,10 @@ def calculate_falloff_weight_scalar(normalized_distance, falloff_type):
         return 1.0 - (3.0 * t * t - 2.0 * t * t * t)
     
     elif falloff_type == 'SPHERE':
-        # Spherical falloff: cosine-based quarter circle
+        # Spherical falloff: quarter circle sqrt(1 - t^2), as in Blender and the array path
         if t >= 1.0:
             return 0.0
-        return math.cos(t * math.pi * 0.5)
+        return math.sqrt(1.0 - t * t)
     
     elif falloff_type == 'ROOT':
         # Root falloff: square root curve
@@ -47,7 +225,8 @@ def calculate_falloff_weight_scalar(normalized_distance, falloff_type):
     
     elif falloff_type == 'SHARP':
         # Sharp falloff: cubic curve for characteristic cliff-like drop-off
-        return (1.0 - t) ** 3
+        u = 1.0 - t
+        return u * u * u
     
     elif falloff_type == 'LINEAR':
         # Linear falloff: straight line from 1.0 to 0.0
@@ -60,10 +239,8 @@ def calculate_falloff_weight_scalar(normalized_distance, falloff_type):
     elif falloff_type == 'RANDOM':
         # Random falloff: linear base curve with random variation subtracted (matching Blender)
         # Use distance value as seed for consistent per-vertex randomness
-        import random
-        random.seed(int(normalized_distance * 10000) % 2147483647)  # Use distance as seed
         linear_weight = max(0.0, 1.0 - normalized_distance)
-        random_factor = random.random()  # 0.0 to 1.0
+        random_factor = _hash_unit(int(normalized_distance * 10000))  # 0.0 to 1.0
         return max(0.0, linear_weight - (random_factor * linear_weight * 0.5))  # Subtract up to 50% randomly
     
     else:
@@ -86,52 +263,20 @@ def calculate_falloff_weights_vectorized(distances, radius, falloff_type):
     if distances.size == 0:
         return np.array([], dtype=np.float32)
     
-    # Normalize distances to [0,1] range
-    t = np.clip(distances / max(radius, 1e-12), 0.0, 1.0).astype(np.float32)
-    
-    if falloff_type == 'SMOOTH':
-        # Smooth hermite: 1 - smoothstep(t)
-        return 1.0 - (t * t * (3.0 - 2.0 * t))
-    
-    elif falloff_type == 'SPHERE':
-        # Spherical: sqrt(1 - t^2)
-        return np.sqrt(np.clip(1.0 - t * t, 0.0, 1.0))
-    
-    elif falloff_type == 'ROOT':
-        # Root: sqrt(1 - t)
-        return np.sqrt(np.clip(1.0 - t, 0.0, 1.0))
-    
-    elif falloff_type == 'INVERSE_SQUARE':
-        # Normalized inverse square: ensures w(0)=1 and w(1)=0
-        a = 4.0
-        base = 1.0 / (1.0 + a * (t * t))
-        return (((1.0 + a) * base) - 1.0) / a
-    
-    elif falloff_type == 'SHARP':
-        # Sharp falloff: cubic curve for cliff-like drop-off
-        return (1.0 - t) ** 3
-    
-    elif falloff_type == 'LINEAR':
-        # Linear: 1 - t
-        return np.clip(1.0 - t, 0.0, 1.0)
-    
-    elif falloff_type == 'CONSTANT':
-        # Constant: 1 inside radius, 0 at/after radius
-        return (t < 1.0).astype(np.float32)
-    
-    elif falloff_type == 'RANDOM':
-        # Random falloff: linear base curve with random variation subtracted (matching Blender)
-        linear_weights = np.clip(1.0 - t, 0.0, 1.0)
-        # Use distance values as seeds for consistent per-vertex randomness
-        seeds = (t * 10000).astype(np.int32) % 2147483647
-        # Generate random factors using vectorized approach
-        random_factors = np.array([np.random.RandomState(seed).random() for seed in seeds], dtype=np.float32)
-        # Subtract random variation from linear base (up to 50% of linear weight)
-        return np.maximum(0.0, linear_weights - (random_factors * linear_weights * 0.5))
+    kernel = _VECTOR_KERNELS.get(falloff_type)
+    if kernel is not None:
+        # Fused normalize + clamp + curve, one pass over distances
+        out = np.empty(distances.shape, dtype=np.float32)
+        kernel(distances, 1.0 / max(radius, 1e-12), out)
+        return out
+
+    # Normalize distances to [0,1] range straight into one float32 buffer
+    t = np.empty(distances.shape, dtype=np.float32)
+    np.divide(distances, max(radius, 1e-12), out=t)
+    np.clip(t, _ZERO, _ONE, out=t)
     
-    else:
-        # Default to smooth
-        return 1.0 - (t * t * (3.0 - 2.0 * t))
+    # Unknown types default to smooth
+    return _NUMPY_CURVES.get(falloff_type, _smooth_np)(t)
 
 
 def get_available_falloff_types():
@@ -165,7 +310,7 @@ def get_falloff_description(falloff_type):
     """
     descriptions = {
         'SMOOTH': 'Smooth hermite curve with gradual transitions',
-        'SPHERE': 'Spherical falloff using cosine curve',
+        'SPHERE': 'Spherical falloff using a quarter-circle curve',
         'ROOT': 'Square root curve for gentle falloff',
         'INVERSE_SQUARE': 'Inverse square relationship with sharp center',
         'SHARP': 'Cubic curve with cliff-like drop-off at edge',
@@ -3,12 +3,145 @@ Conversion utilities for the Flex tool in Super Tools addon.
 Handles conversions between 2D and 3D coordinates, screen space and world space.
 """
 import bpy
-import math
+import numpy as np
 from mathutils import Vector
 from bpy_extras import view3d_utils
 from .flex_state import state
 
 
+# Max surfaces skipped (Flex preview / edited object, non-mesh) before giving up on a face hit
+_MAX_RAY_SKIPS = 8
+
+# object name_full -> (matrix_world copy, inverse), see _matrix_world_inv
+_matrix_inv_cache = {}
+
+
+def _matrix_world_inv(obj, matrix_world):
+    """Inverse of obj.matrix_world, cached per object until its matrix changes.
+    The returned Matrix is shared; callers must not modify it in place."""
+    key = obj.name_full
+    cached = _matrix_inv_cache.get(key)
+    if cached is not None and cached[0] == matrix_world:
+        return cached[1]
+    m_inv = matrix_world.inverted()
+    _matrix_inv_cache[key] = (matrix_world.copy(), m_inv)
+    return m_inv
+
+
+def _ray_cast_obj(obj, ray_origin, view_vector):
+    """World-space hit of a world ray on one object, or None. The ray is taken into
+    object space with the cached inverse of matrix_world."""
+    matrix_world = obj.matrix_world
+    m_inv = _matrix_world_inv(obj, matrix_world)
+    success, location, _normal, _index = obj.ray_cast(m_inv @ ray_origin, m_inv.to_3x3() @ view_vector)
+    if not success:
+        return None
+    return matrix_world @ location
+
+
+def _scene_ray_cast_excluding_flex(context, ray_origin, view_vector):
+    """Nearest world-space hit on a visible mesh along the ray, ignoring the Flex
+    preview mesh and the object being edited. One scene-level BVH query per surface
+    instead of a per-object ray_cast loop. Returns None if nothing is hit.
+
+    Only objects in context.visible_objects (and in the local view, when active) count;
+    anything else is skipped by re-casting just past it.
+    """
+    try:
+        preview_name = state.preview_mesh_obj.name if state.preview_mesh_obj is not None else None
+    except ReferenceError:
+        preview_name = None
+    edited_name = getattr(state, 'edited_object_name', None)
+
+    space = getattr(context, 'space_data', None)
+    local_view_space = space if space is not None and space.type == 'VIEW_3D' and space.local_view else None
+    visible_names = None
+
+    # The view layer's depsgraph, without forcing an evaluation on every mouse event
+    depsgraph = context.view_layer.depsgraph
+    scene = context.scene
+    origin = ray_origin
+    for _ in range(_MAX_RAY_SKIPS):
+        success, location, _normal, _index, obj, _matrix = scene.ray_cast(depsgraph, origin, view_vector)
+        if not success:
+            return None
+        if obj is not None:
+            obj = obj.original
+            if obj.type == 'MESH' and obj.name != preview_name and obj.name != edited_name:
+                if visible_names is None:
+                    visible_names = {o.name_full for o in context.visible_objects}
+                if obj.name_full in visible_names and (
+                    local_view_space is None or obj.local_view_get(local_view_space)
+                ):
+                    return location
+        # Skipped surface: continue the ray just past it, with a step relative to the distance travelled
+        origin = location + view_vector * max(1e-6, 1e-6 * (location - ray_origin).length)
+    return None
+
+
+def _to_object_space(world_point):
+    """Map a world-space point into the Flex object's space (identity without an object)."""
+    if state.object_matrix_world is not None:
+        return state.get_object_matrix_world_inv() @ world_point
+    return world_point
+
+
+def _get_3d_with_depth(ray_origin, view_vector, depth):
+    """Point at a fixed distance along the view ray, in object space."""
+    return _to_object_space(ray_origin + view_vector * depth)
+
+
+def _get_3d_with_construction_plane(context, ray_origin, view_vector):
+    """World-space point for the first point of a new curve (special depth logic).
+
+    Tries the construction plane, then the active mesh (surface hit or its center
+    depth), then the world axis plane most facing the view.
+    """
+    if state.construction_plane_origin is not None and state.construction_plane_normal is not None:
+        denom = view_vector.dot(state.construction_plane_normal)
+        if abs(denom) > 1e-6:
+            t = (state.construction_plane_origin - ray_origin).dot(state.construction_plane_normal) / denom
+            if t > 0.0:
+                point_3d = ray_origin + view_vector * t
+                state.current_depth = (point_3d - ray_origin).length
+                return point_3d
+    
+    active = context.active_object
+    if active and active.type == 'MESH':
+        if (state.preview_mesh_obj is None or active != state.preview_mesh_obj) and (
+            getattr(state, 'edited_object_name', None) is None or active.name != state.edited_object_name
+        ):
+            hit_point = _ray_cast_obj(active, ray_origin, view_vector)
+            if hit_point is not None:
+                return hit_point
+            obj_center = active.matrix_world.translation
+            depth_value = (obj_center - ray_origin).dot(view_vector)
+            point_3d = ray_origin + view_vector * depth_value
+            return point_3d
+    
+    # Intersect the world plane through the origin most facing the view (x=0, y=0 or z=0)
+    ax, ay, az = abs(view_vector.x), abs(view_vector.y), abs(view_vector.z)
+    if ax >= ay and ax >= az:
+        comp, denom = ray_origin.x, view_vector.x
+    elif ay >= az:
+        comp, denom = ray_origin.y, view_vector.y
+    else:
+        comp, denom = ray_origin.z, view_vector.z
+    t = -comp / denom if abs(denom) > 0.0001 else 10.0
+    point_3d = ray_origin + view_vector * t
+    
+    state.current_depth = (point_3d - ray_origin).length
+    return point_3d
+
+
+def _get_3d_with_face_projection(context, ray_origin, view_vector):
+    """Object-space surface hit under the mouse, or None on a miss."""
+    hit_point = _scene_ray_cast_excluding_flex(context, ray_origin, view_vector)
+    if hit_point is None:
+        return None
+    return _to_object_space(hit_point)
+
+
 def get_3d_from_mouse(context, mouse_pos, depth=None, use_special_depth_logic=False, require_face_hit=False):
     """Convert a 2D mouse position to a 3D point in object space.
     
@@ -31,113 +164,20 @@ def get_3d_from_mouse(context, mouse_pos, depth=None, use_special_depth_logic=Fa
     ray_origin = view3d_utils.region_2d_to_origin_3d(region, rv3d, mouse_pos)
     
     if depth is not None:
-        world_point = ray_origin + view_vector * depth
-        
-        if state.object_matrix_world is not None:
-            matrix_world_inv = state.object_matrix_world.inverted()
-            point_3d = matrix_world_inv @ world_point
-        else:
-            point_3d = world_point
-            
-        return point_3d
+        return _get_3d_with_depth(ray_origin, view_vector, depth)
     
     if use_special_depth_logic:
-        if state.construction_plane_origin is not None and state.construction_plane_normal is not None:
-            denom = view_vector.dot(state.construction_plane_normal)
-            if abs(denom) > 1e-6:
-                t = (state.construction_plane_origin - ray_origin).dot(state.construction_plane_normal) / denom
-                if t > 0.0:
-                    point_3d = ray_origin + view_vector * t
-                    state.current_depth = (point_3d - ray_origin).length
-                    return point_3d
-        
-        if context.active_object and context.active_object.type == 'MESH':
-            if (state.preview_mesh_obj is None or context.active_object != state.preview_mesh_obj) and (
-                getattr(state, 'edited_object_name', None) is None or context.active_object.name != state.edited_object_name
-            ):
-                matrix = context.active_object.matrix_world.inverted()
-                ray_origin_obj = matrix @ ray_origin
-                ray_direction_obj = matrix.to_3x3() @ view_vector
-                
-                success, location, normal, index = context.active_object.ray_cast(ray_origin_obj, ray_direction_obj)
-                
-                if success:
-                    hit_point = context.active_object.matrix_world @ location
-                    return hit_point
-                else:
-                    obj_center = context.active_object.matrix_world.translation
-                    depth_value = (obj_center - ray_origin).dot(view_vector)
-                    point_3d = ray_origin + view_vector * depth_value
-                    return point_3d
-        
-        view_abs = [abs(view_vector.x), abs(view_vector.y), abs(view_vector.z)]
-        max_index = view_abs.index(max(view_abs))
-        
-        if max_index == 0:
-            if abs(view_vector.x) > 0.0001:
-                t = -ray_origin.x / view_vector.x
-                point_3d = ray_origin + view_vector * t
-            else:
-                point_3d = ray_origin + view_vector * 10.0
-        elif max_index == 1:
-            if abs(view_vector.y) > 0.0001:
-                t = -ray_origin.y / view_vector.y
-                point_3d = ray_origin + view_vector * t
-            else:
-                point_3d = ray_origin + view_vector * 10.0
-        else:
-            if abs(view_vector.z) > 0.0001:
-                t = -ray_origin.z / view_vector.z
-                point_3d = ray_origin + view_vector * t
-            else:
-                point_3d = ray_origin + view_vector * 10.0
-        
-        state.current_depth = (point_3d - ray_origin).length
-        return point_3d
+        return _get_3d_with_construction_plane(context, ray_origin, view_vector)
     
     if state.face_projection_enabled:
-        hit_obj = None
-        hit_point = None
-        hit_dist = float('inf')
-        
-        for obj in context.visible_objects:
-            if obj.type == 'MESH':
-                if (state.preview_mesh_obj is not None and obj == state.preview_mesh_obj) or (
-                    getattr(state, 'edited_object_name', None) is not None and obj.name == state.edited_object_name
-                ):
-                    continue
-                
-                matrix = obj.matrix_world.inverted()
-                ray_origin_obj = matrix @ ray_origin
-                ray_direction_obj = matrix.to_3x3() @ view_vector
-                
-                success, location, normal, index = obj.ray_cast(ray_origin_obj, ray_direction_obj)
-                
-                if success:
-                    world_hit = obj.matrix_world @ location
-                    dist = (world_hit - ray_origin).length
-                    
-                    if dist < hit_dist:
-                        hit_dist = dist
-                        hit_point = world_hit
-                        hit_obj = obj
-        
-        if hit_point is not None:
-            if state.object_matrix_world is not None:
-                matrix_world_inv = state.object_matrix_world.inverted()
-                return matrix_world_inv @ hit_point
-            else:
-                return hit_point
-        elif require_face_hit:
+        point_3d = _get_3d_with_face_projection(context, ray_origin, view_vector)
+        if point_3d is not None:
+            return point_3d
+        if require_face_hit:
             return None
     
-    world_point = ray_origin + view_vector * state.current_depth
-    
-    if state.object_matrix_world is not None:
-        matrix_world_inv = state.object_matrix_world.inverted()
-        return matrix_world_inv @ world_point
-    else:
-        return world_point
+    # No surface hit: fall back to the current drawing depth
+    return _get_3d_with_depth(ray_origin, view_vector, state.current_depth)
 
 
 def get_2d_from_3d(context, point_3d, *, is_world_space=False):
@@ -171,6 +211,50 @@ def get_2d_from_3d(context, point_3d, *, is_world_space=False):
         return None
 
 
+def get_2d_from_3d_batch(context, points_3d, *, is_world_space=False):
+    """Convert many 3D points to 2D screen coordinates in one pass.
+
+    Vectorized counterpart of get_2d_from_3d: the points are pushed through a single
+    (perspective @ object) matrix product instead of one location_3d_to_region_2d call each.
+
+    Args:
+        context: Blender context (optional, falls back to bpy.context)
+        points_3d: Sequence of points (Vectors or (N,3) array) in object or world space
+        is_world_space: Treat points_3d as world-space when True
+
+    Returns:
+        (N,2) float32 array of region coordinates, with NaN rows for points behind
+        the view, or None if there is no 3D view region
+    """
+    try:
+        region = getattr(context, "region", None) if context else None
+        rv3d = getattr(context, "region_data", None) if context else None
+    except ReferenceError:
+        region = None
+        rv3d = None
+
+    if region is None or rv3d is None:
+        region = bpy.context.region
+        rv3d = bpy.context.region_data
+
+    if region is None or rv3d is None:
+        return None
+
+    pts = np.asarray(points_3d, dtype=np.float64).reshape(-1, 3)
+    M = np.array(rv3d.perspective_matrix, dtype=np.float64)
+    if not is_world_space and state.object_matrix_world is not None:
+        M = M @ np.array(state.object_matrix_world, dtype=np.float64)
+
+    h = pts @ M[:2, :3].T + M[:2, 3]
+    w = pts @ M[3, :3] + M[3, 3]
+    out = np.full((len(pts), 2), np.nan, dtype=np.float32)
+    front = w > 0.0
+    # Same mapping as location_3d_to_region_2d (region-relative, no region.x/y offset)
+    half = np.array((region.width * 0.5, region.height * 0.5))
+    out[front] = half + half * (h[front] / w[front, None])
+    return out
+
+
 def get_screen_distance(context, world_distance, point_3d):
     """Convert a world space distance to screen space distance.
     
@@ -193,7 +277,7 @@ def get_screen_distance(context, world_distance, point_3d):
     if offset_2d is None:
         return 0.0
     
-    return math.sqrt((offset_2d[0] - point_2d[0])**2 + (offset_2d[1] - point_2d[1])**2)
+    return (offset_2d - point_2d).length
 
 
 def get_consistent_screen_radius(context, radius_3d, point_3d, tangent=None):
@@ -247,6 +331,56 @@ def get_consistent_screen_radius(context, radius_3d, point_3d, tangent=None):
         return 30.0
 
 
+def get_consistent_screen_radius_batch(context, points_3d, radii_3d):
+    """Vectorized get_consistent_screen_radius (no tangent) plus the projected points.
+
+    Args:
+        context: Blender context
+        points_3d: (N,3) points in object space
+        radii_3d: N radii in world units
+
+    Returns:
+        ((N,2) float32 region coordinates with NaN rows behind the view,
+         (N,) float64 screen radii), or None if there is no 3D view region
+    """
+    try:
+        region = getattr(context, "region", None) if context else None
+        rv3d = getattr(context, "region_data", None) if context else None
+    except ReferenceError:
+        region = None
+        rv3d = None
+    if region is None or rv3d is None:
+        region = bpy.context.region
+        rv3d = bpy.context.region_data
+    if region is None or rv3d is None:
+        return None
+
+    world = np.asarray(points_3d, dtype=np.float64).reshape(-1, 3)
+    if state.object_matrix_world is not None:
+        M = np.array(state.object_matrix_world, dtype=np.float64)
+        world = world @ M[:3, :3].T + M[:3, 3]
+
+    # Same side direction for every point: the default tangent (X) crossed with the view axis
+    view_vector = rv3d.view_rotation @ Vector((0.0, 0.0, -1.0))
+    side = Vector((1, 0, 0)).cross(view_vector)
+    if side.length < 1e-6:
+        side = Vector((0, 1, 0))
+    side.normalize()
+
+    radii = np.asarray(radii_3d, dtype=np.float64)
+    offsets = world + radii[:, None] * np.array(side, dtype=np.float64)
+    points_2d = get_2d_from_3d_batch(context, world, is_world_space=True)
+    offsets_2d = get_2d_from_3d_batch(context, offsets, is_world_space=True)
+    if points_2d is None or offsets_2d is None:
+        return None
+
+    d = (offsets_2d - points_2d).astype(np.float64)
+    screen_radii = np.maximum(np.sqrt(np.einsum('ij,ij->i', d, d)), 10.0)
+    # Either end behind the view: fixed fallback, as in the scalar version
+    screen_radii[np.isnan(screen_radii)] = 30.0
+    return points_2d, screen_radii
+
+
 def get_world_distance(context, screen_distance, point_3d):
     """Convert a screen space distance to world space distance.
     
@@ -280,8 +414,8 @@ def get_world_distance(context, screen_distance, point_3d):
         else:
             lens = context.space_data.lens
         
-        fov_rad = 2 * math.atan(16.0 / lens)
-        world_distance = (screen_distance * distance * math.tan(fov_rad / 2)) / (region.width / 2)
+        # fov = 2 * atan(16 / lens), so tan(fov / 2) / (width / 2) reduces to 32 / (lens * width)
+        world_distance = screen_distance * distance * 32.0 / (lens * region.width)
         
         return world_distance
     else:
@@ -294,4 +428,4 @@ def register():
 
 
 def unregister():
-    pass
+    _matrix_inv_cache.clear()
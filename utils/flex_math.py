@@ -2,37 +2,57 @@
 Mathematical utilities for the Flex tool in Super Tools addon.
 Handles curve interpolation, coordinate system calculations, and other math functions.
 """
+import bpy
 import math
+import numpy as np
 from mathutils import Vector, Matrix
+from mathutils.kdtree import KDTree
 from .flex_state import state
 from . import flex_conversion as conversion
 
+# Optional Numba JIT for the B-spline evaluator; the NumPy version is used when it is missing
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+
 
 def detect_apex_indices(points_3d, angle_threshold_degrees=45):
     """
     Return indices of points that are apexes (sharp turns) based on the angle between adjacent segments.
     """
-    apex_indices = set()
     if len(points_3d) < 3:
-        return apex_indices
-    for i in range(1, len(points_3d)-1):
-        v_prev = (points_3d[i] - points_3d[i-1]).normalized()
-        v_next = (points_3d[i+1] - points_3d[i]).normalized()
-        dot = max(-1.0, min(1.0, v_prev.dot(v_next)))
-        angle = math.degrees(math.acos(dot))
-        if angle > angle_threshold_degrees:
-            apex_indices.add(i)
-    return apex_indices
+        return set()
+    pts = np.array(points_3d, dtype=np.float64).reshape(-1, 3)
+    d = np.diff(pts, axis=0)
+    norms = np.linalg.norm(d, axis=1, keepdims=True)
+    # Zero-length segments stay zero, like Vector.normalized()
+    d = np.divide(d, norms, out=np.zeros_like(d), where=norms > 0.0)
+    cos = np.clip(np.einsum('ij,ij->i', d[:-1], d[1:]), -1.0, 1.0)
+    angles = np.degrees(np.arccos(cos))
+    return set((np.flatnonzero(angles > angle_threshold_degrees) + 1).tolist())
+
+
+def points_to_array(points_3d):
+    """(N,3) float64 view of a point list; arrays (e.g. state.get_curve_xyz()) pass through."""
+    if isinstance(points_3d, np.ndarray):
+        return points_3d
+    return np.array(points_3d, dtype=np.float64).reshape(-1, 3)
 
 
 def get_polyline_arc_length(points_3d):
-    """Calculate the total arc length of a polyline defined by a list of 3D points."""
-    if not points_3d or len(points_3d) < 2:
+    """Calculate the total arc length of a polyline defined by a list of 3D points or an (N,3) array."""
+    if points_3d is None or len(points_3d) < 2:
         return 0.0
-    total_length = 0.0
-    for i in range(len(points_3d) - 1):
-        total_length += (points_3d[i+1] - points_3d[i]).length
-    return total_length
+    d = np.diff(points_to_array(points_3d), axis=0)
+    return float(np.sqrt(np.einsum('ij,ij->i', d, d)).sum())
+
+
+def get_polyline_cumulative_lengths(points_3d):
+    """Arc length from the first point to each point of a polyline, as an (N,) float64 array."""
+    d = np.diff(points_to_array(points_3d), axis=0)
+    return np.concatenate(([0.0], np.cumsum(np.sqrt(np.einsum('ij,ij->i', d, d)))))
 
 
 def get_curve_tangent(points_3d, index):
@@ -47,27 +67,46 @@ def get_curve_tangent(points_3d, index):
     else:
         v1 = (points_3d[index] - points_3d[index-1]).normalized()
         v2 = (points_3d[index+1] - points_3d[index]).normalized()
-        return (v1 + v2).normalized() if (v1 + v2).length > 1e-6 else v2
+        bisector = v1 + v2
+        return bisector.normalized() if bisector.length_squared > 1e-12 else v2
 
 
 def find_closest_segment_to_point(points_3d, point_3d):
-    """Find the segment index whose line is closest to the given 3D point."""
-    min_dist = float('inf')
-    best_index = -1
-    for i in range(len(points_3d) - 1):
-        a = points_3d[i]
-        b = points_3d[i+1]
-        ab = b - a
-        ab_len_sq = ab.length_squared
-        if ab_len_sq == 0:
-            continue
-        t = max(0.0, min(1.0, (point_3d - a).dot(ab) / ab_len_sq))
-        closest = a + t * ab
-        dist = (point_3d - closest).length
-        if dist < min_dist:
-            min_dist = dist
-            best_index = i
-    return best_index, min_dist
+    """Find the segment index whose line is closest to the given 3D point.
+
+    points_3d may be a list of Vectors or an (N,3) array; all segments are tested
+    in one vectorized pass. Returns (-1, inf) when every segment has zero length.
+    """
+    if len(points_3d) < 2:
+        return -1, float('inf')
+    pts = points_to_array(points_3d)
+    q = np.asarray(point_3d, dtype=np.float64)
+    a = pts[:-1]
+    ab = pts[1:] - a
+    aq = q - a
+    ab_len_sq = np.einsum('ij,ij->i', ab, ab)
+    valid = ab_len_sq > 0.0
+    if not valid.any():
+        return -1, float('inf')
+    t = np.einsum('ij,ij->i', aq, ab) / np.where(valid, ab_len_sq, 1.0)
+    np.clip(t, 0.0, 1.0, out=t)
+    diff = aq - t[:, None] * ab
+    d2 = np.einsum('ij,ij->i', diff, diff)
+    # Zero-length segments are skipped
+    d2[~valid] = np.inf
+    best_index = int(np.argmin(d2))
+    return best_index, math.sqrt(d2[best_index])
+
+
+def _hermite_basis(st):
+    """Cubic Hermite basis (h1, h2, h3, h4) for an array of segment parameters in [0,1]."""
+    st2 = st * st
+    st3 = st2 * st
+    h1 = 2*st3 - 3*st2 + 1
+    h2 = -2*st3 + 3*st2
+    h3 = st3 - 2*st2 + st
+    h4 = st3 - st2
+    return h1, h2, h3, h4
 
 
 def interpolate_curve_3d(points_3d, num_points=100, sharp_points=None, tensions=None):
@@ -94,106 +133,109 @@ def interpolate_curve_3d(points_3d, num_points=100, sharp_points=None, tensions=
             result.append(point.copy())
         return result
     
-    result = []
-    
-    total_length = 0
-    segment_lengths = []
-    for i in range(len(points_3d) - 1):
-        length = (points_3d[i+1] - points_3d[i]).length
-        segment_lengths.append(length)
-        total_length += length
-    
-    params = [0]
-    current_length = 0
-    
-    for segment_length in segment_lengths:
-        current_length += segment_length
-        params.append(current_length / total_length if total_length > 0 else 0)
-    
-    for i in range(num_points):
-        t = i / (num_points - 1)
-        
-        segment = 0
-        while segment < len(params) - 1 and t > params[segment + 1]:
-            segment += 1
-        
-        if segment >= len(params) - 1:
-            result.append(points_3d[-1].copy())
-            continue
-        
-        segment_t = 0
-        if params[segment + 1] > params[segment]:
-            segment_t = (t - params[segment]) / (params[segment + 1] - params[segment])
-        
-        p0 = points_3d[max(0, segment - 1)]
-        p1 = points_3d[segment]
-        p2 = points_3d[segment + 1]
-        p3 = points_3d[min(len(points_3d) - 1, segment + 2)]
-        
-        is_sharp_0 = segment in sharp_points
-        is_sharp_1 = (segment + 1) in sharp_points
-        
-        if is_sharp_0 and is_sharp_1:
-            point = p1.lerp(p2, segment_t)
-        elif not is_sharp_0 and not is_sharp_1:
-            tension1 = tensions[segment]
-            tension2 = tensions[segment + 1]
-            m1 = (1 - tension1) * (p2 - p0)
-            m2 = (1 - tension2) * (p3 - p1)
-            h1 = 2*segment_t**3 - 3*segment_t**2 + 1
-            h2 = -2*segment_t**3 + 3*segment_t**2
-            h3 = segment_t**3 - 2*segment_t**2 + segment_t
-            h4 = segment_t**3 - segment_t**2
-            point = h1*p1 + h2*p2 + h3*m1 + h4*m2
-        else:
-            blend = 3*segment_t**2 - 2*segment_t**3
-            tension1 = tensions[segment]
-            tension2 = tensions[segment + 1]
-            if is_sharp_0:
-                m1 = Vector((0, 0, 0))
-                m2 = (1 - tension2) * (p3 - p1)
-            elif is_sharp_1:
-                m1 = (1 - tension1) * (p2 - p0)
-                m2 = Vector((0, 0, 0))
-            else:
-                m1 = (1 - tension1) * (p2 - p0)
-                m2 = (1 - tension2) * (p3 - p1)
-            h1 = 2*segment_t**3 - 3*segment_t**2 + 1
-            h2 = -2*segment_t**3 + 3*segment_t**2
-            h3 = segment_t**3 - 2*segment_t**2 + segment_t
-            h4 = segment_t**3 - segment_t**2
-            hermite = h1*p1 + h2*p2 + h3*m1 + h4*m2
-            linear = p1.lerp(p2, segment_t)
-            if is_sharp_0:
-                point = linear.lerp(hermite, blend)
-            else:
-                point = hermite.lerp(linear, blend)
-        result.append(point.copy())
-    
-    return result
-
-
-def _de_boor_cubic(knot, ctrl, t):
-    """Evaluate clamped cubic B-spline at parameter t using De Boor."""
+    n = len(points_3d)
+    P = points_to_array(points_3d)
+    
+    # Chord-length parameters of the control points
+    d = np.diff(P, axis=0)
+    segment_lengths = np.sqrt(np.einsum('ij,ij->i', d, d))
+    total_length = float(segment_lengths.sum())
+    params = np.zeros(n)
+    if total_length > 0:
+        params[1:] = np.cumsum(segment_lengths) / total_length
+    
+    # Segment of each sample: first s with t <= params[s + 1]; s == n - 1 means past the end
+    t = np.arange(num_points) / (num_points - 1)
+    seg = np.searchsorted(params[1:], t, side='left')
+    past_end = seg >= n - 1
+    seg = np.minimum(seg, n - 2)
+    
+    span = params[seg + 1] - params[seg]
+    has_span = span > 0
+    st = np.where(has_span, (t - params[seg]) / np.where(has_span, span, 1.0), 0.0)
+    
+    p0 = P[np.maximum(seg - 1, 0)]
+    p1 = P[seg]
+    p2 = P[seg + 1]
+    p3 = P[np.minimum(seg + 2, n - 1)]
+    
+    tens = np.asarray(tensions[:n], dtype=np.float64)
+    sharp = np.zeros(n + 1, dtype=bool)
+    sharp[[i for i in sharp_points if 0 <= i < n]] = True
+    is_sharp_0 = sharp[seg]
+    is_sharp_1 = sharp[seg + 1]
+    
+    # Tangents, zeroed at the sharp end of half-sharp segments
+    m1 = ((1 - tens[seg]) * ~(is_sharp_0 & ~is_sharp_1))[:, None] * (p2 - p0)
+    m2 = ((1 - tens[seg + 1]) * ~(is_sharp_1 & ~is_sharp_0))[:, None] * (p3 - p1)
+    
+    h1, h2, h3, h4 = _hermite_basis(st)
+    hermite = h1[:, None]*p1 + h2[:, None]*p2 + h3[:, None]*m1 + h4[:, None]*m2
+    linear = p1 + st[:, None] * (p2 - p1)
+    
+    # Half-sharp segments ease from the hermite curve into the straight line at the sharp end
+    blend = (3*st**2 - 2*st**3)[:, None]
+    from_linear = linear + (hermite - linear) * blend
+    from_hermite = hermite + (linear - hermite) * blend
+    mixed = np.where(is_sharp_0[:, None], from_linear, from_hermite)
+    
+    result = np.where((is_sharp_0 & is_sharp_1)[:, None], linear,
+                      np.where((is_sharp_0 | is_sharp_1)[:, None], mixed, hermite))
+    result[past_end] = P[-1]
+    
+    return [Vector(row) for row in result.tolist()]
+
+
+def _de_boor_cubic_batch(knot, ctrl, ts):
+    """Evaluate a clamped cubic B-spline at every parameter in ts using De Boor.
+
+    knot: (M,) float64, ctrl: (N,3) float64, ts: (K,) float64. Returns (K,3).
+    """
     p = 3
-    n = len(ctrl) - 1
-    i = p
-    found = False
-    for s in range(p, len(knot) - p - 1):
-        if knot[s] <= t < knot[s + 1]:
-            i = s
-            found = True
-            break
-    if not found:
-        i = len(knot) - p - 2
-    d = [ctrl[j].copy() for j in range(i - p, i + 1)]
+    # Knot span of each t; parameters at/after the last interior knot use the final span
+    i = np.clip(np.searchsorted(knot, ts, side='right') - 1, p, len(knot) - p - 2)
+    d = ctrl[i[:, None] + np.arange(-p, 1)]  # (K, p+1, 3)
     for r in range(1, p + 1):
         for j in range(p, r - 1, -1):
             idx = i - p + j
             denom = knot[idx + p + 1 - r] - knot[idx]
-            a = 0.0 if abs(denom) < 1e-9 else (t - knot[idx]) / denom
-            d[j] = (1.0 - a) * d[j - 1] + a * d[j]
-    return d[p]
+            small = np.abs(denom) < 1e-9
+            a = np.where(small, 0.0, (ts - knot[idx]) / np.where(small, 1.0, denom))[:, None]
+            d[:, j] = (1.0 - a) * d[:, j - 1] + a * d[:, j]
+    return d[:, p]
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _de_boor_cubic_batch(knot, ctrl, ts):
+        p = 3
+        n_t = ts.shape[0]
+        out = np.empty((n_t, 3))
+        d = np.empty((p + 1, 3))
+        lo = p
+        hi = knot.shape[0] - p - 2
+        for k in range(n_t):
+            t = ts[k]
+            i = np.searchsorted(knot, t, side='right') - 1
+            i = min(max(i, lo), hi)
+            for j in range(p + 1):
+                for c in range(3):
+                    d[j, c] = ctrl[i - p + j, c]
+            for r in range(1, p + 1):
+                for j in range(p, r - 1, -1):
+                    idx = i - p + j
+                    denom = knot[idx + p + 1 - r] - knot[idx]
+                    a = 0.0 if abs(denom) < 1e-9 else (t - knot[idx]) / denom
+                    for c in range(3):
+                        d[j, c] = (1.0 - a) * d[j - 1, c] + a * d[j, c]
+            for c in range(3):
+                out[k, c] = d[p, c]
+        return out
+
+
+# num_points -> (control points, sampled (num_points,3)); see bspline_cubic_open_uniform
+_BSPLINE_CACHE = {}
+_BSPLINE_CACHE_SIZE = 8
 
 
 def bspline_cubic_open_uniform(points_3d, num_points):
@@ -208,31 +250,105 @@ def bspline_cubic_open_uniform(points_3d, num_points):
     if n_ctrl < 4:
         return interpolate_curve_3d(points_3d, num_points=num_points)
     
+    # Hover and radius passes resample the same control points many times per edit
+    ctrl = np.array(points_to_array(points_3d), dtype=np.float64)
+    cached = _BSPLINE_CACHE.get(num_points)
+    if cached is not None and np.array_equal(cached[0], ctrl):
+        samples = [Vector(row) for row in cached[1].tolist()]
+        samples[0] = points_3d[0].copy()
+        samples[-1] = points_3d[-1].copy()
+        return samples
+    if len(_BSPLINE_CACHE) >= _BSPLINE_CACHE_SIZE:
+        _BSPLINE_CACHE.clear()
+    
     p = 3
     m = n_ctrl + p + 1
-    knot = [0.0] * (p + 1)
     inner_count = m - 2 * (p + 1)
-    if inner_count > 0:
-        step = 1.0 / (inner_count + 1)
-        for j in range(1, inner_count + 1):
-            knot.append(step * j)
-    knot += [1.0] * (p + 1)
+    step = 1.0 / (inner_count + 1)
+    knot = np.concatenate((np.zeros(p + 1), step * np.arange(1, inner_count + 1), np.ones(p + 1)))
     t0 = knot[p]
     t1 = knot[-p - 1]
-    samples = []
-    for i in range(num_points):
-        if num_points == 1:
-            u = t0
-        else:
-            u = t0 + (t1 - t0) * (i / (num_points - 1))
-            if i == num_points - 1:
-                u = min(max(u, t0), t1 - 1e-9)
-        samples.append(_de_boor_cubic(knot, points_3d, u))
+    if num_points == 1:
+        us = np.array([t0])
+    else:
+        us = t0 + (t1 - t0) * (np.arange(num_points) / (num_points - 1))
+        us[-1] = min(max(us[-1], t0), t1 - 1e-9)
+    sampled = _de_boor_cubic_batch(knot, ctrl, us)
+    _BSPLINE_CACHE[num_points] = (ctrl, sampled)
+    samples = [Vector(row) for row in sampled.tolist()]
     samples[0] = points_3d[0].copy()
     samples[-1] = points_3d[-1].copy()
     return samples
 
 
+def _dense_kdtree(dense_xyz):
+    """Balanced KDTree over an (N,3) sample array; indices match the array rows."""
+    tree = KDTree(len(dense_xyz))
+    for i, co in enumerate(dense_xyz.tolist()):
+        tree.insert(co, i)
+    tree.balance()
+    return tree
+
+
+def _snap_monotone(dense_xyz, queries_xyz, start_idx=0, window=256, tree=None, k=8):
+    """Index of the nearest dense sample for each query, for queries ordered along the curve.
+
+    The search for each query starts at the previous match and covers at most
+    `window` samples ahead, stopping at the first non-improving sample more than
+    8 past the start. Each window is scored in one vectorized pass.
+    With a KDTree over dense_xyz the early stop is dropped, so a match is never a
+    local minimum: the k nearest samples are tried first, and the closest one inside
+    the window is the exact in-window nearest. The whole window is scored only when
+    none of them fall inside it.
+    """
+    n_samples = len(dense_xyz)
+    result = np.empty(len(queries_xyz), dtype=np.int64)
+    last_idx = start_idx
+    for q, qp in enumerate(queries_xyz):
+        if tree is not None:
+            hit = next((i for _, i, _ in tree.find_n(qp, k) if last_idx <= i <= last_idx + window), None)
+            if hit is not None:
+                last_idx = hit
+                result[q] = hit
+                continue
+        end_i = min(n_samples - 1, last_idx + window)
+        diff = dense_xyz[last_idx:end_i + 1] - qp
+        d2 = np.einsum('ij,ij->i', diff, diff)
+        if tree is None:
+            # A sample improves on the best so far only if strictly closer than all before it
+            prev_best = np.empty_like(d2)
+            prev_best[0] = np.inf
+            np.minimum.accumulate(d2[:-1], out=prev_best[1:])
+            stop = np.flatnonzero((d2 >= prev_best)[9:])
+            if stop.size:
+                d2 = d2[:stop[0] + 9 + 1]
+        last_idx += int(np.argmin(d2))
+        result[q] = last_idx
+    return result
+
+
+def _radius_tangents(radii, tensions):
+    """Hermite tangents of the radius channel at every control point.
+
+    Returns (raw, clamped) arrays of length n. Neighbours past the ends are linearly
+    extrapolated. The clamped tangent is 0 where either adjacent delta is 0 or the
+    tangent opposes the outgoing delta, else limited to 3 * min(|delta0|, |delta1|).
+    """
+    r = np.asarray(radii, dtype=np.float64)
+    n = len(r)
+    padded = np.empty(n + 2)
+    padded[1:-1] = r
+    padded[0] = r[0] - (r[1] - r[0])
+    padded[-1] = r[-1] + (r[-1] - r[-2])
+    delta0 = padded[1:-1] - padded[:-2]
+    delta1 = padded[2:] - padded[1:-1]
+    raw = (1 - np.asarray(tensions[:n], dtype=np.float64)) * (padded[2:] - padded[:-2])
+    max_m = 3 * np.minimum(np.abs(delta0), np.abs(delta1))
+    keep = (delta0 != 0) & (delta1 != 0) & ~(((delta1 > 0) & (raw < 0)) | ((delta1 < 0) & (raw > 0)))
+    clamped = np.where(keep, np.clip(raw, -max_m, max_m), 0.0)
+    return raw, clamped
+
+
 def calculate_smooth_radii(curve_points_3d, radii_3d, smooth_curve_points_3d, tensions=None, sharp_points=None):
     """Calculate smoothly interpolated radii for the given curve points."""
     use_bspline_path = getattr(state, 'bspline_mode', False)
@@ -243,88 +359,76 @@ def calculate_smooth_radii(curve_points_3d, radii_3d, smooth_curve_points_3d, te
         if len(dense_curve) < 2:
             dense_curve = curve_points_3d[:]
 
-        cumlen = [0.0]
-        for i in range(len(dense_curve) - 1):
-            cumlen.append(cumlen[-1] + (dense_curve[i+1] - dense_curve[i]).length)
-        total_len = cumlen[-1]
+        dense_xyz = points_to_array(dense_curve)
+        cumlen = get_polyline_cumulative_lengths(dense_xyz)
+        total_len = float(cumlen[-1])
         if total_len < 1e-6:
             return [radii_3d[0]] * len(smooth_curve_points_3d)
 
         def seq_nearest_indices(query_points, start_idx=0):
-            result_params = []
-            last_idx = start_idx
-            n_samples = len(dense_curve)
-            for qp in query_points:
-                best_i = last_idx
-                best_d = float('inf')
-                end_i = min(n_samples - 1, last_idx + 256)
-                for s in range(last_idx, end_i + 1):
-                    d = (qp - dense_curve[s]).length
-                    if d < best_d:
-                        best_d = d
-                        best_i = s
-                    else:
-                        if s > last_idx + 8:
-                            break
-                last_idx = best_i
-                result_params.append(cumlen[best_i] / total_len)
-            return result_params
+            idx = _snap_monotone(dense_xyz, points_to_array(query_points), start_idx)
+            return (cumlen[idx] / total_len).tolist()
 
         control_params = [0.0]
         if len(curve_points_3d) > 2:
             interior = curve_points_3d[1:-1]
-            interior_params = seq_nearest_indices(interior, start_idx=0)
-            control_params += interior_params
+            control_params += seq_nearest_indices(interior, start_idx=0)
         control_params.append(1.0)
 
         smooth_params = seq_nearest_indices(smooth_curve_points_3d, start_idx=0)
         params = control_params
     else:
-        control_point_arc_lengths = [0.0]
-        for i in range(len(curve_points_3d) - 1):
-            length = (curve_points_3d[i+1] - curve_points_3d[i]).length
-            control_point_arc_lengths.append(control_point_arc_lengths[-1] + length)
-        total_length = control_point_arc_lengths[-1]
+        P = points_to_array(curve_points_3d)
+        seg_vecs = np.diff(P, axis=0)
+        seg_lens = np.sqrt(np.einsum('ij,ij->i', seg_vecs, seg_vecs))
+        control_point_arc_lengths = np.concatenate(([0.0], np.cumsum(seg_lens)))
+        total_length = float(control_point_arc_lengths[-1])
         if total_length < 1e-6:
             return [radii_3d[0]] * len(smooth_curve_points_3d)
-        params = [l / total_length for l in control_point_arc_lengths]
+        params = (control_point_arc_lengths / total_length).tolist()
+
+        # Per-segment start, unit direction and length, computed once for all query points
+        seg_dirs = np.divide(seg_vecs, seg_lens[:, None], out=np.zeros_like(seg_vecs), where=seg_lens[:, None] > 1e-6)
+        starts = P.tolist()
+        dirs = seg_dirs.tolist()
+        lens = seg_lens.tolist()
+        arc = control_point_arc_lengths.tolist()
+
+        def seg_dist_sq(qx, qy, qz, s):
+            ax, ay, az = starts[s]
+            dx, dy, dz = dirs[s]
+            t = (qx - ax) * dx + (qy - ay) * dy + (qz - az) * dz
+            # Clamped ends use the exact vertex so a shared vertex ties exactly between segments
+            if t <= 0.0:
+                cx, cy, cz = ax, ay, az
+            elif t >= lens[s]:
+                cx, cy, cz = starts[s + 1]
+            else:
+                cx, cy, cz = ax + dx * t, ay + dy * t, az + dz * t
+            ex = qx - cx
+            ey = qy - cy
+            ez = qz - cz
+            return ex * ex + ey * ey + ez * ez
 
         smooth_params = []
         current_segment_idx = 0
-        for point in smooth_curve_points_3d:
-            while current_segment_idx < len(curve_points_3d) - 2:
-                p1 = curve_points_3d[current_segment_idx]
-                p2 = curve_points_3d[current_segment_idx + 1]
-                p3 = curve_points_3d[current_segment_idx + 2]
-                v_seg1 = p2 - p1
-                len_seg1 = v_seg1.length
-                v_seg2 = p3 - p2
-                len_seg2 = v_seg2.length
-                if len_seg1 < 1e-6 or len_seg2 < 1e-6:
+        last_walkable = len(curve_points_3d) - 2
+        for qx, qy, qz in points_to_array(smooth_curve_points_3d).tolist():
+            # Advance while the next segment is strictly closer (segments are visited in order)
+            while current_segment_idx < last_walkable:
+                if lens[current_segment_idx] < 1e-6 or lens[current_segment_idx + 1] < 1e-6:
                     break
-                dir_seg1 = v_seg1.normalized()
-                t1 = (point - p1).dot(dir_seg1)
-                closest1 = p1 + dir_seg1 * max(0, min(t1, len_seg1))
-                dist1 = (point - closest1).length
-                dir_seg2 = v_seg2.normalized()
-                t2 = (point - p2).dot(dir_seg2)
-                closest2 = p2 + dir_seg2 * max(0, min(t2, len_seg2))
-                dist2 = (point - closest2).length
-                if dist2 < dist1:
+                if seg_dist_sq(qx, qy, qz, current_segment_idx + 1) < seg_dist_sq(qx, qy, qz, current_segment_idx):
                     current_segment_idx += 1
                 else:
                     break
-            p1 = curve_points_3d[current_segment_idx]
-            p2 = curve_points_3d[current_segment_idx + 1]
-            segment_vec = p2 - p1
-            segment_len = segment_vec.length
             t = 0.0
-            if segment_len > 1e-6:
-                segment_dir = segment_vec.normalized()
-                t = (point - p1).dot(segment_dir)
-                t = max(0, min(t, segment_len))
-            param = (control_point_arc_lengths[current_segment_idx] + t) / total_length
-            smooth_params.append(param)
+            if lens[current_segment_idx] > 1e-6:
+                ax, ay, az = starts[current_segment_idx]
+                dx, dy, dz = dirs[current_segment_idx]
+                t = (qx - ax) * dx + (qy - ay) * dy + (qz - az) * dz
+                t = max(0, min(t, lens[current_segment_idx]))
+            smooth_params.append((arc[current_segment_idx] + t) / total_length)
 
     if tensions is None:
         tensions = [0.5] * len(curve_points_3d)
@@ -332,86 +436,53 @@ def calculate_smooth_radii(curve_points_3d, radii_3d, smooth_curve_points_3d, te
     while len(tensions) < len(curve_points_3d):
         tensions.append(0.5)
 
-    smooth_radii = []
     if sharp_points is None:
         sharp_points = set()
     
-    for i, param in enumerate(smooth_params):
-        segment = 0
-        while segment < len(params) - 1 and param > params[segment + 1]:
-            segment += 1
-        if segment >= len(params) - 1:
-            radius = radii_3d[-1]
-        else:
-            segment_t = 0
-            if params[segment + 1] > params[segment]:
-                segment_t = (param - params[segment]) / (params[segment + 1] - params[segment])
-            r1 = radii_3d[segment]
-            r2 = radii_3d[segment + 1]
-            if segment > 0:
-                r0 = radii_3d[segment - 1]
-            else:
-                r0 = r1 - (r2 - r1)
-            if segment + 2 < len(radii_3d):
-                r3 = radii_3d[segment + 2]
-            else:
-                r3 = r2 + (r2 - r1)
-            tension1 = tensions[segment]
-            tension2 = tensions[segment + 1]
-
-            is_sharp_0 = segment in sharp_points
-            is_sharp_1 = (segment + 1) in sharp_points
-            
-            def clamp_monotonic_tangent(r_prev, r_curr, r_next, m):
-                delta1 = r_next - r_curr
-                delta0 = r_curr - r_prev
-                if (delta0 == 0 or delta1 == 0):
-                    return 0.0
-                if (delta1 > 0 and m < 0) or (delta1 < 0 and m > 0):
-                    return 0.0
-                max_m = 3 * min(abs(delta0), abs(delta1))
-                return max(-max_m, min(m, max_m))
-            
-            if is_sharp_0 and is_sharp_1:
-                radius = r1 + segment_t * (r2 - r1)
-            elif not is_sharp_0 and not is_sharp_1:
-                raw_m1 = (1 - tension1) * (r2 - r0)
-                raw_m2 = (1 - tension2) * (r3 - r1)
-                m1 = clamp_monotonic_tangent(r0, r1, r2, raw_m1)
-                m2 = clamp_monotonic_tangent(r1, r2, r3, raw_m2)
-                h1 = 2*segment_t**3 - 3*segment_t**2 + 1
-                h2 = -2*segment_t**3 + 3*segment_t**2
-                h3 = segment_t**3 - 2*segment_t**2 + segment_t
-                h4 = segment_t**3 - segment_t**2
-                radius = h1*r1 + h2*r2 + h3*m1 + h4*m2
-            else:
-                blend = 3*segment_t**2 - 2*segment_t**3
-                h1 = 2*segment_t**3 - 3*segment_t**2 + 1
-                h2 = -2*segment_t**3 + 3*segment_t**2
-                h3 = segment_t**3 - 2*segment_t**2 + segment_t
-                h4 = segment_t**3 - segment_t**2
-                if is_sharp_0:
-                    m1 = 0
-                    m2 = (1 - tension2) * (r3 - r1)
-                    radius = (1 - blend) * (r1 + segment_t * (r2 - r1)) + blend * (h1*r1 + h2*r2 + h3*m1 + h4*m2)
-                elif is_sharp_1:
-                    m1 = (1 - tension1) * (r2 - r0)
-                    m2 = 0
-                    radius = (1 - blend) * (r1 + segment_t * (r2 - r1)) + blend * (h1*r1 + h2*r2 + h3*m1 + h4*m2)
-        radius = max(state.MIN_RADIUS, radius)
-        smooth_radii.append(radius)
-    
-    if len(smooth_radii) > 3:
-        smoothed = [smooth_radii[0]]
-        for i in range(1, len(smooth_radii)-1):
-            avg = (smooth_radii[i-1] + smooth_radii[i+1]) * 0.5
-            if smooth_radii[i] > avg:
-                smoothed.append(avg)
-            else:
-                smoothed.append(smooth_radii[i])
-        smoothed.append(smooth_radii[-1])
-        smooth_radii = smoothed
-    return smooth_radii
+    # Per-control-point radius tangents, raw and monotonicity-clamped (depend only on control data)
+    raw_m, clamped_m = _radius_tangents(radii_3d, tensions)
+    r = np.asarray(radii_3d, dtype=np.float64)
+    n = len(r)
+    
+    # Segment of each sample: first s with param <= params[s + 1] (binary search, params ascending)
+    params = np.asarray(params, dtype=np.float64)
+    smooth_params = np.asarray(smooth_params, dtype=np.float64)
+    seg = np.searchsorted(params[1:], smooth_params, side='left')
+    past_end = seg >= len(params) - 1
+    seg = np.minimum(seg, len(params) - 2)
+    
+    span = params[seg + 1] - params[seg]
+    has_span = span > 0
+    st = np.where(has_span, (smooth_params - params[seg]) / np.where(has_span, span, 1.0), 0.0)
+    h1, h2, h3, h4 = _hermite_basis(st)
+    
+    r1 = r[seg]
+    r2 = r[seg + 1]
+    sharp = np.zeros(n + 1, dtype=bool)
+    sharp[[i for i in sharp_points if 0 <= i < n]] = True
+    is_sharp_0 = sharp[seg]
+    is_sharp_1 = sharp[seg + 1]
+    
+    linear = r1 + st * (r2 - r1)
+    hermite = h1*r1 + h2*r2 + h3*clamped_m[seg] + h4*clamped_m[seg + 1]
+    # Half-sharp segments: unclamped tangent at the smooth end only, eased in from the line
+    half = h1*r1 + h2*r2 + np.where(is_sharp_0, h4*raw_m[seg + 1], h3*raw_m[seg])
+    blend = 3*st**2 - 2*st**3
+    mixed = (1 - blend) * linear + blend * half
+    
+    radius = np.where(is_sharp_0 & is_sharp_1, linear,
+                      np.where(is_sharp_0 | is_sharp_1, mixed, hermite))
+    radius[past_end] = r[-1]
+    np.maximum(radius, state.MIN_RADIUS, out=radius)
+    if len(radius) <= 3:
+        return radius.tolist()
+    
+    # Knock down interior bumps: cap each sample at the mean of its (unsmoothed) neighbours.
+    # The neighbour mean is fully built before the in-place write, so no sample sees a smoothed neighbour.
+    neighbour_mean = np.add(radius[:-2], radius[2:])
+    neighbour_mean *= 0.5
+    np.minimum(radius[1:-1], neighbour_mean, out=radius[1:-1])
+    return radius.tolist()
 
 
 def resample_curve(curve_points, segments):
@@ -419,36 +490,16 @@ def resample_curve(curve_points, segments):
     if len(curve_points) < 2:
         return curve_points.copy()
     
-    total_length = 0
-    segment_lengths = []
+    P = points_to_array(curve_points)
+    cumlen = get_polyline_cumulative_lengths(P)
     
-    for i in range(len(curve_points) - 1):
-        length = (curve_points[i+1] - curve_points[i]).length
-        segment_lengths.append(length)
-        total_length += length
+    # Piecewise-linear in arc length: one np.interp per axis
+    targets = np.linspace(0.0, cumlen[-1], segments + 1)
+    resampled = np.empty((segments + 1, 3))
+    for axis in range(3):
+        resampled[:, axis] = np.interp(targets, cumlen, P[:, axis])
     
-    resampled_points = []
-    
-    for i in range(segments + 1):
-        t = i / segments
-        current_length = 0
-        segment = 0
-        
-        while segment < len(segment_lengths) and current_length + segment_lengths[segment] < t * total_length:
-            current_length += segment_lengths[segment]
-            segment += 1
-        
-        if segment >= len(segment_lengths):
-            resampled_points.append(curve_points[-1].copy())
-        else:
-            segment_t = 0
-            if segment_lengths[segment] > 0:
-                segment_t = (t * total_length - current_length) / segment_lengths[segment]
-            p1 = curve_points[segment]
-            p2 = curve_points[segment + 1]
-            resampled_points.append(p1.lerp(p2, segment_t))
-    
-    return resampled_points
+    return [Vector(row) for row in resampled.tolist()]
 
 
 def resample_radii(radii, segments):
@@ -456,39 +507,28 @@ def resample_radii(radii, segments):
     if len(radii) < 2:
         return radii.copy()
     
-    resampled_radii = []
-    
-    for i in range(segments + 1):
-        t = i / segments
-        segment = int(t * (len(radii) - 1))
-        segment = max(0, min(segment, len(radii) - 2))
-        segment_t = (t * (len(radii) - 1)) - segment
-        r1 = radii[segment]
-        r2 = radii[segment + 1]
-        resampled_radii.append(r1 + segment_t * (r2 - r1))
-    
-    return resampled_radii
+    # Uniformly spaced source samples: plain linear interpolation
+    xs = np.linspace(0.0, 1.0, segments + 1)
+    src = np.linspace(0.0, 1.0, len(radii))
+    return np.interp(xs, src, np.asarray(radii, dtype=np.float64)).tolist()
+
+
+_AXES = (Vector((1, 0, 0)), Vector((0, 1, 0)), Vector((0, 0, 1)))
 
 
 def create_coordinate_system(direction):
     """Create a consistent coordinate system from a direction vector."""
     direction = direction.normalized()
     
-    x_alignment = abs(direction.dot(Vector((1, 0, 0))))
-    y_alignment = abs(direction.dot(Vector((0, 1, 0))))
-    z_alignment = abs(direction.dot(Vector((0, 0, 1))))
+    # Cross with the world axis least aligned with the direction (first one on ties)
+    alignment = (abs(direction.x), abs(direction.y), abs(direction.z))
+    axis = min(range(3), key=alignment.__getitem__)
+    side = _AXES[axis].cross(direction)
     
-    if x_alignment <= y_alignment and x_alignment <= z_alignment:
-        side = Vector((1, 0, 0)).cross(direction)
-    elif y_alignment <= x_alignment and y_alignment <= z_alignment:
-        side = Vector((0, 1, 0)).cross(direction)
-    else:
-        side = Vector((0, 0, 1)).cross(direction)
-    
-    if side.length < 0.001:
-        side = Vector((0, 1, 0)).cross(direction)
-        if side.length < 0.001:
-            side = Vector((0, 0, 1)).cross(direction)
+    if side.length_squared < 1e-6:
+        side = _AXES[1].cross(direction)
+        if side.length_squared < 1e-6:
+            side = _AXES[2].cross(direction)
     
     side = side.normalized()
     up = direction.cross(side)
@@ -522,29 +562,42 @@ def create_consistent_coordinate_systems(curve_points):
     direction, side, up = create_coordinate_system(direction_normalized)
     coordinate_systems = [(direction, side, up)]
     
-    for i in range(1, len(curve_points) - 1):
-        prev_point = curve_points[i - 1]
-        current_point = curve_points[i]
-        next_point = curve_points[i + 1]
-        
-        incoming = (current_point - prev_point).normalized()
-        outgoing = (next_point - current_point).normalized()
-        
-        if incoming.dot(outgoing) < -0.99:
-            direction = coordinate_systems[-1][0]
-        else:
-            direction = (incoming + outgoing).normalized()
-        
-        prev_direction, prev_side, prev_up = coordinate_systems[-1]
-        projected_side = prev_side - prev_side.dot(direction) * direction
-        
-        if projected_side.length < 0.001:
-            direction, side, up = create_coordinate_system(direction)
-        else:
-            side = projected_side.normalized()
-            up = direction.cross(side)
+    if len(curve_points) > 2:
+        # Interior bisector directions for all points at once; zero-length segments stay zero
+        P = points_to_array(curve_points)
+        seg = np.diff(P, axis=0)
+        lengths = np.sqrt(np.einsum('ij,ij->i', seg, seg))[:, None]
+        seg = np.divide(seg, lengths, out=np.zeros_like(seg), where=lengths > 0.0)
+        incoming = seg[:-1]
+        outgoing = seg[1:]
+        reversals = (np.einsum('ij,ij->i', incoming, outgoing) < -0.99).tolist()
+        bisector = incoming + outgoing
+        lengths = np.sqrt(np.einsum('ij,ij->i', bisector, bisector))[:, None]
+        bisectors = np.divide(bisector, lengths, out=np.zeros_like(bisector), where=lengths > 0.0).tolist()
         
-        coordinate_systems.append((direction, side, up))
+        # Parallel transport of the side vector is sequential; run it on plain floats
+        dx, dy, dz = direction
+        sx, sy, sz = side
+        for reversed_turn, bisector_dir in zip(reversals, bisectors):
+            if not reversed_turn:
+                dx, dy, dz = bisector_dir
+            k = sx * dx + sy * dy + sz * dz
+            px = sx - k * dx
+            py = sy - k * dy
+            pz = sz - k * dz
+            length = math.hypot(px, py, pz)
+            if length < 0.001:
+                direction, side, up = create_coordinate_system(Vector((dx, dy, dz)))
+                dx, dy, dz = direction
+                sx, sy, sz = side
+            else:
+                sx = px / length
+                sy = py / length
+                sz = pz / length
+                direction = Vector((dx, dy, dz))
+                side = Vector((sx, sy, sz))
+                up = direction.cross(side)
+            coordinate_systems.append((direction, side, up))
     
     if len(curve_points) > 1:
         dir_vec = curve_points[-1] - curve_points[-2]
@@ -586,25 +639,70 @@ def create_consistent_coordinate_systems(curve_points):
     return coordinate_systems
 
 
-def find_closest_point(context, mouse_pos, points_3d, threshold=20):
-    """Find the closest point to the mouse position using a fixed threshold."""
-    closest_index = -1
-    closest_distance = threshold
-
-    for i, point_3d in enumerate(points_3d):
-        point_2d = conversion.get_2d_from_3d(context, point_3d)
+def _screen_data(context, points_3d, radii_3d=None):
+    """Projected points (N,2) and screen radii (N,) for hover tests, or None.
 
-        if point_2d is not None:
-            distance = math.sqrt(
-                (mouse_pos[0] - point_2d[0]) ** 2
-                + (mouse_pos[1] - point_2d[1]) ** 2
+    Points behind the view have NaN coordinates. Without radii_3d only the points
+    are meaningful. For the live control points the result is cached on state
+    until the view, the object transform, the points (state.get_curve_xyz) or
+    the radii change.
+    """
+    n = len(points_3d) if radii_3d is None else min(len(points_3d), len(radii_3d))
+    if n == 0:
+        return None
+    radii = None if radii_3d is None else tuple(radii_3d[:n])
+
+    key = None
+    xyz = None
+    if points_3d is state.points_3d:
+        xyz = state.get_curve_xyz()
+        try:
+            region = getattr(context, "region", None) or bpy.context.region
+            rv3d = getattr(context, "region_data", None) or bpy.context.region_data
+            mw = state.object_matrix_world
+            key = (
+                tuple(v for row in rv3d.perspective_matrix for v in row),
+                None if mw is None else tuple(v for row in mw for v in row),
+                region.width,
+                region.height,
+                n,
             )
+        except (AttributeError, ReferenceError):
+            key = None
+        cached = state.screen_cache
+        if (key is not None and cached is not None and cached[0] == key and cached[1] is xyz
+                and (radii is None or cached[2] == radii)):
+            return cached[3]
+
+    if xyz is None:
+        xyz = points_to_array(points_3d)
+    if radii is None:
+        # Points-only query: borrow the live radii when they line up so the entry stays reusable
+        live = state.point_radii_3d
+        radii = tuple(live[:n]) if key is not None and len(live) >= n else (0.0,) * n
+    data = conversion.get_consistent_screen_radius_batch(context, xyz[:n], radii)
+    if key is not None:
+        state.screen_cache = (key, xyz, radii, data)
+    return data
+
+
+def _hover_squared_distances(points_2d, mouse_pos):
+    """Squared pixel distances from the mouse; inf for points behind the view."""
+    dx = points_2d[:, 0].astype(np.float64) - mouse_pos[0]
+    dy = points_2d[:, 1].astype(np.float64) - mouse_pos[1]
+    d2 = dx * dx + dy * dy
+    d2[np.isnan(d2)] = np.inf
+    return d2
 
-            if distance < closest_distance:
-                closest_distance = distance
-                closest_index = i
 
-    return closest_index
+def find_closest_point(context, mouse_pos, points_3d, threshold=20):
+    """Find the closest point to the mouse position using a fixed threshold."""
+    data = _screen_data(context, points_3d)
+    if data is None:
+        return -1
+    d2 = _hover_squared_distances(data[0], mouse_pos)
+    i = int(np.argmin(d2))
+    return i if d2[i] < threshold * threshold else -1
 
 
 def find_closest_point_with_screen_radius(
@@ -617,89 +715,52 @@ def find_closest_point_with_screen_radius(
     max_threshold=40.0,
 ):
     """Find closest point using a threshold derived from screen-space radius."""
-    closest_index = -1
-    closest_distance = float("inf")
-
-    for i, point_3d in enumerate(points_3d):
-        if i >= len(radii_3d):
-            break
-
-        radius_3d = radii_3d[i]
-        point_2d = conversion.get_2d_from_3d(context, point_3d)
-
-        if point_2d is None:
-            continue
-
-        screen_radius = conversion.get_consistent_screen_radius(
-            context, radius_3d, point_3d
-        )
-        if screen_radius <= 0.0:
-            continue
-
-        threshold = max(
-            min_threshold,
-            min(max_threshold, screen_radius * radius_factor),
-        )
-
-        distance = math.sqrt(
-            (mouse_pos[0] - point_2d[0]) ** 2 + (mouse_pos[1] - point_2d[1]) ** 2
-        )
-
-        if distance <= threshold and distance < closest_distance:
-            closest_distance = distance
-            closest_index = i
-
-    return closest_index
+    data = _screen_data(context, points_3d, radii_3d)
+    if data is None:
+        return -1
+    points_2d, screen_radii = data
+    d2 = _hover_squared_distances(points_2d, mouse_pos)
+    threshold = np.maximum(min_threshold, np.minimum(max_threshold, screen_radii * radius_factor))
+    d2[(screen_radii <= 0.0) | (d2 > threshold * threshold)] = np.inf
+    i = int(np.argmin(d2))
+    return i if d2[i] != np.inf else -1
 
 
 def find_radius_circle_hover(context, mouse_pos, points_3d, radii_3d, threshold=15):
     """Find if the mouse is hovering near any radius circle."""
-    closest_index = -1
-    closest_distance = threshold
-    
-    for i, (point_3d, radius_3d) in enumerate(zip(points_3d, radii_3d)):
-        point_2d = conversion.get_2d_from_3d(context, point_3d)
-        
-        if point_2d is not None:
-            screen_radius = conversion.get_consistent_screen_radius(context, radius_3d, point_3d)
-            center_distance = math.sqrt((mouse_pos[0] - point_2d[0])**2 + (mouse_pos[1] - point_2d[1])**2)
-            circle_distance = abs(center_distance - screen_radius)
-            
-            if circle_distance < closest_distance:
-                closest_distance = circle_distance
-                closest_index = i
-    
-    return closest_index
+    data = _screen_data(context, points_3d, radii_3d)
+    if data is None:
+        return -1
+    points_2d, screen_radii = data
+    circle_distance = np.abs(np.sqrt(_hover_squared_distances(points_2d, mouse_pos)) - screen_radii)
+    i = int(np.argmin(circle_distance))
+    return i if circle_distance[i] < threshold else -1
 
 
 def find_tension_control_hover(context, mouse_pos, points_3d, radii_3d, tensions, threshold=20):
     """Find if the mouse is hovering near any tension control dot."""
-    closest_index = -1
-    closest_distance = threshold
-    
     while len(tensions) < len(points_3d):
         tensions.append(0.5)
     
-    for i, (point_3d, radius_3d, tension) in enumerate(zip(points_3d, radii_3d, tensions)):
-        point_2d = conversion.get_2d_from_3d(context, point_3d)
-        
-        if point_2d is not None:
-            screen_radius = conversion.get_consistent_screen_radius(context, radius_3d, point_3d)
-            margin = math.radians(18.0)
-            angle_span = max(1e-4, 2.0 * math.pi - 2.0 * margin)
-            angle = margin + tension * angle_span
-            
-            fixed_offset = 20.0
-            dot_x = point_2d[0] + math.cos(angle) * (screen_radius + fixed_offset)
-            dot_y = point_2d[1] + math.sin(angle) * (screen_radius + fixed_offset)
-            
-            distance = math.sqrt((mouse_pos[0] - dot_x)**2 + (mouse_pos[1] - dot_y)**2)
-            
-            if distance < closest_distance:
-                closest_distance = distance
-                closest_index = i
+    data = _screen_data(context, points_3d, radii_3d)
+    if data is None:
+        return -1
+    points_2d, screen_radii = data
+    n = len(screen_radii)
+    
+    margin = math.radians(18.0)
+    angle_span = max(1e-4, 2.0 * math.pi - 2.0 * margin)
+    angle = margin + np.asarray(tensions[:n], dtype=np.float64) * angle_span
     
-    return closest_index
+    fixed_offset = 20.0
+    reach = screen_radii + fixed_offset
+    dots = np.empty((n, 2))
+    dots[:, 0] = points_2d[:, 0] + np.cos(angle) * reach
+    dots[:, 1] = points_2d[:, 1] + np.sin(angle) * reach
+    
+    d2 = _hover_squared_distances(dots, mouse_pos)
+    i = int(np.argmin(d2))
+    return i if d2[i] < threshold * threshold else -1
 
 
 def find_closest_point_on_curve(context, mouse_pos, curve_points_3d, threshold=15):
@@ -716,47 +777,36 @@ def find_closest_point_on_curve(context, mouse_pos, curve_points_3d, threshold=1
     else:
         dense_curve = interpolate_curve_3d(curve_points_3d, num_points=dense_count, sharp_points=sharp_points, tensions=tensions)
     
-    dense_curve_2d = []
-    dense_curve_valid = []
-    for p in dense_curve:
-        p2d = conversion.get_2d_from_3d(context, p)
-        if p2d is not None:
-            dense_curve_2d.append(p2d)
-            dense_curve_valid.append(p)
+    projected = conversion.get_2d_from_3d_batch(context, dense_curve)
+    if projected is None:
+        return False, None, -1
+    visible = np.flatnonzero(~np.isnan(projected[:, 0]))
+    if visible.size == 0:
+        return False, None, -1
     
-    if len(dense_curve_2d) < 2:
-        smooth_curve = dense_curve_valid
+    # Thin the visible samples to ~0.75 px spacing along their screen-space arc length
+    dense_2d = projected[visible].astype(np.float64)
+    if visible.size < 2:
+        smooth = visible
+        smooth_2d = dense_2d
     else:
-        smooth_curve = [dense_curve_valid[0]]
-        accum = 0.0
-        last = dense_curve_2d[0]
-        for i in range(1, len(dense_curve_2d)):
-            seg = math.sqrt((dense_curve_2d[i][0]-last[0])**2 + (dense_curve_2d[i][1]-last[1])**2)
-            accum += seg
-            if accum >= 0.75:
-                smooth_curve.append(dense_curve_valid[i])
-                accum = 0.0
-                last = dense_curve_2d[i]
-        if smooth_curve[-1] is not dense_curve_valid[-1]:
-            smooth_curve.append(dense_curve_valid[-1])
-    
-    min_dist = float('inf')
-    closest_point_3d = None
-    closest_smooth_index = -1
-    for i, point_3d in enumerate(smooth_curve):
-        point_2d = conversion.get_2d_from_3d(context, point_3d)
-        if point_2d is None:
-            continue
-        dist = math.sqrt((mouse_pos[0] - point_2d[0]) ** 2 + (mouse_pos[1] - point_2d[1]) ** 2)
-        if dist < min_dist:
-            min_dist = dist
-            closest_point_3d = point_3d
-            closest_smooth_index = i
-    
-    if min_dist > threshold or closest_point_3d is None:
+        step = np.diff(dense_2d, axis=0)
+        cum = np.concatenate(([0.0], np.cumsum(np.hypot(step[:, 0], step[:, 1]))))
+        picks = np.unique(np.searchsorted(cum, np.arange(0.0, cum[-1], 0.75)))
+        if picks.size == 0 or picks[-1] != visible.size - 1:
+            picks = np.append(picks, visible.size - 1)
+        smooth = visible[picks]
+        smooth_2d = dense_2d[picks]
+    
+    dx = smooth_2d[:, 0] - mouse_pos[0]
+    dy = smooth_2d[:, 1] - mouse_pos[1]
+    d2 = dx * dx + dy * dy
+    closest_smooth_index = int(np.argmin(d2))
+    if d2[closest_smooth_index] > threshold * threshold:
         return False, None, -1
     
-    t = closest_smooth_index / (len(smooth_curve) - 1)
+    closest_point_3d = dense_curve[int(smooth[closest_smooth_index])]
+    t = closest_smooth_index / (len(smooth) - 1) if len(smooth) > 1 else 0.0
     segment_index = min(int(t * (len(curve_points_3d) - 1)), len(curve_points_3d) - 2)
     
     return True, closest_point_3d, segment_index
@@ -779,27 +829,16 @@ def calculate_tension_from_mouse(context, point_3d, mouse_pos):
 
 def normalize_angle(angle):
     """Normalize an angle to the range [-π, π]."""
-    while angle > math.pi:
-        angle -= 2 * math.pi
-    while angle < -math.pi:
-        angle += 2 * math.pi
-    return angle
+    # IEEE remainder: constant time for any magnitude, no wrap loop
+    return math.remainder(angle, math.tau)
 
 
 def angle_lerp(a1, a2, t):
     """Interpolate between two angles, taking the shortest path."""
     a1 = normalize_angle(a1)
-    a2 = normalize_angle(a2)
-    
-    diff = a2 - a1
-    
-    if diff > math.pi:
-        diff -= 2 * math.pi
-    elif diff < -math.pi:
-        diff += 2 * math.pi
-    
-    result = a1 + diff * t
-    return normalize_angle(result)
+    # Shortest signed difference, already wrapped to [-π, π]
+    diff = math.remainder(a2 - a1, math.tau)
+    return normalize_angle(a1 + diff * t)
 
 
 def smooth_falloff(distance, falloff_radius):
@@ -827,41 +866,6 @@ def calculate_smooth_twists(curve_points_3d, twists, smooth_curve_points_3d):
         dense_curve = bspline_cubic_open_uniform(curve_points_3d, dense_count)
         if len(dense_curve) < 2:
             dense_curve = curve_points_3d[:]
-
-        cumlen = [0.0]
-        for i in range(len(dense_curve) - 1):
-            cumlen.append(cumlen[-1] + (dense_curve[i+1] - dense_curve[i]).length)
-        total_len = cumlen[-1]
-        if total_len < 1e-6:
-            return [twists[0]] * len(smooth_curve_points_3d)
-
-        def seq_nearest_indices(query_points, start_idx=0):
-            result_params = []
-            last_idx = start_idx
-            n_samples = len(dense_curve)
-            for qp in query_points:
-                best_i = last_idx
-                best_d = float('inf')
-                end_i = min(n_samples - 1, last_idx + 256)
-                for s in range(last_idx, end_i + 1):
-                    d = (qp - dense_curve[s]).length
-                    if d < best_d:
-                        best_d = d
-                        best_i = s
-                    else:
-                        if s > last_idx + 8:
-                            break
-                last_idx = best_i
-                result_params.append(cumlen[best_i] / total_len)
-            return result_params
-
-        control_params = [0.0]
-        if len(curve_points_3d) > 2:
-            interior = curve_points_3d[1:-1]
-            control_params += seq_nearest_indices(interior, start_idx=0)
-        control_params.append(1.0)
-        params = control_params
-        smooth_params = seq_nearest_indices(smooth_curve_points_3d, start_idx=0)
     else:
         dense_count = max(512, len(curve_points_3d) * 64)
         sharp_pts = getattr(state, 'no_tangent_points', set())
@@ -876,40 +880,25 @@ def calculate_smooth_twists(curve_points_3d, twists, smooth_curve_points_3d):
         if len(dense_curve) < 2:
             dense_curve = curve_points_3d[:]
 
-        cumlen = [0.0]
-        for i in range(len(dense_curve) - 1):
-            cumlen.append(cumlen[-1] + (dense_curve[i+1] - dense_curve[i]).length)
-        total_len = cumlen[-1]
-        if total_len < 1e-6:
-            return [twists[0]] * len(smooth_curve_points_3d)
+    dense_xyz = points_to_array(dense_curve)
+    cumlen = get_polyline_cumulative_lengths(dense_xyz)
+    total_len = float(cumlen[-1])
+    if total_len < 1e-6:
+        return [twists[0]] * len(smooth_curve_points_3d)
 
-        def seq_nearest_indices(query_points, start_idx=0):
-            result_params = []
-            last_idx = start_idx
-            n_samples = len(dense_curve)
-            for qp in query_points:
-                best_i = last_idx
-                best_d = float('inf')
-                end_i = min(n_samples - 1, last_idx + 256)
-                for s in range(last_idx, end_i + 1):
-                    d = (qp - dense_curve[s]).length
-                    if d < best_d:
-                        best_d = d
-                        best_i = s
-                    else:
-                        if s > last_idx + 8:
-                            break
-                last_idx = best_i
-                result_params.append(cumlen[best_i] / total_len)
-            return result_params
+    tree = _dense_kdtree(dense_xyz)
 
-        control_params = [0.0]
-        if len(curve_points_3d) > 2:
-            interior = curve_points_3d[1:-1]
-            control_params += seq_nearest_indices(interior, start_idx=0)
-        control_params.append(1.0)
-        params = control_params
-        smooth_params = seq_nearest_indices(smooth_curve_points_3d, start_idx=0)
+    def seq_nearest_indices(query_points, start_idx=0):
+        idx = _snap_monotone(dense_xyz, points_to_array(query_points), start_idx, tree=tree)
+        return (cumlen[idx] / total_len).tolist()
+
+    control_params = [0.0]
+    if len(curve_points_3d) > 2:
+        interior = curve_points_3d[1:-1]
+        control_params += seq_nearest_indices(interior, start_idx=0)
+    control_params.append(1.0)
+    params = control_params
+    smooth_params = seq_nearest_indices(smooth_curve_points_3d, start_idx=0)
     
     unwrapped = [twists[0]]
     for i in range(1, len(twists)):
@@ -979,57 +968,29 @@ def calculate_smooth_roundness(curve_points_3d, roundness_values, smooth_curve_p
     if len(curve_points_3d) == 1:
         return [roundness_values[0]] * len(smooth_curve_points_3d)
     
-    smooth_roundness = []
-    
-    for smooth_point in smooth_curve_points_3d:
-        min_dist_sq = float('inf')
-        best_segment_idx = 0
-        
-        for i in range(len(curve_points_3d) - 1):
-            p1 = curve_points_3d[i]
-            p2 = curve_points_3d[i + 1]
-            segment_vec = p2 - p1
-            segment_length_sq = segment_vec.length_squared
-            
-            if segment_length_sq < 1e-10:
-                closest_point_on_segment = p1
-            else:
-                point_vec = smooth_point - p1
-                t = point_vec.dot(segment_vec) / segment_length_sq
-                t = max(0.0, min(1.0, t))
-                closest_point_on_segment = p1 + t * segment_vec
-            
-            dist_sq = (smooth_point - closest_point_on_segment).length_squared
-            
-            if dist_sq < min_dist_sq:
-                min_dist_sq = dist_sq
-                best_segment_idx = i
-        
-        p1 = curve_points_3d[best_segment_idx]
-        p2 = curve_points_3d[best_segment_idx + 1]
-        roundness1 = roundness_values[best_segment_idx]
-        roundness2 = roundness_values[best_segment_idx + 1]
-        
-        segment_vec = p2 - p1
-        segment_length_sq = segment_vec.length_squared
-        
-        if segment_length_sq < 1e-10:
-            t = 0.0
-        else:
-            point_vec = smooth_point - p1
-            t = point_vec.dot(segment_vec) / segment_length_sq
-            t = max(0.0, min(1.0, t))
-        
-        if abs(roundness1 - 1.0) < 1e-6 and abs(roundness2 - 1.0) < 1e-6:
-            interpolated_roundness = 1.0
-        else:
-            interpolated_roundness = roundness1 + (roundness2 - roundness1) * t
-            if interpolated_roundness >= 0.999:
-                interpolated_roundness = 1.0
-        
-        smooth_roundness.append(interpolated_roundness)
-    
-    return smooth_roundness
+    # Point-to-segment projection of every smooth point onto every control segment at once (M, N-1)
+    P = points_to_array(curve_points_3d)
+    Q = points_to_array(smooth_curve_points_3d)
+    seg = np.diff(P, axis=0)
+    seg_len_sq = np.einsum('ij,ij->i', seg, seg)
+    degenerate = seg_len_sq < 1e-10
+    offset = Q[:, None, :] - P[None, :-1, :]
+    t = np.einsum('mnk,nk->mn', offset, seg)
+    t /= np.where(degenerate, 1.0, seg_len_sq)
+    t[:, degenerate] = 0.0
+    np.clip(t, 0.0, 1.0, out=t)
+    offset -= t[..., None] * seg
+    best = np.argmin(np.einsum('mnk,mnk->mn', offset, offset), axis=1)
+    t_best = t[np.arange(len(Q)), best]
+    
+    values = np.asarray(roundness_values, dtype=np.float64)
+    roundness1 = values[best]
+    roundness2 = values[best + 1]
+    smooth_roundness = roundness1 + (roundness2 - roundness1) * t_best
+    smooth_roundness[smooth_roundness >= 0.999] = 1.0
+    smooth_roundness[(np.abs(roundness1 - 1.0) < 1e-6) & (np.abs(roundness2 - 1.0) < 1e-6)] = 1.0
+    
+    return smooth_roundness.tolist()
 
 
 def register():
@@ -1037,4 +998,4 @@ def register():
 
 
 def unregister():
-    pass
+    _BSPLINE_CACHE.clear()
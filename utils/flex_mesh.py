@@ -66,10 +66,7 @@ def _apply_helix_to_curve_points(curve_points, original_control_points=None):
     if len(curve_points) < 2:
         return [point.copy() for point in curve_points]
 
-    cumulative_lengths = [0.0]
-    for idx in range(1, len(curve_points)):
-        seg_len = (curve_points[idx] - curve_points[idx - 1]).length
-        cumulative_lengths.append(cumulative_lengths[-1] + seg_len)
+    cumulative_lengths = math_utils.get_polyline_cumulative_lengths(curve_points).tolist()
 
     total_length = cumulative_lengths[-1]
     if total_length <= 1e-8:
@@ -84,10 +81,7 @@ def _apply_helix_to_curve_points(curve_points, original_control_points=None):
         if original_control_points and len(original_control_points) >= 2
         else curve_points
     )
-    control_lengths = [0.0]
-    for idx in range(1, len(control_points)):
-        seg_len = (control_points[idx] - control_points[idx - 1]).length
-        control_lengths.append(control_lengths[-1] + seg_len)
+    control_lengths = math_utils.get_polyline_cumulative_lengths(control_points).tolist()
     control_total = control_lengths[-1]
     if control_total > 1e-8:
         control_t_values = [length / control_total for length in control_lengths]
@@ -783,7 +777,7 @@ def apply_cap_island_uvs_by_proximity(
             centroid += mesh.vertices[vert_idx].co
         centroid /= float(len(poly.vertices))
 
-        is_start = (centroid - start_center).length <= (centroid - end_center).length
+        is_start = (centroid - start_center).length_squared <= (centroid - end_center).length_squared
         if is_start:
             center = start_center
             axis_u = start_axis_u
@@ -4,6 +4,7 @@ This module manages the global state of the Flex tool using a class-based approa
 for better encapsulation and to avoid polluting the global namespace.
 """
 import bpy
+import numpy as np
 from mathutils import Vector, Matrix
 import time
 
@@ -105,6 +106,11 @@ class FlexState:
         self.point_tensions = []
         self.no_tangent_points = set()
         self.reveal_control_index = -1
+        # (N,3) float64 copy of points_3d (see get_curve_xyz)
+        self.curve_xyz = None
+        self._curve_xyz_src = None
+        # Projected control points and screen radii for hover tests (see flex_math._screen_data)
+        self.screen_cache = None
         
         # Drawing state
         self.draw_handle = None
@@ -228,6 +234,9 @@ class FlexState:
         # Object transformation
         self.object_matrix_world = None
         self.edited_object_name = None
+        # Cached inverse of object_matrix_world (see get_object_matrix_world_inv)
+        self._object_matrix_world_inv = None
+        self._object_matrix_world_inv_src = None
         
         # Input tracking
         self.last_mouse_pos = None
@@ -303,6 +312,40 @@ class FlexState:
         # Undo/Redo manager
         self.undo_redo_manager = UndoRedoManager(self)
     
+    def get_object_matrix_world_inv(self):
+        """Inverse of object_matrix_world, recomputed only when the matrix changes.
+
+        The returned Matrix is shared; callers must not modify it in place.
+        """
+        mw = self.object_matrix_world
+        if mw is None:
+            return None
+        if self._object_matrix_world_inv is None or self._object_matrix_world_inv_src != mw:
+            self._object_matrix_world_inv_src = mw.copy()
+            self._object_matrix_world_inv = mw.inverted()
+        return self._object_matrix_world_inv
+    
+    def get_curve_xyz(self):
+        """points_3d as an (N,3) float64 array, built once and reused until the points change.
+
+        Replacing the points_3d list or changing its length rebuilds the array on its
+        own; code that edits points in place (item assignment, mutated Vectors) must
+        call invalidate_curve_xyz. The returned array is shared; callers must not
+        modify it in place.
+        """
+        points = self.points_3d
+        xyz = self.curve_xyz
+        if xyz is None or self._curve_xyz_src is not points or len(xyz) != len(points):
+            xyz = np.array(points, dtype=np.float64).reshape(-1, 3)
+            self.curve_xyz = xyz
+            self._curve_xyz_src = points
+        return xyz
+    
+    def invalidate_curve_xyz(self):
+        """Drop the cached curve_xyz after points_3d was edited in place."""
+        self.curve_xyz = None
+        self._curve_xyz_src = None
+    
     def cleanup(self):
         """Clean up resources when the tool is disabled."""
         self.is_running = False
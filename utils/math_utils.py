@@ -1,7 +1,7 @@
 import mathutils
 from mathutils import Vector
 from mathutils.kdtree import KDTree
-from math import radians
+from math import radians, sqrt
 from . import falloff_utils
 
 
@@ -324,13 +324,13 @@ def get_proportional_vertices(selected_faces, bm, proportional_size, falloff_typ
             
         # Calculate minimum distance to any selected vertex
         # This ensures smooth falloff from the selection boundary
-        min_distance = float('inf')
+        min_distance_sq = float('inf')
         for selected_vert in selected_verts:
-            dist = (vert.co - selected_vert.co).length
-            if dist < min_distance:
-                min_distance = dist
+            dist_sq = (vert.co - selected_vert.co).length_squared
+            if dist_sq < min_distance_sq:
+                min_distance_sq = dist_sq
         
-        distance = min_distance
+        distance = sqrt(min_distance_sq)
         
         # Skip vertices outside proportional radius
         if distance > proportional_size: